@@ -0,0 +1,200 @@
+import os
+import time
+import weakref
+
+import pygame
+
+
+class AssetRegistry:
+    """
+    Wspólny dla całego procesu rejestr grafik i czcionek.
+    Każdy obraz jest dekodowany z dysku i konwertowany tylko raz,
+    a jego przeskalowane / obrócone / odbite warianty są liczone leniwie
+    i trzymane w cache pod kluczem (ścieżka, rozmiar, transformacja).
+    Klatki animacji mają gotowe odbicia (flipped), a pociski komplety
+    obrotów o stałym kroku kąta (rotations).
+    """
+
+    def __init__(self):
+        self._images = {}
+        self._folders = {}
+        self._fonts = {}
+        self._flipped = weakref.WeakKeyDictionary()
+        self._rotations = {}
+        self.hits = 0
+        self.misses = 0
+        self.load_time = 0.0
+
+    def image(self, path, size=None, flip_x=False, angle=0, fallback_color=None):
+        """
+        Zwraca Surface dla pliku path:
+        - size: docelowy rozmiar (w, h) lub None dla oryginału,
+        - flip_x: odbicie w poziomie,
+        - angle: obrót w stopniach (po skalowaniu),
+        - fallback_color: jeśli podany, a pliku nie da się wczytać,
+          zwraca (i zapamiętuje) jednolity placeholder w tym kolorze.
+        """
+        key = (path, tuple(size) if size else None, flip_x, angle)
+        surf = self._images.get(key)
+        if surf is not None:
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        start = time.perf_counter()
+        try:
+            if size is None and not flip_x and not angle:
+                surf = pygame.image.load(path).convert_alpha()
+            elif angle:
+                base = self.image(path, size, flip_x, fallback_color=fallback_color)
+                surf = pygame.transform.rotate(base, angle)
+            elif flip_x:
+                base = self.image(path, size, fallback_color=fallback_color)
+                surf = pygame.transform.flip(base, True, False)
+            else:
+                base = self.image(path, fallback_color=fallback_color)
+                surf = base if base.get_size() == tuple(size) else pygame.transform.scale(base, size)
+        except (pygame.error, FileNotFoundError):
+            if fallback_color is None:
+                raise
+            surf = pygame.Surface(size or (1, 1))
+            surf.fill(fallback_color)
+        self.load_time += time.perf_counter() - start
+
+        self._images[key] = surf
+        return surf
+
+    def region(self, path, rect, size=None):
+        """
+        Zwraca wycinek rect=(x, y, w, h) z arkusza path,
+        opcjonalnie przeskalowany do size.
+        """
+        key = (path, ("region",) + tuple(rect), tuple(size) if size else None, False, 0)
+        surf = self._images.get(key)
+        if surf is not None:
+            self.hits += 1
+            return surf
+
+        sheet = self.image(path)
+        self.misses += 1
+        start = time.perf_counter()
+        x, y, w, h = rect
+        surf = pygame.Surface((w, h), pygame.SRCALPHA)
+        surf.blit(sheet, (0, 0), rect)
+        if size and tuple(size) != (w, h):
+            surf = pygame.transform.scale(surf, size)
+        self.load_time += time.perf_counter() - start
+
+        self._images[key] = surf
+        return surf
+
+    def flipped(self, surf):
+        """
+        Zwraca odbitą w poziomie wersję dowolnego Surface'a (np. klatki
+        animacji z arkusza). Odbicie liczone jest raz na klatkę, więc
+        zmiana kierunku postaci to tylko odczyt ze słownika.
+        """
+        mirrored = self._flipped.get(surf)
+        if mirrored is not None:
+            self.hits += 1
+            return mirrored
+
+        self.misses += 1
+        mirrored = pygame.transform.flip(surf, True, False)
+        self._flipped[surf] = mirrored
+        return mirrored
+
+    def rotations(self, path, size, steps, fallback_color=None):
+        """
+        Zwraca krotkę steps obróconych wersji obrazka path w rozmiarze size:
+        element i to obrót o i * 360 / steps stopni. Cały zestaw jest
+        liczony raz, a kąt pocisku zaokrąglamy do najbliższego kroku.
+        """
+        key = (path, tuple(size), steps)
+        frames = self._rotations.get(key)
+        if frames is not None:
+            self.hits += 1
+            return frames
+
+        self.misses += 1
+        base = self.image(path, size, fallback_color=fallback_color)
+        start = time.perf_counter()
+        frames = tuple(
+            pygame.transform.rotate(base, i * 360 / steps) if i else base
+            for i in range(steps)
+        )
+        self.load_time += time.perf_counter() - start
+        self._rotations[key] = frames
+        return frames
+
+    def images_in(self, folder, size=None):
+        """
+        Zwraca krotkę Surface'ów dla wszystkich plików PNG z folderu
+        (w kolejności alfabetycznej), przeskalowanych do size.
+        Pliki, których nie da się wczytać, są pomijane.
+        """
+        key = (folder, tuple(size) if size else None)
+        images = self._folders.get(key)
+        if images is not None:
+            self.hits += 1
+            return images
+
+        self.misses += 1
+        names = sorted(os.listdir(folder)) if os.path.exists(folder) else []
+        loaded = []
+        for fn in names:
+            if fn.lower().endswith(".png"):
+                try:
+                    loaded.append(self.image(os.path.join(folder, fn), size))
+                except (pygame.error, FileNotFoundError):
+                    pass
+        images = tuple(loaded)
+        self._folders[key] = images
+        return images
+
+    def font(self, path, size):
+        """
+        Zwraca obiekt Font dla pary (path, size), otwierając plik TTF
+        tylko przy pierwszym użyciu.
+        """
+        key = (path, size)
+        font = self._fonts.get(key)
+        if font is not None:
+            self.hits += 1
+            return font
+
+        self.misses += 1
+        start = time.perf_counter()
+        font = pygame.font.Font(path, size)
+        self.load_time += time.perf_counter() - start
+        self._fonts[key] = font
+        return font
+
+    def stats(self):
+        """
+        Zwraca statystyki cache: trafienia, chybienia, liczbę
+        przechowywanych Surface'ów i łączny czas ładowania w ms.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._images),
+            "flipped": len(self._flipped),
+            "rotation_sets": len(self._rotations),
+            "fonts": len(self._fonts),
+            "load_time_ms": round(self.load_time * 1000, 2),
+        }
+
+    def clear(self):
+        """
+        Czyści cache (np. po zmianie trybu wyświetlania).
+        """
+        self._images.clear()
+        self._folders.clear()
+        self._fonts.clear()
+        self._flipped.clear()
+        self._rotations.clear()
+
+
+# Jeden rejestr na cały proces
+assets = AssetRegistry()
@@ -1,7 +1,9 @@
+import numpy as np
 import pygame
 
+from classes.assets import assets
 from classes.floating_text import FloatingText
-from classes.projectile import Projectile
+from classes.zoom_cache import zoomed
 from settings import (
     BOSS_HEALTH,
     BOSS_SPEED,
@@ -22,29 +24,34 @@ class Boss(pygame.sprite.Sprite):
         super().__init__()
         self.game = game
         self.pos = pygame.math.Vector2(x, y)
+        self.prev_pos = pygame.math.Vector2(x, y)
         self.facing_left = True
 
         # Ładowanie animacji bossa
         self.animations = {}
         for state in ("idle", "flying", "attack", "death"):
-            sheet = pygame.image.load(f"assets/images/boss/{state.upper()}.png").convert_alpha()
+            path = f"assets/images/boss/{state.upper()}.png"
             frame_w, frame_h = 81, 71
-            count = sheet.get_width() // frame_w
+            count = assets.image(path).get_width() // frame_w
             frames = []
             for i in range(count):
                 rect = (i * frame_w, 0, frame_w, frame_h)
-                frame = sheet.subsurface(rect)
-                # Skalowanie modelu
-                frame = pygame.transform.scale(frame,(frame_w * BOSS_SIZE, frame_h * BOSS_SIZE))
+                # Wycięcie i skalowanie modelu
+                frame = assets.region(path, rect, (frame_w * BOSS_SIZE, frame_h * BOSS_SIZE))
                 frames.append(frame)
             self.animations[state] = frames
+        # Klatki bossa patrzą w lewo; odbite w prawo liczone raz na klatkę
+        self.animations_right = {
+            state: [assets.flipped(frame) for frame in frames]
+            for state, frames in self.animations.items()
+        }
 
         # Początkowe wartości dla bossa
         self.state = "idle"
         self.frame_index = 0
         self.anim_speed = 100
-        self.last_anim = pygame.time.get_ticks()
-        self.last_patch_time = pygame.time.get_ticks()
+        self.last_anim = self.game.now
+        self.last_patch_time = self.game.now
         self.image = self.animations["idle"][0]
         self.rect = self.image.get_rect(center=(x, y))
 
@@ -69,7 +76,8 @@ class Boss(pygame.sprite.Sprite):
         self.patch = None
 
     def update(self):
-        now = pygame.time.get_ticks()
+        now = self.game.now
+        self.prev_pos.update(self.pos)
 
         # Animacje śmierci bossa
         if self.health <= 0 and self.state != "death":
@@ -112,10 +120,8 @@ class Boss(pygame.sprite.Sprite):
         # Wystrzeliwanie pocisków dookoła bossa
         pat = self.attack_patterns['circle']
         if now - pat['last'] > pat['cd']:
-            for i in range(pat['b']):
-                angle = 360 / pat['b'] * i
-                dir_vec = pygame.math.Vector2(1, 0).rotate(angle)
-                self._shoot(dir_vec)
+            angles = np.radians(np.arange(pat['b']) * (360 / pat['b']))
+            self._shoot(np.column_stack((np.cos(angles), np.sin(angles))))
             pat['last'] = now
             self.state = "attack"
             self.frame_index = 0
@@ -150,14 +156,10 @@ class Boss(pygame.sprite.Sprite):
                 self.charge_phase = 0
                 self.last_distance = 0
 
-    def _shoot(self, dir_vec):
-        # Wystrzeliwanie pocisków
+    def _shoot(self, dirs):
+        # Wystrzeliwanie pocisków we wszystkich kierunkach dirs naraz
         dmg = self.damage * (1 + 0.5 * (self.phase - 1))
-        b = Projectile(self.pos.x, self.pos.y,
-                       dir_vec.x, dir_vec.y,
-                       dmg, False, self.game)
-        self.game.all_sprites.add(b)
-        self.game.enemy_projectiles.add(b)
+        self.game.projectiles.spawn_many(self.pos.x, self.pos.y, dirs, dmg, False)
 
     def take_damage(self, amount):
         # Wyświetlanie floating textu przy otrzymywaniu obrażeń
@@ -176,26 +178,27 @@ class Boss(pygame.sprite.Sprite):
                     self.frame_index = 0
                 else:
                     self.frame_index = len(frames) - 1
-            frame = frames[self.frame_index]
             if not self.facing_left:
-                frame = pygame.transform.flip(frame, True, False)
+                frames = self.animations_right[self.state]
+            frame = frames[self.frame_index]
             c = self.rect.center
             self.image = frame
             self.rect = self.image.get_rect(center=c)
 
-    def draw(self, surf, cam_off):
+    def draw(self, surf, cam_off, zoom=1.0):
+        # cam_off w pikselach ekranu (świat × zoom)
         # Rysowanie wskaźnika szarży bossa
         if self.charge_phase == 1:
-            px = self.pos.x - cam_off[0]
-            py = self.pos.y - cam_off[1]
-            start = (px + BOSS_SIZE / 2, py + BOSS_SIZE / 2)
-            end = (start[0] + self.charge_dir.x * 1000 / self.game.zoom,
-                   start[1] + self.charge_dir.y * 1000 / self.game.zoom)
+            px = self.pos.x * zoom - cam_off[0]
+            py = self.pos.y * zoom - cam_off[1]
+            start = (px + BOSS_SIZE * zoom / 2, py + BOSS_SIZE * zoom / 2)
+            end = (start[0] + self.charge_dir.x * 1000,
+                   start[1] + self.charge_dir.y * 1000)
             pygame.draw.line(surf, RED, start, end, 3)
 
-        px = self.rect.x - cam_off[0]
-        py = self.rect.y - cam_off[1]
-        surf.blit(self.image, (px, py))
+        px = round(self.rect.x * zoom) - cam_off[0]
+        py = round(self.rect.y * zoom) - cam_off[1]
+        surf.blit(zoomed.scale(self.image), (px, py))
 
 class SlowingPatch(pygame.sprite.Sprite):
     """
@@ -209,12 +212,12 @@ class SlowingPatch(pygame.sprite.Sprite):
         self.image = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
         pygame.draw.circle(self.image, (0, 0, 0, 150), (radius, radius), radius)
         self.rect = self.image.get_rect(center=(pos.x, pos.y))
-        self.last_damage = pygame.time.get_ticks()
+        self.last_damage = self.game.now
         self.slowed = set()
 
     def update(self):
         player = self.game.player
-        now = pygame.time.get_ticks()
+        now = self.game.now
         if self.rect.colliderect(player.rect):
             # Spowalnianie gracza, gdy stoi w plamie
             player.speed = PLAYER_SPEED * 0.5
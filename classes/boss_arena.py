@@ -1,6 +1,9 @@
+import math
+
 import pygame
 
 from classes.world import World
+from classes.zoom_cache import zoomed
 from settings import TILE_SIZE
 
 
@@ -31,6 +34,13 @@ class BossArena(World):
         self.right = cx + half_w
         self.top = cy - half_h
         self.bottom = cy + half_h
+        # Granice areny w pikselach (razem ze ścianami)
+        self.bounds = pygame.Rect(
+            self.left * TILE_SIZE,
+            self.top * TILE_SIZE,
+            (self.right - self.left + 1) * TILE_SIZE,
+            (self.bottom - self.top + 1) * TILE_SIZE
+        )
 
         # Lista kafelków wewnątrz granic areny
         self.arena_tiles = [
@@ -39,28 +49,37 @@ class BossArena(World):
             for y in range(self.top, self.bottom + 1)
         ]
 
-    def draw(self, surf, cam_off):
+    def draw(self, surf, cam_off, area=None, zoom=1.0):
         """
         Rysuje prostokątną arenę:
         - podłogę self.floor,
         - obramowanie self.wall wzdłuż krawędzi prostokąta.
+        area — opcjonalny prostokąt na surf, do którego ograniczamy
+        rysowanie; kafelki spoza niego są pomijane.
+        Przy zoomie innym niż 1.0 cam_off jest w pikselach ekranu,
+        a kafelki są przeskalowane raz na poziom zoomu.
         """
-        # Rysowanie podłogi
-        for tx, ty in self.arena_tiles:
-            px = tx * TILE_SIZE - cam_off[0]
-            py = ty * TILE_SIZE - cam_off[1]
-            surf.blit(self.floor, (px, py))
-
-        # Rysowanie górnej i dolnej krawędzi areny
-        for x in range(self.left, self.right + 1):
-            for y in (self.top, self.bottom):
-                px = x * TILE_SIZE - cam_off[0]
-                py = y * TILE_SIZE - cam_off[1]
-                surf.blit(self.wall, (px, py))
+        if area is None:
+            area = surf.get_rect()
+        step = TILE_SIZE * zoom
+        floor = zoomed.tile(self.floor, TILE_SIZE)
+        wall = zoomed.tile(self.wall, TILE_SIZE)
+        ox, oy = cam_off[0] + area.left, cam_off[1] + area.top
+        # Piksel p należy do ostatniego kafelka t z floor(t * step) <= p
+        x0 = max(self.left, math.ceil((ox + 1) / step) - 1)
+        x1 = min(self.right, math.ceil((ox + area.width) / step) - 1)
+        y0 = max(self.top, math.ceil((oy + 1) / step) - 1)
+        y1 = min(self.bottom, math.ceil((oy + area.height) / step) - 1)
 
-        # Rysowanie lewej i prawej krawędzi areny
-        for y in range(self.top + 1, self.bottom):
-            for x in (self.left, self.right):
-                px = x * TILE_SIZE - cam_off[0]
-                py = y * TILE_SIZE - cam_off[1]
-                surf.blit(self.wall, (px, py))
+        clip = surf.get_clip()
+        surf.set_clip(area)
+        for y in range(y0, y1 + 1):
+            py = math.floor(y * step) - cam_off[1]
+            edge_row = y == self.top or y == self.bottom
+            for x in range(x0, x1 + 1):
+                px = math.floor(x * step) - cam_off[0]
+                # Podłoga pod każdym kafelkiem, a na krawędziach ściana
+                surf.blit(floor, (px, py))
+                if edge_row or x == self.left or x == self.right:
+                    surf.blit(wall, (px, py))
+        surf.set_clip(clip)
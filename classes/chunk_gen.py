@@ -0,0 +1,229 @@
+import random
+
+import numpy as np
+
+CHUNK_SIZE = 16
+
+MAX_TREE_CLUSTERS = 3
+CLUSTER_MIN_RADIUS = 2
+CLUSTER_MAX_RADIUS = 4
+CLUSTER_MIN_TREES = 5
+CLUSTER_MAX_TREES = 10
+
+POND_CHANCE = 0.15
+POND_MIN_RADIUS = 2
+POND_MAX_RADIUS = 4
+
+BUSH_CHANCE = 0.05
+
+# Typy kafelków w siatce chunka
+TILE_GRASS = 0
+TILE_WATER = 1
+TILE_BUSH = 2
+TILE_OAK = 3
+TILE_PINE = 4
+
+
+def _features(seed, cx, cy):
+    """
+    Losuje cechy chunka (cx, cy) w globalnych współrzędnych kafelków:
+    - drzewa w kilku kępkach (mogą wystawać poza chunk),
+    - nieregularny staw (może wystawać poza chunk).
+    """
+    rnd = random.Random((cx * 341873128712 + cy * 132897987541 + seed) & 0xFFFFFFFF)
+
+    trees = []
+    clusters = rnd.randint(1, MAX_TREE_CLUSTERS)
+    for _ in range(clusters):
+        base_x = cx * CHUNK_SIZE + rnd.randrange(CHUNK_SIZE)
+        base_y = cy * CHUNK_SIZE + rnd.randrange(CHUNK_SIZE)
+        count = rnd.randint(CLUSTER_MIN_TREES, CLUSTER_MAX_TREES)
+        radius = rnd.randint(CLUSTER_MIN_RADIUS, CLUSTER_MAX_RADIUS)
+        for __ in range(count):
+            dx = rnd.randint(-radius, radius)
+            dy = rnd.randint(-radius, radius)
+            trees.append((base_x + dx, base_y + dy))
+
+    ponds = set()
+    if rnd.random() < POND_CHANCE:
+        cx0 = cx * CHUNK_SIZE
+        cy0 = cy * CHUNK_SIZE
+        center_x = cx0 + rnd.randrange(CHUNK_SIZE)
+        center_y = cy0 + rnd.randrange(CHUNK_SIZE)
+        radius = rnd.randint(POND_MIN_RADIUS, POND_MAX_RADIUS)
+        for dx in range(-radius, radius + 1):
+            for dy in range(-radius, radius + 1):
+                dist2 = dx * dx + dy * dy
+                if dist2 <= radius * radius:
+                    noise = rnd.uniform(0.6, 1.3)
+                    if dist2 <= (radius * noise) ** 2:
+                        ponds.add((center_x + dx, center_y + dy))
+
+    return trees, ponds
+
+
+def generate_chunk(seed, cx, cy):
+    """
+    Generuje siatkę CHUNK_SIZE×CHUNK_SIZE typów kafelków chunka (cx, cy)
+    jako bytearray (indeks: ly * CHUNK_SIZE + lx). Kolejność nakładania:
+    trawa, stawy, krzaki, drzewa. Stawy i drzewa sąsiednich chunków mogą
+    wystawać na ten chunk, więc uwzględniamy też 8 sąsiadów.
+    Wynik zależy tylko od ziarna i współrzędnych, więc funkcję
+    można bezpiecznie wywoływać z wątków roboczych.
+    """
+    grid = bytearray(CHUNK_SIZE * CHUNK_SIZE)
+    x0, y0 = cx * CHUNK_SIZE, cy * CHUNK_SIZE
+
+    neighbours = [
+        _features(seed, nx, ny)
+        for ny in range(cy - 1, cy + 2)
+        for nx in range(cx - 1, cx + 2)
+    ]
+    own_ponds = neighbours[4][1]
+
+    for _, ponds in neighbours:
+        for tx, ty in ponds:
+            lx, ly = tx - x0, ty - y0
+            if 0 <= lx < CHUNK_SIZE and 0 <= ly < CHUNK_SIZE:
+                grid[ly * CHUNK_SIZE + lx] = TILE_WATER
+
+    rnd_b = random.Random((cx * 1610612741 + cy * 805306457 + seed + 7) & 0xFFFFFFFF)
+    for lx in range(CHUNK_SIZE):
+        for ly in range(CHUNK_SIZE):
+            if rnd_b.random() < BUSH_CHANCE and (x0 + lx, y0 + ly) not in own_ponds:
+                grid[ly * CHUNK_SIZE + lx] = TILE_BUSH
+
+    for trees, ponds in neighbours:
+        for tx, ty in trees:
+            lx, ly = tx - x0, ty - y0
+            if 0 <= lx < CHUNK_SIZE and 0 <= ly < CHUNK_SIZE and (tx, ty) not in ponds:
+                grid[ly * CHUNK_SIZE + lx] = TILE_PINE if ((tx + ty + seed) & 1) == 0 else TILE_OAK
+
+    return grid
+
+
+# –––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––
+# Generator wektorowy (NumPy)
+#
+# Zamiast strumienia random.Random każda losowa wartość to hash
+# (ziarno, cx, cy, strumień, indeks), więc całe chunki, a nawet
+# paczki chunków, losujemy naraz jako tablice.
+
+_PAD = max(CLUSTER_MAX_RADIUS, POND_MAX_RADIUS)
+_SPAN = 3 * CHUNK_SIZE + 2 * _PAD  # płótno 3×3 chunki z marginesem
+
+_S_CLUSTER, _S_TREE, _S_POND, _S_NOISE, _S_BUSH = (np.uint64(i) for i in range(1, 6))
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_K1 = np.uint64(0xBF58476D1CE4E5B9)
+_K2 = np.uint64(0x94D049BB133111EB)
+
+
+def _mix(h):
+    # Finalizer SplitMix64
+    h = (h ^ (h >> np.uint64(30))) * _K1
+    h = (h ^ (h >> np.uint64(27))) * _K2
+    return h ^ (h >> np.uint64(31))
+
+
+def _uniform(seed, cx, cy, stream, n):
+    """
+    Zwraca tablicę (M, n) liczb z [0, 1) dla M chunków (cx, cy).
+    """
+    key = _mix(np.uint64(seed) ^ _mix(cx * _GOLDEN ^ _mix(cy * _K1 ^ stream)))
+    idx = np.arange(n, dtype=np.uint64)
+    h = _mix(key[:, None] + (idx[None, :] + np.uint64(1)) * _GOLDEN)
+    return (h >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+
+def _randint(u, lo, hi):
+    # Liczba całkowita z przedziału [lo, hi] z liczby jednostajnej u
+    return lo + (u * (hi - lo + 1)).astype(np.int64)
+
+
+def generate_chunks(seed, coords):
+    """
+    Wektorowo generuje siatki wielu chunków naraz.
+    coords: lista (cx, cy). Zwraca tablicę uint8 (N, CHUNK_SIZE, CHUNK_SIZE)
+    z tymi samymi typami kafelków i kolejnością nakładania co generate_chunk
+    (stawy i drzewa sąsiadów wystają na chunk, drzewa nie rosną na stawie
+    swojego chunka, krzaki nie rosną na własnym stawie).
+    Wynik zależy tylko od ziarna i współrzędnych (ale świat jest inny
+    niż z generate_chunk, bo losowanie oparte jest na hashu).
+    """
+    coords = np.asarray(coords, dtype=np.int64).reshape(-1, 2)
+    n = len(coords)
+    seed = int(seed) & 0xFFFFFFFFFFFFFFFF
+
+    # Każdy chunk docelowy razem z 8 sąsiadami: M = 9 * N
+    offs = np.array([(ox, oy) for oy in (-1, 0, 1) for ox in (-1, 0, 1)], dtype=np.int64)
+    nb = (coords[:, None, :] + offs[None, :, :]).reshape(-1, 2)
+    owner = np.repeat(np.arange(n), 9)
+    # Pozycja lewego górnego rogu sąsiada na płótnie 3×3
+    base = np.tile((offs + 1) * CHUNK_SIZE + _PAD, (n, 1))
+    ncx = nb[:, 0].astype(np.uint64)
+    ncy = nb[:, 1].astype(np.uint64)
+
+    water = np.zeros((n, _SPAN, _SPAN), dtype=bool)
+    trees = np.zeros((n, _SPAN, _SPAN), dtype=np.uint8)
+
+    # Stawy: dysk z szumem na promieniu
+    u = _uniform(seed, ncx, ncy, _S_POND, 4)
+    has_pond = u[:, 0] < POND_CHANCE
+    pcx = _randint(u[:, 1], 0, CHUNK_SIZE - 1)
+    pcy = _randint(u[:, 2], 0, CHUNK_SIZE - 1)
+    pr = _randint(u[:, 3], POND_MIN_RADIUS, POND_MAX_RADIUS)
+    d = np.arange(-POND_MAX_RADIUS, POND_MAX_RADIUS + 1)
+    ddx, ddy = np.meshgrid(d, d, indexing="xy")
+    dist2 = (ddx * ddx + ddy * ddy)[None, :, :]
+    noise = 0.6 + 0.7 * _uniform(seed, ncx, ncy, _S_NOISE, d.size * d.size).reshape(-1, d.size, d.size)
+    r = pr[:, None, None]
+    pond = has_pond[:, None, None] & (dist2 <= r * r) & (dist2 <= (r * noise) ** 2)
+    m, iy, ix = np.nonzero(pond)
+    py = base[m, 1] + pcy[m] + d[iy]
+    px = base[m, 0] + pcx[m] + d[ix]
+    water[owner[m], py, px] = True
+
+    # Staw własny każdego sąsiada (na jego płótnie lokalnym) do wykluczania drzew
+    own_pond = np.zeros((len(nb), CHUNK_SIZE + 2 * _PAD, CHUNK_SIZE + 2 * _PAD), dtype=bool)
+    own_pond[m, pcy[m] + d[iy] + _PAD, pcx[m] + d[ix] + _PAD] = True
+
+    # Drzewa: do MAX_TREE_CLUSTERS kępek po maks. CLUSTER_MAX_TREES drzew
+    k, t = MAX_TREE_CLUSTERS, CLUSTER_MAX_TREES
+    u = _uniform(seed, ncx, ncy, _S_CLUSTER, 1 + 4 * k)
+    clusters = _randint(u[:, 0], 1, MAX_TREE_CLUSTERS)
+    cu = u[:, 1:].reshape(-1, k, 4)
+    bx = _randint(cu[:, :, 0], 0, CHUNK_SIZE - 1)
+    by = _randint(cu[:, :, 1], 0, CHUNK_SIZE - 1)
+    count = _randint(cu[:, :, 2], CLUSTER_MIN_TREES, CLUSTER_MAX_TREES)
+    radius = _randint(cu[:, :, 3], CLUSTER_MIN_RADIUS, CLUSTER_MAX_RADIUS)
+    tu = _uniform(seed, ncx, ncy, _S_TREE, k * t * 2).reshape(-1, k, t, 2)
+    span = (2 * radius + 1)[:, :, None]
+    tdx = (tu[..., 0] * span).astype(np.int64) - radius[:, :, None]
+    tdy = (tu[..., 1] * span).astype(np.int64) - radius[:, :, None]
+    valid = (np.arange(k)[None, :, None] < clusters[:, None, None]) \
+        & (np.arange(t)[None, None, :] < count[:, :, None])
+    lx = bx[:, :, None] + tdx
+    ly = by[:, :, None] + tdy
+    m, ci, ti = np.nonzero(valid)
+    lx, ly = lx[m, ci, ti], ly[m, ci, ti]
+    keep = ~own_pond[m, ly + _PAD, lx + _PAD]
+    m, lx, ly = m[keep], lx[keep], ly[keep]
+    gx = nb[m, 0] * CHUNK_SIZE + lx
+    gy = nb[m, 1] * CHUNK_SIZE + ly
+    kind = np.where(((gx + gy + seed) & 1) == 0, TILE_PINE, TILE_OAK).astype(np.uint8)
+    trees[owner[m], base[m, 1] + ly, base[m, 0] + lx] = kind
+
+    # Wycinamy środkowy chunk z płótna
+    c0 = CHUNK_SIZE + _PAD
+    water = water[:, c0:c0 + CHUNK_SIZE, c0:c0 + CHUNK_SIZE]
+    trees = trees[:, c0:c0 + CHUNK_SIZE, c0:c0 + CHUNK_SIZE]
+    centre = own_pond[4::9, _PAD:_PAD + CHUNK_SIZE, _PAD:_PAD + CHUNK_SIZE]
+
+    # Krzaki tylko w chunku docelowym, poza jego własnym stawem
+    bu = _uniform(seed, coords[:, 0].astype(np.uint64), coords[:, 1].astype(np.uint64),
+                  _S_BUSH, CHUNK_SIZE * CHUNK_SIZE)
+    bushes = (bu.reshape(-1, CHUNK_SIZE, CHUNK_SIZE) < BUSH_CHANCE) & ~centre
+
+    grid = np.where(water, TILE_WATER, TILE_GRASS).astype(np.uint8)
+    grid[bushes] = TILE_BUSH
+    return np.where(trees > 0, trees, grid)
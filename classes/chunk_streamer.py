@@ -0,0 +1,147 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from classes.telemetry import telemetry
+from settings import (
+    CHUNK_WORKERS,
+    CHUNK_PREFETCH_RING,
+    CHUNK_LOOKAHEAD,
+    CHUNK_BAKES_PER_FRAME
+)
+
+
+class ChunkStreamer:
+    """
+    Strumieniowanie chunków świata w tle:
+    - przewiduje kierunek ruchu z prędkości gracza,
+    - zleca generowanie pierścienia chunków przed kamerą puli wątków
+      (paczkami, generowanymi wektorowo),
+    - odbiera gotowe dane bez blokowania pętli gry,
+    - wypieka na zapas kilka chunków, w stronę których zmierza gracz
+      (tylko przy zoomie 1.0 — przy innym World.draw rysuje z kafelków
+      i wypieczonych powierzchni nie używa).
+    """
+
+    def __init__(self, world, workers=CHUNK_WORKERS):
+        self.world = world
+        self.workers = workers
+        self.executor = None
+        self.pending = {}
+        self.queued = []
+        self.center = None
+
+        self.generated = 0
+        self.prebaked = 0
+        self.evicted = 0
+
+    def request(self, key):
+        """
+        Dodaje chunk key=(cx, cy) do następnej paczki, jeśli nie ma go
+        w cache ani w kolejce. Paczkę wysyła flush().
+        """
+        if key in self.world.chunks or key in self.pending:
+            return
+        self.pending[key] = None
+        self.queued.append(key)
+
+    def flush(self):
+        """
+        Wysyła zebrane zlecenia jako jedną paczkę do puli wątków.
+        """
+        if not self.queued:
+            return
+        # Wątki tworzymy dopiero przy pierwszym zleceniu
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(self.workers, thread_name_prefix="chunks")
+        batch, self.queued = self.queued, []
+        future = self.executor.submit(self.world.generate_many, batch)
+        for key in batch:
+            self.pending[key] = future
+
+    def poll(self):
+        """
+        Przenosi do świata dane ukończonych paczek.
+        Nie czeka na te, które są jeszcze w trakcie generowania.
+        """
+        done = {f for f in self.pending.values() if f is not None and f.done()}
+        for future in done:
+            received = 0
+            for key, grid in future.result().items():
+                if self.pending.get(key) is future:
+                    del self.pending[key]
+                    self.world.chunks[key] = grid
+                    self.generated += 1
+                    received += 1
+            if received:
+                telemetry.event("chunk", n=received, sync=False)
+
+    def update(self, cam_off, vel, zoom=1.0):
+        """
+        Odbiera gotowe chunki, zleca prefetch wokół widoku przesuniętego
+        w kierunku ruchu i (przy zoomie 1.0) wypieka chunki, do których
+        zbliża się gracz.
+        """
+        self.poll()
+
+        cx0, cy0, cx1, cy1 = self.world.visible_chunks(cam_off)
+
+        # Po przejściu do innego chunka zwalniamy te daleko za graczem
+        center = ((cx0 + cx1) // 2, (cy0 + cy1) // 2)
+        if center != self.center:
+            self.center = center
+            self.evicted += self.world.evict_far(center)
+        dx = (vel[0] > 0) - (vel[0] < 0)
+        dy = (vel[1] > 0) - (vel[1] < 0)
+        ring = CHUNK_PREFETCH_RING
+        look = CHUNK_LOOKAHEAD
+
+        # Widok z pierścieniem, a potem ten sam obszar przesunięty w kierunku ruchu
+        wanted = self._area(cx0, cy0, cx1, cy1, ring)
+        wanted += self._area(cx0 + dx * look, cy0 + dy * look,
+                             cx1 + dx * look, cy1 + dy * look, ring)
+        for key in wanted:
+            self.request(key)
+        self.flush()
+
+        if (dx or dy) and zoom == 1.0:
+            self._bake_ahead(self._area(cx0 + dx, cy0 + dy, cx1 + dx, cy1 + dy, 0))
+
+    def _bake_ahead(self, keys):
+        budget = CHUNK_BAKES_PER_FRAME
+        for key in keys:
+            if budget <= 0:
+                return
+            if key in self.world.baked.surfaces or key not in self.world.chunks:
+                continue
+            self.world.bake_chunk(*key)
+            self.prebaked += 1
+            budget -= 1
+
+    @staticmethod
+    def _area(cx0, cy0, cx1, cy1, margin):
+        return [
+            (cx, cy)
+            for cy in range(cy0 - margin, cy1 + margin + 1)
+            for cx in range(cx0 - margin, cx1 + margin + 1)
+        ]
+
+    def shutdown(self):
+        """
+        Anuluje oczekujące zlecenia i zamyka pulę wątków.
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+        self.pending.clear()
+        self.queued.clear()
+
+    def stats(self):
+        """
+        Zwraca liczbę wygenerowanych w tle, oczekujących,
+        wypieczonych na zapas i usuniętych z pamięci chunków.
+        """
+        return {
+            "generated": self.generated,
+            "pending": len(self.pending),
+            "prebaked": self.prebaked,
+            "evicted": self.evicted,
+        }
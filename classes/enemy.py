@@ -2,8 +2,8 @@ import pygame
 import os
 import random
 
+from classes.assets import assets
 from classes.floating_text import FloatingText
-from classes.projectile import Projectile
 from settings import (
     ENEMY_SIZE,
     ENEMY_SPEED,
@@ -23,6 +23,8 @@ class Enemy(pygame.sprite.Sprite):
     - porusza się w stronę gracza,
     - może strzelać pociskami z losowym cooldownem,
     - przy otrzymaniu obrażeń wyświetla unoszący się tekst i odtwarza dźwięk.
+    Ruch i cooldown strzału liczy hurtowo EnemyPopulation gry;
+    sprite jest widokiem jej danych do rysowania i kolizji.
     """
 
     def __init__(self, x, y, game):
@@ -31,12 +33,10 @@ class Enemy(pygame.sprite.Sprite):
         - pozycja (x, y), referencja do Game,
         - losuje teksturę i statystyki strzału,
         - ustawia zdrowie, prędkość i obrażenia,
-        - ładuje dźwięki przy obrażeniach.
+        - rejestruje się w populacji wrogów gry.
         """
         super().__init__()
         self.game = game
-        self.pos = pygame.math.Vector2(x, y)
-        self.vel = pygame.math.Vector2(0, 0)
 
         self.images = self._load_images()
         self.original_image = random.choice(self.images)
@@ -48,100 +48,77 @@ class Enemy(pygame.sprite.Sprite):
         self.max_health = ENEMY_HEALTH
         self.damage = ENEMY_DAMAGE
 
-        self.can_shoot = random.random() < ENEMY_SHOOT_CHANCE
-        if self.can_shoot:
-            self.shoot_delay = random.randint(ENEMY_MIN_SHOOT_DELAY, ENEMY_MAX_SHOOT_DELAY)
-            self.last_shot = pygame.time.get_ticks()
+        can_shoot = random.random() < ENEMY_SHOOT_CHANCE
+        shoot_delay = 0
+        if can_shoot:
+            shoot_delay = random.randint(ENEMY_MIN_SHOOT_DELAY, ENEMY_MAX_SHOOT_DELAY)
 
-        self.sounds = self._load_sounds()
+        self.population = game.enemy_population
+        self.slot = self.population.add(
+            self, x, y, self.speed, can_shoot, shoot_delay, game.now
+        )
+
+    @property
+    def pos(self):
+        """
+        Pozycja wroga (kopia z tablic populacji).
+        """
+        if self.slot is None:
+            return pygame.math.Vector2(self.rect.center)
+        return pygame.math.Vector2(*self.population.pos[self.slot])
+
+    @property
+    def prev_pos(self):
+        """
+        Pozycja wroga z poprzedniego ticku (do interpolacji rysowania).
+        """
+        if self.slot is None:
+            return pygame.math.Vector2(self.rect.center)
+        return pygame.math.Vector2(*self.population.prev_pos[self.slot])
 
     def _load_images(self):
         """
-        Ładuje wszystkie pliki PNG z folderu 'assets/images/enemies',
-        zwraca listę Surface; jeśli folder lub pliki nie istnieją,
-        zwraca jednolity placeholder.
+        Pobiera z rejestru grafik wszystkie pliki PNG z folderu
+        'assets/images/enemies' (dekodowane raz na proces);
+        jeśli folder lub pliki nie istnieją, zwraca jednolity placeholder.
         """
         folder = os.path.join("assets", "images", "enemies")
-        images = []
-        if os.path.exists(folder):
-            for fn in os.listdir(folder):
-                if fn.lower().endswith(".png"):
-                    path = os.path.join(folder, fn)
-                    try:
-                        img = pygame.image.load(path).convert_alpha()
-                        if img.get_size() != (ENEMY_SIZE, ENEMY_SIZE):
-                            img = pygame.transform.scale(img, (ENEMY_SIZE, ENEMY_SIZE))
-                        images.append(img)
-                    except Exception:
-                        pass
+        images = assets.images_in(folder, (ENEMY_SIZE, ENEMY_SIZE))
         if not images:
             placeholder = pygame.Surface((ENEMY_SIZE, ENEMY_SIZE))
             placeholder.fill(RED)
-            images = [placeholder]
+            images = (placeholder,)
         return images
 
-    def _load_sounds(self):
-        """
-        Ładuje wszystkie pliki WAV/OGG/MP3 z folderu 'assets/sounds/enemies';
-        zwraca listę Sound, lub pustą listę jeśli żadne nie istnieją.
-        """
-        folder = os.path.join("assets", "sounds", "enemies")
-        sounds = []
-        if os.path.exists(folder):
-            for fn in os.listdir(folder):
-                if fn.lower().endswith((".wav", ".ogg", ".mp3")):
-                    path = os.path.join(folder, fn)
-                    try:
-                        sounds.append(pygame.mixer.Sound(path))
-                    except Exception:
-                        pass
-        return sounds
-
-    def update(self):
-        """
-        Porusza przeciwnika w stronę gracza, obraca obraz,
-        i jeśli może strzelać, wywołuje próbę strzału.
-        """
-        player = self.game.player
-        if not player:
-            return
-
-        direction = pygame.math.Vector2(player.rect.center) - self.pos
-        if direction.length() > 0:
-            direction = direction.normalize()
-        self.vel = direction * self.speed
-        self.pos += self.vel
-        self.rect.center = self.pos
-
-        if self.vel.x < 0:
-            self.image = pygame.transform.flip(self.original_image, True, False)
-        else:
-            self.image = self.original_image
-
-        if self.can_shoot:
-            self._try_shoot(direction)
-
-    def _try_shoot(self, direction):
-        """
-        Strzela pocisk w kierunku gracza, jeśli cooldown wygasł.
-        """
-        now = pygame.time.get_ticks()
-        if now - self.last_shot < self.shoot_delay:
-            return
-        self.last_shot = now
-
-        dx, dy = direction.x, direction.y
-        bullet = Projectile(
-            self.pos.x,
-            self.pos.y,
-            dx,
-            dy,
+    def face(self, left):
+        """
+        Ustawia grafikę zwróconą w lewo lub w prawo.
+        Odbita wersja pochodzi z rejestru grafik, więc powstaje
+        tylko raz na teksturę, wspólnie dla wszystkich wrogów.
+        """
+        self.image = assets.flipped(self.original_image) if left else self.original_image
+
+    def shoot(self, direction):
+        """
+        Strzela pocisk w kierunku direction=(dx, dy).
+        Cooldown pilnuje EnemyPopulation.
+        """
+        pos = self.pos
+        self.game.projectiles.spawn(
+            pos.x,
+            pos.y,
+            direction[0],
+            direction[1],
             self.damage,
-            False,
-            self.game
+            False
         )
-        self.game.all_sprites.add(bullet)
-        self.game.enemy_projectiles.add(bullet)
+
+    def kill(self):
+        """
+        Usuwa sprite ze wszystkich grup i z populacji wrogów.
+        """
+        self.population.remove(self)
+        super().kill()
 
     def take_damage(self, amount):
         """
@@ -151,10 +128,7 @@ class Enemy(pygame.sprite.Sprite):
         """
         self.game.floating_texts.add(FloatingText(f"-{int(amount)}", self.pos, self.game))
 
-        if self.sounds:
-            sound = random.choice(self.sounds)
-            sound.set_volume(0.1 * self.game.sfx_volume)
-            sound.play()
+        self.game.sounds.play("enemy_hurt", self.pos)
 
         self.health -= amount
         if self.health <= 0:
@@ -0,0 +1,196 @@
+import time
+
+import numpy as np
+
+from settings import WIDTH, HEIGHT, ENEMY_LOD_MARGIN, ENEMY_LOD_NEAR, ENEMY_LOD_PERIODS
+
+FIELDS = ("pos", "prev_pos", "speed", "can_shoot", "shoot_delay", "last_shot", "facing_left",
+          "last_update", "phase")
+
+
+class EnemyPopulation:
+    """
+    Stan ruchu wszystkich zwykłych przeciwników w tablicach NumPy:
+    pozycje, prędkości, kierunek patrzenia i liczniki strzałów.
+    Jeden wektorowy krok liczy dla wszystkich wrogów kierunek do gracza,
+    ruch, odbicie grafiki i gotowość do strzału; sprite'y Enemy są tylko
+    widokiem do rysowania i kolizji.
+    Wrogowie są dzieleni na poziomy szczegółowości (LOD) wg odległości
+    poza widokiem kamery: widoczni ruszają się co tick, dalsi co
+    ENEMY_LOD_PERIODS ticków o krok pomnożony przez liczbę ticków od
+    poprzedniej aktualizacji, więc średnio idą tak samo. Wrogowie poza
+    ekranem nie odbijają grafiki i nie sprawdzają gotowości do strzału.
+    Fazy (phase) rozkładają aktualizacje dalekich wrogów na kolejne ticki.
+    """
+
+    def __init__(self, game, capacity=64):
+        self.game = game
+        self.n = 0
+        self.sprites = []
+        self._alloc(capacity)
+        self.lod = True
+        self.spawned = 0
+
+        self.tiers = [0] * len(ENEMY_LOD_PERIODS)
+        self.updated = 0
+        self.skipped = 0
+        self.saved = 0.0
+        self._cost = 0.0
+
+    def _alloc(self, capacity):
+        old = getattr(self, "pos", None)
+        self.capacity = capacity
+        arrays = {
+            "pos": np.zeros((capacity, 2)),
+            "prev_pos": np.zeros((capacity, 2)),
+            "speed": np.zeros(capacity),
+            "can_shoot": np.zeros(capacity, dtype=bool),
+            "shoot_delay": np.zeros(capacity, dtype=np.int64),
+            "last_shot": np.zeros(capacity, dtype=np.int64),
+            "facing_left": np.zeros(capacity, dtype=bool),
+            "last_update": np.zeros(capacity, dtype=np.int64),
+            "phase": np.zeros(capacity, dtype=np.int64),
+        }
+        for name, arr in arrays.items():
+            if old is not None:
+                arr[:self.n] = getattr(self, name)[:self.n]
+            setattr(self, name, arr)
+
+    def add(self, enemy, x, y, speed, can_shoot, shoot_delay, last_shot):
+        """
+        Dodaje wroga do populacji i zwraca jego slot.
+        """
+        if self.n == self.capacity:
+            self._alloc(self.capacity * 2)
+        i = self.n
+        self.pos[i] = (x, y)
+        self.prev_pos[i] = (x, y)
+        self.speed[i] = speed
+        self.can_shoot[i] = can_shoot
+        self.shoot_delay[i] = shoot_delay
+        self.last_shot[i] = last_shot
+        self.facing_left[i] = False
+        self.last_update[i] = self.game.ticks
+        self.phase[i] = self.spawned
+        self.spawned += 1
+        self.sprites.append(enemy)
+        self.n += 1
+        return i
+
+    def remove(self, enemy):
+        """
+        Usuwa wroga, przenosząc ostatniego na jego slot.
+        """
+        i = enemy.slot
+        if i is None:
+            return
+        last = self.n - 1
+        if i != last:
+            for name in FIELDS:
+                arr = getattr(self, name)
+                arr[i] = arr[last]
+            moved = self.sprites[last]
+            self.sprites[i] = moved
+            moved.slot = i
+        self.sprites.pop()
+        self.n = last
+        enemy.slot = None
+
+    def clear(self):
+        for enemy in self.sprites:
+            enemy.slot = None
+        self.sprites.clear()
+        self.n = 0
+
+    def update(self, now, target):
+        """
+        Przesuwa wrogów w stronę target=(x, y), ustawia kierunek grafiki
+        i oddaje strzały wrogów, którym minął cooldown. Przy lod=True
+        w tym ticku ruszają się tylko wrogowie, na których przypada kolej
+        w ich poziomie LOD.
+        """
+        n = self.n
+        if n == 0:
+            return
+        pos = self.pos[:n]
+        self.prev_pos[:n] = pos
+
+        tick = self.game.ticks
+        tier = self._tiers(pos)
+        if self.lod:
+            periods = np.asarray(ENEMY_LOD_PERIODS)[tier]
+            due = np.flatnonzero((tick + self.phase[:n]) % periods == 0)
+        else:
+            due = np.arange(n)
+        self.tiers = np.bincount(tier, minlength=len(ENEMY_LOD_PERIODS)).tolist()
+        self.updated += due.size
+        self.skipped += n - due.size
+        if due.size == 0:
+            return
+
+        # Krok mnożony przez liczbę ticków od poprzedniej aktualizacji wroga
+        steps = tick - self.last_update[due]
+        self.last_update[due] = tick
+        p = pos[due]
+        d = np.asarray(target, dtype=float) - p
+        dist = np.hypot(d[:, 0], d[:, 1])
+        unit = np.divide(d, dist[:, None], out=np.zeros_like(d), where=dist[:, None] > 0)
+        vel = unit * self.speed[due, None]
+        pos[due] = p + vel * np.maximum(steps, 1)[:, None]
+
+        # Przy LOD grafikę odbijamy i strzały sprawdzamy tylko u widocznych
+        # wrogów (kierunek pozostałych zaktualizuje się, gdy wejdą na ekran)
+        if self.lod:
+            visible = tier[due] == 0
+        else:
+            visible = np.ones(due.size, dtype=bool)
+        left = vel[:, 0] < 0
+        flipped = np.flatnonzero(visible & (left != self.facing_left[due]))
+        self.facing_left[due[visible]] = left[visible]
+
+        ready = np.flatnonzero(visible & self.can_shoot[due]
+                               & (now - self.last_shot[due] >= self.shoot_delay[due]))
+        self.last_shot[due[ready]] = now
+
+        start = time.perf_counter()
+        sprites = self.sprites
+        moved = pos[due]
+        for i, x, y in zip(due.tolist(), moved[:, 0].tolist(), moved[:, 1].tolist()):
+            sprites[i].rect.center = (x, y)
+        for k in flipped.tolist():
+            sprites[due[k]].face(left[k])
+        for k in ready.tolist():
+            sprites[due[k]].shoot(unit[k])
+
+        # Szacunek oszczędności: wektorowa część kroku kosztuje prawie tyle
+        # samo niezależnie od liczby wrogów, więc liczymy średni koszt
+        # aktualizacji sprite'a jednego wroga razy liczba pominiętych
+        cost = (time.perf_counter() - start) / due.size
+        self._cost = cost if not self._cost else self._cost * 0.95 + cost * 0.05
+        self.saved += (n - due.size) * self._cost
+
+    def _tiers(self, pos):
+        # Poziom LOD: odległość wroga poza widokiem kamery (0 = na ekranie)
+        game = self.game
+        half_w = WIDTH / game.zoom / 2
+        half_h = HEIGHT / game.zoom / 2
+        cx = game.camera_offset[0] + half_w
+        cy = game.camera_offset[1] + half_h
+        out = np.maximum(np.abs(pos[:, 0] - cx) - half_w, np.abs(pos[:, 1] - cy) - half_h)
+        tier = np.full(len(pos), 2, dtype=np.intp)
+        tier[out <= ENEMY_LOD_NEAR] = 1
+        tier[out <= ENEMY_LOD_MARGIN] = 0
+        return tier
+
+    def stats(self):
+        """
+        Zwraca liczby wrogów w poziomach LOD z ostatniego ticku, łączną
+        liczbę wykonanych i pominiętych aktualizacji oraz szacowany
+        zaoszczędzony czas w ms.
+        """
+        return {
+            "tiers": list(self.tiers),
+            "updated": self.updated,
+            "skipped": self.skipped,
+            "saved_ms": round(self.saved * 1000, 1),
+        }
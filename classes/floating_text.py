@@ -1,5 +1,7 @@
 import pygame
-from settings import RED
+
+from classes.text_cache import text_cache
+from settings import RED, FONT_PATH
 
 
 class FloatingText(pygame.sprite.Sprite):
@@ -13,7 +15,7 @@ class FloatingText(pygame.sprite.Sprite):
             world_pos: pygame.math.Vector2,
             game,
             color=RED,
-            font_name="assets/fonts/PressStart2P.ttf",
+            font_name=FONT_PATH,
             font_size=16,
             duration=1000,
             rise=30
@@ -31,19 +33,25 @@ class FloatingText(pygame.sprite.Sprite):
         """
         super().__init__()
         self.game = game
-        self.start_time = pygame.time.get_ticks()
+        self.text = text
+        self.color = color
+        self.font_name = font_name
+        self.font_size = font_size
+        self.start_time = self.game.now
         self.duration = duration
         self.rise = rise
 
         self.start_pos = pygame.math.Vector2(world_pos)
         self.pos = pygame.math.Vector2(world_pos)
 
-        self.font = pygame.font.Font(font_name, font_size)
-        self.image = self.font.render(text, True, color)
+        # Napis składany z gotowych znaków zamiast renderowania TTF
+        self.image = text_cache.render(text, color, font_name, font_size)
         self.alpha = 255
         self.image.set_alpha(self.alpha)
 
         self.rect = self.image.get_rect()
+        # Napis w czcionce przeskalowanej o zoom: (zoom, surface)
+        self.zoomed = None
 
     def update(self):
         """
@@ -52,7 +60,7 @@ class FloatingText(pygame.sprite.Sprite):
         - stopniowo zmniejsza przezroczystość (fade out),
         - unosi tekst w górę proporcjonalnie do upływu czasu.
         """
-        elapsed = pygame.time.get_ticks() - self.start_time
+        elapsed = self.game.now - self.start_time
         if elapsed >= self.duration:
             self.kill()
             return
@@ -63,12 +71,22 @@ class FloatingText(pygame.sprite.Sprite):
 
         self.pos.y = self.start_pos.y - self.rise * t
 
-    def draw(self, surface, camera_offset):
+    def draw(self, surface, camera_offset, zoom=1.0):
         """
-        Rysuje tekst na ekranie z offsetem kamery.
+        Rysuje tekst na ekranie z offsetem kamery (w pikselach ekranu).
+        Przy zoomie innym niż 1.0 napis jest renderowany raz czcionką
+        w rozmiarze przeskalowanym o zoom.
         """
-        screen_x = self.pos.x - camera_offset[0]
-        screen_y = self.pos.y - camera_offset[1]
+        image = self.image
+        if zoom != 1.0:
+            if self.zoomed is None or self.zoomed[0] != zoom:
+                size = max(1, round(self.font_size * zoom))
+                self.zoomed = (zoom, text_cache.render(self.text, self.color, self.font_name, size))
+            image = self.zoomed[1]
+            image.set_alpha(self.alpha)
+
+        screen_x = self.pos.x * zoom - camera_offset[0]
+        screen_y = self.pos.y * zoom - camera_offset[1]
 
-        self.rect.center = (screen_x, screen_y)
-        surface.blit(self.image, self.rect)
+        self.rect = image.get_rect(center=(screen_x, screen_y))
+        surface.blit(image, self.rect)
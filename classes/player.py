@@ -2,8 +2,8 @@ import os
 
 import pygame
 
+from classes.assets import assets
 from classes.floating_text import FloatingText
-from classes.projectile import Projectile
 from settings import *
 
 
@@ -20,6 +20,8 @@ class Player(pygame.sprite.Sprite):
         super().__init__()
         self.game = game
         self.pos = pygame.math.Vector2(x, y)
+        # Pozycja z poprzedniego ticku do interpolacji rysowania
+        self.prev_pos = pygame.math.Vector2(x, y)
         self.vel = pygame.math.Vector2(0, 0)
         self.speed = PLAYER_SPEED
 
@@ -33,23 +35,29 @@ class Player(pygame.sprite.Sprite):
         for state, count in (('idle', 3), ('walk', 4), ('attack', 3)):
             for i in range(1, count + 1):
                 path = os.path.join('assets', 'images', 'player', f'{state}_{i}.png')
-                raw = pygame.image.load(path).convert_alpha()
-                ow, oh = raw.get_size()
+                ow, oh = assets.image(path).get_size()
                 sh = PLAYER_SIZE
                 sw = int(ow * (sh / oh))
-                img = pygame.transform.scale(raw, (sw, sh))
+                img = assets.image(path, (sw, sh))
                 self.animations[state].append(img)
 
+        # Odbite w lewo wersje wszystkich klatek (liczone raz na klatkę)
+        self.animations_left = {
+            state: [assets.flipped(frame) for frame in frames]
+            for state, frames in self.animations.items()
+        }
+
         self.state = 'idle'
         self.frame_index = 0
         self.anim_speed = 120
-        self.last_anim = pygame.time.get_ticks()
+        self.last_anim = self.game.now
         self.image = self.animations['idle'][0]
         self.rect = self.image.get_rect(center=(x, y))
         self.facing_left = False
 
-        self.last_shot = 0
         self.shoot_delay = PLAYER_SHOOT_DELAY
+        # Gracz może strzelić od razu po starcie gry
+        self.last_shot = self.game.now - self.shoot_delay
 
         self.attacking = False
 
@@ -57,12 +65,11 @@ class Player(pygame.sprite.Sprite):
         self.max_health = PLAYER_HEALTH
 
     def update(self):
-        now = pygame.time.get_ticks()
+        now = self.game.now
+        self.prev_pos.update(self.pos)
 
         # Ruch postaci
-        keys = pygame.key.get_pressed()
-        self.vel.x = keys[pygame.K_d] - keys[pygame.K_a]
-        self.vel.y = keys[pygame.K_s] - keys[pygame.K_w]
+        self.vel.x, self.vel.y = self.game.movement()
         if self.vel.length_squared() > 0:
             self.vel = self.vel.normalize() * self.speed
         self.pos += self.vel
@@ -97,9 +104,8 @@ class Player(pygame.sprite.Sprite):
         if now - self.last_anim > self.anim_speed:
             self.last_anim = now
             self.frame_index = (self.frame_index + 1) % len(self.animations[self.state])
-        frame = self.animations[self.state][self.frame_index]
-        if self.facing_left:
-            frame = pygame.transform.flip(frame, True, False)
+        frames = self.animations_left if self.facing_left else self.animations
+        frame = frames[self.state][self.frame_index]
         old_center = self.rect.center
         self.image = frame
         self.rect = self.image.get_rect(center=old_center)
@@ -110,15 +116,15 @@ class Player(pygame.sprite.Sprite):
         - ustawia attacking=True i restartuje animację attack,
         - flip na podstawie kierunku myszki.
         """
-        now = pygame.time.get_ticks()
+        now = self.game.now
         if now - self.last_shot < self.shoot_delay:
             return
         self.last_shot = now
 
-        # Oblicz kierunek w zależności od położenia myszki
+        # Oblicz kierunek w zależności od położenia myszki (ekran → świat)
         mx, my = mouse_pos
-        world_x = mx + self.game.camera_offset[0]
-        world_y = my + self.game.camera_offset[1]
+        world_x = mx / self.game.zoom + self.game.camera_offset[0]
+        world_y = my / self.game.zoom + self.game.camera_offset[1]
         dir_vec = pygame.math.Vector2(world_x, world_y) - self.pos
         if dir_vec.length() > 0:
             dir_vec = dir_vec.normalize()
@@ -129,15 +135,12 @@ class Player(pygame.sprite.Sprite):
         self.frame_index = 0
         self.last_anim = now
 
-        bullet = Projectile(
+        self.game.projectiles.spawn(
             self.pos.x, self.pos.y,
             dir_vec.x, dir_vec.y,
             PLAYER_PROJECTILE_DAMAGE,
-            True,
-            self.game
+            True
         )
-        self.game.all_sprites.add(bullet)
-        self.game.player_projectiles.add(bullet)
 
     def take_damage(self, amount):
         """
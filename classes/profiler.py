@@ -0,0 +1,160 @@
+import time
+
+import numpy as np
+
+from settings import PROFILER_FRAMES
+
+
+class _Section:
+    """
+    Pomiar jednej sekcji: czas między wejściem a wyjściem z bloku with
+    dopisywany do bieżącej klatki profilera.
+    """
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        current = self.profiler.current
+        current[self.name] = current.get(self.name, 0.0) + time.perf_counter() - self.start
+        return False
+
+
+class _NoSection:
+    # Wyłączony profiler: pusty blok with bez pomiaru czasu
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_SECTION = _NoSection()
+
+
+class Profiler:
+    """
+    Profiler klatek: nazwane sekcje (with profiler.section("nazwa"))
+    sumują czas w bieżącej klatce, a end_frame() zapisuje sumy i czas
+    całej klatki do buforów pierścieniowych o długości PROFILER_FRAMES.
+    Ta sama sekcja może wystąpić w klatce kilka razy (np. kilka ticków),
+    a sekcje mogą być zagnieżdżone — wtedy ich czasy się pokrywają.
+    Wyłączony profiler zwraca wspólny pusty blok, więc kosztuje tylko
+    wywołanie metody. Mierzy wyłącznie główny wątek.
+    Pomiary są włączone, dopóki chce ich choć jeden klient
+    (nakładka F3, telemetria) — patrz request().
+    """
+
+    def __init__(self, frames=PROFILER_FRAMES):
+        self.enabled = False
+        self.clients = set()
+        self.size = frames
+        self.frame_times = np.zeros(frames)
+        self.sections = {}
+        self.current = {}
+        self.last = None
+        self.index = 0
+        self.filled = 0
+        self._frame_start = None
+
+    def request(self, client, on=True):
+        """
+        Włącza (on=True) lub zwalnia pomiary dla klienta client.
+        Po włączeniu przez pierwszego klienta bufory startują od zera.
+        """
+        was = self.enabled
+        if on:
+            self.clients.add(client)
+        else:
+            self.clients.discard(client)
+        self.enabled = bool(self.clients)
+        if self.enabled and not was:
+            self.reset()
+
+    def reset(self):
+        self.frame_times[:] = 0
+        self.sections.clear()
+        self.current.clear()
+        self.last = None
+        self.index = 0
+        self.filled = 0
+        self._frame_start = None
+
+    def section(self, name):
+        if not self.enabled:
+            return _NO_SECTION
+        return _Section(self, name)
+
+    def begin_frame(self):
+        if self.enabled:
+            self._frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """
+        Zamyka klatkę: zapisuje jej czas i sumy sekcji w buforach.
+        Ostatnia klatka zostaje też w last jako (czas, {sekcja: czas}).
+        """
+        if not self.enabled or self._frame_start is None:
+            return
+        i = self.index
+        self.frame_times[i] = time.perf_counter() - self._frame_start
+        current = self.current
+        self.last = (float(self.frame_times[i]), dict(current))
+        for name, ring in self.sections.items():
+            ring[i] = current.pop(name, 0.0)
+        # Sekcje, które pojawiły się pierwszy raz
+        for name, spent in current.items():
+            ring = np.zeros(self.size)
+            ring[i] = spent
+            self.sections[name] = ring
+        current.clear()
+        self.index = (i + 1) % self.size
+        self.filled = min(self.filled + 1, self.size)
+        self._frame_start = None
+
+    def history(self):
+        """
+        Zwraca czasy klatek w ms od najstarszej do najnowszej.
+        """
+        if self.filled < self.size:
+            return self.frame_times[:self.filled] * 1000
+        return np.roll(self.frame_times, -self.index) * 1000
+
+    def top(self, n):
+        """
+        Zwraca n najdroższych sekcji jako listę (nazwa, średnia ms, maks. ms)
+        z klatek w buforze.
+        """
+        k = self.filled
+        if not k:
+            return []
+        rows = []
+        for name, ring in self.sections.items():
+            data = ring[:k] if k < self.size else ring
+            rows.append((name, float(data.mean()) * 1000, float(data.max()) * 1000))
+        rows.sort(key=lambda row: row[1], reverse=True)
+        return rows[:n]
+
+    def stats(self):
+        """
+        Zwraca średni i maksymalny czas klatki (ms) oraz liczbę klatek w buforze.
+        """
+        frames = self.history()
+        return {
+            "frames": self.filled,
+            "frame_mean": float(frames.mean()) if self.filled else 0.0,
+            "frame_max": float(frames.max()) if self.filled else 0.0,
+        }
+
+
+# Jeden profiler na cały proces
+profiler = Profiler()
@@ -0,0 +1,335 @@
+import heapq
+
+import numpy as np
+
+from classes.assets import assets
+from settings import (
+    WIDTH,
+    HEIGHT,
+    PLAYER_PROJECTILE_IMAGE,
+    PLAYER_PROJECTILE_SIZE,
+    PLAYER_PROJECTILE_SPEED,
+    ENEMY_PROJECTILE_IMAGE,
+    ENEMY_PROJECTILE_SIZE,
+    ENEMY_PROJECTILE_SPEED,
+    PROJECTILE_LIFETIME,
+    PROJECTILE_COLLIDE_BLOCK,
+    PROJECTILE_CULL_MARGIN,
+    PROJECTILE_ROTATION_STEPS
+)
+
+
+class ProjectileSystem:
+    """
+    Wszystkie pociski gracza i wrogów przechowywane jako tablice NumPy
+    (struktura tablic): pozycja, prędkość, obrażenia, właściciel,
+    numer pocisku i krok obrotu grafiki (jeden z PROJECTILE_ROTATION_STEPS
+    gotowych obrotów).
+    - update przesuwa pociski jednym krokiem i usuwa te, które wyleciały
+      poza widok (lub arenę) z marginesem albo którym minął czas życia,
+    - terminy wygaśnięcia trzyma kopiec (heapq) paczek pocisków, więc
+      sprawdzamy tylko jego wierzch zamiast czasu każdego pocisku,
+    - collide sprawdza kolizje wszystkich pocisków z prostokątami naraz,
+      a collide_grid tylko z kandydatami z komórek siatki kolizji,
+    - draw rysuje widoczne pociski jednym wywołaniem Surface.blits.
+    """
+
+    # właściciel (True = gracz) -> (grafika, rozmiar, prędkość, kolor placeholdera)
+    KINDS = {
+        True: (PLAYER_PROJECTILE_IMAGE, PLAYER_PROJECTILE_SIZE, PLAYER_PROJECTILE_SPEED, (255, 255, 0)),
+        False: (ENEMY_PROJECTILE_IMAGE, ENEMY_PROJECTILE_SIZE, ENEMY_PROJECTILE_SPEED, (255, 100, 100)),
+    }
+
+    def __init__(self, game, capacity=256):
+        self.game = game
+        self.n = 0
+        self._alloc(capacity)
+        self.sprites = {}
+
+        # Kopiec terminów: (czas wygaśnięcia, pierwszy uid, uid za ostatnim)
+        self.deadlines = []
+        self.next_uid = 0
+
+        self.spawned = 0
+        self.expired = 0
+        self.culled = 0
+        self.hits = 0
+
+    def _alloc(self, capacity):
+        old = getattr(self, "pos", None)
+        self.capacity = capacity
+        pos = np.zeros((capacity, 2))
+        prev_pos = np.zeros((capacity, 2))
+        vel = np.zeros((capacity, 2))
+        damage = np.zeros(capacity)
+        is_player = np.zeros(capacity, dtype=bool)
+        uid = np.zeros(capacity, dtype=np.int64)
+        angle = np.zeros(capacity, dtype=np.int16)
+        if old is not None:
+            n = self.n
+            pos[:n] = self.pos[:n]
+            prev_pos[:n] = self.prev_pos[:n]
+            vel[:n] = self.vel[:n]
+            damage[:n] = self.damage[:n]
+            is_player[:n] = self.is_player[:n]
+            uid[:n] = self.uid[:n]
+            angle[:n] = self.angle[:n]
+        self.pos, self.prev_pos, self.vel, self.damage = pos, prev_pos, vel, damage
+        self.is_player, self.uid, self.angle = is_player, uid, angle
+
+    def spawn(self, x, y, dx, dy, damage, is_player):
+        """
+        Dodaje jeden pocisk lecący z (x, y) w kierunku (dx, dy)
+        i odtwarza dźwięk strzału.
+        """
+        self.spawn_many(x, y, [(dx, dy)], damage, is_player)
+
+    def spawn_many(self, x, y, dirs, damage, is_player):
+        """
+        Dodaje naraz pociski z jednego punktu w kierunkach dirs
+        (lista lub tablica (k, 2)). Dźwięk strzału gra tylko raz.
+        """
+        dirs = np.asarray(dirs, dtype=float).reshape(-1, 2)
+        k = len(dirs)
+        if self.n + k > self.capacity:
+            self._alloc(max(self.capacity * 2, self.n + k))
+
+        _, _, speed, _ = self.KINDS[is_player]
+        length = np.hypot(dirs[:, 0], dirs[:, 1])
+        unit = np.divide(dirs, length[:, None], out=np.zeros_like(dirs), where=length[:, None] > 0)
+
+        s = slice(self.n, self.n + k)
+        self.pos[s] = (x, y)
+        self.prev_pos[s] = (x, y)
+        self.vel[s] = unit * speed
+        self.damage[s] = damage
+        self.is_player[s] = is_player
+        self.uid[s] = np.arange(self.next_uid, self.next_uid + k)
+        steps = PROJECTILE_ROTATION_STEPS
+        turn = np.rint(np.arctan2(-dirs[:, 1], dirs[:, 0]) * (steps / (2 * np.pi)))
+        self.angle[s] = turn.astype(np.int16) % steps
+        self.n += k
+
+        # Cała paczka wygasa naraz, więc wystarczy jeden wpis w kopcu
+        heapq.heappush(self.deadlines, (self.game.now + PROJECTILE_LIFETIME,
+                                        self.next_uid, self.next_uid + k))
+        self.next_uid += k
+        self.spawned += k
+
+        self.game.sounds.play("player_shot" if is_player else "enemy_shot", (x, y))
+
+    def update(self, now):
+        """
+        Przesuwa wszystkie pociski o ich prędkość i usuwa te poza
+        obszarem gry oraz przeterminowane.
+        """
+        n = self.n
+        self.prev_pos[:n] = self.pos[:n]
+        self.pos[:n] += self.vel[:n]
+
+        x0, y0, x1, y1 = self._live_area()
+        px, py = self.pos[:n, 0], self.pos[:n, 1]
+        mask = (px > x0) & (px < x1) & (py > y0) & (py < y1)
+        self.culled += n - int(mask.sum())
+
+        # Zdejmujemy z kopca wszystkie paczki, którym minął termin;
+        # pociski trafione lub wycięte wcześniej po prostu już nie istnieją
+        deadlines = self.deadlines
+        if deadlines and deadlines[0][0] <= now:
+            uid = self.uid[:n]
+            while deadlines and deadlines[0][0] <= now:
+                _, lo, hi = heapq.heappop(deadlines)
+                dead = mask & (uid >= lo) & (uid < hi)
+                self.expired += int(dead.sum())
+                mask &= ~dead
+        self._keep(mask)
+
+    def _live_area(self):
+        # Widok kamery (na arenie jej granice) powiększony o margines
+        game = self.game
+        m = PROJECTILE_CULL_MARGIN
+        arena = game.boss_arena if game.boss_room else None
+        if arena is not None:
+            r = arena.bounds
+            return r.left - m, r.top - m, r.right + m, r.bottom + m
+        cx, cy = game.camera_offset
+        return cx - m, cy - m, cx + WIDTH / game.zoom + m, cy + HEIGHT / game.zoom + m
+
+    def _keep(self, mask):
+        # Zostawia tylko pociski z mask=True, zachowując kolejność
+        n = int(mask.sum())
+        if n == self.n:
+            return
+        for name in ("pos", "prev_pos", "vel", "damage", "is_player", "uid", "angle"):
+            arr = getattr(self, name)
+            arr[:n] = arr[:self.n][mask]
+        self.n = n
+
+    def collide(self, rects, is_player):
+        """
+        Sprawdza kolizje pocisków danego właściciela z prostokątami
+        rects (lista (x, y, w, h)). Każdy pocisk trafia najwyżej pierwszy
+        prostokąt z listy i jest usuwany. Zwraca listę par
+        (indeks prostokąta, obrażenia).
+        """
+        n = self.n
+        if n == 0 or not len(rects):
+            return []
+        r = np.asarray(rects, dtype=float).reshape(-1, 4)
+        half = self.KINDS[is_player][1] / 2
+        idx = np.flatnonzero(self.is_player[:n] == is_player)
+        if idx.size == 0:
+            return []
+
+        hit_rect = np.full(idx.size, -1)
+        # Bloki ograniczają rozmiar macierzy pociski × prostokąty
+        for start in range(0, idx.size, PROJECTILE_COLLIDE_BLOCK):
+            block = idx[start:start + PROJECTILE_COLLIDE_BLOCK]
+            px = self.pos[block, 0][:, None]
+            py = self.pos[block, 1][:, None]
+            overlap = ((px + half > r[:, 0]) & (px - half < r[:, 0] + r[:, 2])
+                       & (py + half > r[:, 1]) & (py - half < r[:, 1] + r[:, 3]))
+            any_hit = overlap.any(axis=1)
+            hit_rect[start:start + block.size] = np.where(any_hit, overlap.argmax(axis=1), -1)
+
+        hit = hit_rect >= 0
+        if not hit.any():
+            return []
+        hits = list(zip(hit_rect[hit].tolist(), self.damage[idx[hit]].tolist()))
+        mask = np.ones(n, dtype=bool)
+        mask[idx[hit]] = False
+        self._keep(mask)
+        self.hits += len(hits)
+        return hits
+
+    def collide_grid(self, grid, is_player):
+        """
+        Sprawdza kolizje pocisków danego właściciela z obiektami w siatce
+        grid (SpatialHash). Każdy pocisk jest zestawiany tylko z obiektami
+        z komórek, które pokrywa (pocisk nie jest większy od komórki, więc
+        to najwyżej 4 komórki), a test prostokątów jest liczony hurtowo na
+        tych parach. Pocisk trafia najwyżej jeden obiekt — pierwszy w
+        kolejności wstawiania do siatki — i jest usuwany. Zwraca listę
+        par (obiekt, obrażenia).
+        """
+        n = self.n
+        if n == 0 or grid.count == 0:
+            return []
+        idx = np.flatnonzero(self.is_player[:n] == is_player)
+        if idx.size == 0:
+            return []
+        keys, owners, rects = grid.flat()
+        half = self.KINDS[is_player][1] / 2
+        px = self.pos[idx, 0]
+        py = self.pos[idx, 1]
+
+        # Komórki narożników pocisku (bez powtórzeń, gdy leży w jednej kolumnie/wierszu)
+        cs = grid.cell_size
+        x0 = np.floor(px - half).astype(np.int64) // cs
+        y0 = np.floor(py - half).astype(np.int64) // cs
+        x1 = np.floor(px + half).astype(np.int64) // cs
+        y1 = np.floor(py + half).astype(np.int64) // cs
+        bullet = np.arange(idx.size)
+        wide = x1 != x0
+        tall = y1 != y0
+        both = wide & tall
+        cell_x = np.concatenate((x0, x1[wide], x0[tall], x1[both]))
+        cell_y = np.concatenate((y0, y0[wide], y1[tall], y1[both]))
+        cell_b = np.concatenate((bullet, bullet[wide], bullet[tall], bullet[both]))
+
+        # Pary (pocisk, obiekt) z tej samej komórki
+        wanted = grid.cell_key(cell_x, cell_y)
+        lo = np.searchsorted(keys, wanted, side="left")
+        count = np.searchsorted(keys, wanted, side="right") - lo
+        total = int(count.sum())
+        if total == 0:
+            return []
+        starts = np.repeat(lo - (np.cumsum(count) - count), count)
+        pair_b = np.repeat(cell_b, count)
+        pair_o = owners[starts + np.arange(total)]
+
+        r = rects[pair_o]
+        bx = px[pair_b]
+        by = py[pair_b]
+        overlap = ((bx + half > r[:, 0]) & (bx - half < r[:, 0] + r[:, 2])
+                   & (by + half > r[:, 1]) & (by - half < r[:, 1] + r[:, 3]))
+        if not overlap.any():
+            return []
+        first = np.full(idx.size, len(rects))
+        np.minimum.at(first, pair_b[overlap], pair_o[overlap])
+        hit = np.flatnonzero(first < len(rects))
+
+        items = grid.items
+        hits = list(zip([items[i] for i in first[hit].tolist()], self.damage[idx[hit]].tolist()))
+        mask = np.ones(n, dtype=bool)
+        mask[idx[hit]] = False
+        self._keep(mask)
+        self.hits += len(hits)
+        return hits
+
+    def clear(self):
+        """
+        Usuwa wszystkie pociski.
+        """
+        self.n = 0
+        self.deadlines.clear()
+
+    def count(self, is_player=None):
+        """
+        Zwraca liczbę żywych pocisków (wszystkich lub jednego właściciela).
+        """
+        if is_player is None:
+            return self.n
+        return int((self.is_player[:self.n] == is_player).sum())
+
+    def stats(self):
+        """
+        Zwraca liczbę żywych pocisków (razem i wg właściciela) oraz
+        liczniki wystrzelonych, wygasłych, wyciętych poza widokiem i trafień.
+        """
+        player = self.count(True)
+        return {
+            "live": self.n,
+            "player": player,
+            "enemy": self.n - player,
+            "spawned": self.spawned,
+            "expired": self.expired,
+            "culled": self.culled,
+            "hits": self.hits,
+            "deadlines": len(self.deadlines),
+        }
+
+    def _sprite(self, is_player, step, zoom):
+        # Gotowy obrót (przeskalowany o zoom) z rejestru i przesunięcie jego środka
+        key = (is_player, step, zoom)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            path, size, _, color = self.KINDS[is_player]
+            size = max(1, round(size * zoom))
+            image = assets.rotations(path, (size, size), PROJECTILE_ROTATION_STEPS, color)[step]
+            w, h = image.get_size()
+            sprite = (image, w // 2, h // 2)
+            self.sprites[key] = sprite
+        return sprite
+
+    def draw(self, surf, cam_off, alpha=1.0, zoom=1.0):
+        """
+        Rysuje widoczne pociski jednym wywołaniem blits.
+        alpha — ułamek ticku do interpolacji między poprzednią
+        a bieżącą pozycją; cam_off jest w pikselach ekranu (świat × zoom).
+        """
+        n = self.n
+        if n == 0:
+            return
+        pos = self.prev_pos[:n] + (self.pos[:n] - self.prev_pos[:n]) * alpha
+        x = pos[:, 0] * zoom - cam_off[0]
+        y = pos[:, 1] * zoom - cam_off[1]
+        m = 32 * zoom
+        visible = np.flatnonzero((x > -m) & (x < WIDTH + m) & (y > -m) & (y < HEIGHT + m))
+
+        seq = []
+        for px, py, owner, step in zip(x[visible].tolist(), y[visible].tolist(),
+                                       self.is_player[visible].tolist(), self.angle[visible].tolist()):
+            image, ox, oy = self._sprite(owner, step, zoom)
+            seq.append((image, (int(px) - ox, int(py) - oy)))
+        surf.blits(seq, doreturn=False)
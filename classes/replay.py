@@ -0,0 +1,192 @@
+import gzip
+import hashlib
+import json
+import random
+import struct
+
+from settings import REPLAY_CHECK_EVERY
+
+
+# Kierunek ruchu (dx, dy) z {-1, 0, 1}² zapisany jako jedna cyfra 0..8
+def _move_code(move):
+    dx, dy = move
+    return (int(dx) + 1) * 3 + int(dy) + 1
+
+
+def _move_from_code(code):
+    return code // 3 - 1, code % 3 - 1
+
+
+def state_digest(game):
+    """
+    Zwraca krótki skrót stanu symulacji (tick, score, gracz, wrogowie,
+    pociski, boss i stan RNG) do porównania nagrania z odtworzeniem.
+    """
+    h = hashlib.blake2b(digest_size=8)
+    player = game.player
+    h.update(struct.pack("<qqddd", game.ticks, game.score, player.pos.x, player.pos.y, player.health))
+    population = game.enemy_population
+    h.update(population.pos[:population.n].tobytes())
+    projectiles = game.projectiles
+    h.update(projectiles.pos[:projectiles.n].tobytes())
+    if game.boss is not None:
+        h.update(struct.pack("<ddd", game.boss.pos.x, game.boss.pos.y, game.boss.health))
+    h.update(repr(random.getstate()).encode())
+    return h.hexdigest()
+
+
+class InputRecorder:
+    """
+    Nagrywa sesję do odtworzenia co do bitu: ziarno świata, stan
+    globalnego random i wejście każdego ticku — kierunek ruchu, kliknięcia
+    przekazane do Player.shoot, wejście do portalu, restart i zmiany
+    zoomu. Podpina się jako game.tape, więc Game.update woła on_tick
+    na początku każdego ticku. Co REPLAY_CHECK_EVERY ticków zapisuje
+    skrót stanu, który odtworzenie sprawdza.
+    Plik (gzip) to linie JSON: nagłówek, potem [ruch, n] dla n ticków
+    z samym ruchem, [ruch, strzały, akcje] dla ticku z kliknięciami
+    lub akcjami i ["#", tick, skrót] dla punktów kontrolnych.
+    """
+
+    VERSION = 1
+
+    def __init__(self, game):
+        self.game = game
+        self.header = {
+            "v": self.VERSION,
+            "seed": game.world.seed,
+            "rng": random.getstate(),
+            "zoom": game.zoom,
+            "ticks": game.ticks,
+        }
+        self.lines = []
+        self.notes = []
+        self.zoom = game.zoom
+        self.count = 0
+        game.tape = self
+
+    def note(self, action):
+        """
+        Zapamiętuje akcję wykonaną poza tickiem (np. restart z ekranu końca);
+        trafi do najbliższego ticku.
+        """
+        self.notes.append(action)
+
+    def on_tick(self, game):
+        actions = self.notes
+        self.notes = []
+        if game.zoom != self.zoom:
+            self.zoom = game.zoom
+            actions.append(["zoom", game.zoom])
+        actions.extend(game.pending_actions)
+
+        if self.count % REPLAY_CHECK_EVERY == 0:
+            self.lines.append(["#", self.count, state_digest(game)])
+        self.count += 1
+
+        code = _move_code(game.movement())
+        shots = [list(pos) for pos in game.pending_shots]
+        if shots or actions:
+            self.lines.append([code, shots, actions])
+            return
+        # Ticki z samym ruchem zwijamy w serie
+        last = self.lines[-1] if self.lines else None
+        if last is not None and len(last) == 2 and last[0] == code:
+            last[1] += 1
+        else:
+            self.lines.append([code, 1])
+
+    def save(self, path):
+        """
+        Zapisuje nagranie do pliku path i odpina się od gry.
+        """
+        if self.game.tape is self:
+            self.game.tape = None
+        self.header["length"] = self.count
+        # Skrót stanu końcowego
+        self.lines.append(["#", self.count, state_digest(self.game)])
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            f.write(json.dumps(self.header, separators=(",", ":")) + "\n")
+            for line in self.lines:
+                f.write(json.dumps(line, separators=(",", ":")) + "\n")
+
+
+class InputReplay:
+    """
+    Odtwarza nagranie InputRecorder w grze utworzonej z Game(seed=seed):
+    restore_rng() przywraca stan random, attach() podpina odtwarzanie,
+    a on_tick podaje grze wejście kolejnego ticku i porównuje skróty stanu.
+    Pętlę (z rysowaniem lub bez) prowadzi wywołujący — patrz tools/replay.py.
+    """
+
+    def __init__(self, path):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            self.header = json.loads(f.readline())
+            lines = [json.loads(line) for line in f]
+        self.length = self.header["length"]
+        self.checks = {}
+        self.ticks = []
+        for line in lines:
+            if line[0] == "#":
+                self.checks[line[1]] = line[2]
+            elif len(line) == 2:
+                self.ticks.extend([(line[0], (), ())] * line[1])
+            else:
+                self.ticks.append((line[0], line[1], line[2]))
+        self.count = 0
+        self.mismatches = []
+
+    @property
+    def seed(self):
+        return self.header["seed"]
+
+    def restore_rng(self):
+        """
+        Przywraca stan globalnego random z chwili rozpoczęcia nagrania.
+        """
+        version, state, gauss = self.header["rng"]
+        random.setstate((version, tuple(state), gauss))
+
+    def attach(self, game):
+        game.set_zoom(self.header["zoom"])
+        game.tape = self
+
+    @property
+    def done(self):
+        return self.count >= len(self.ticks)
+
+    def note(self, action):
+        # Odtwarzane akcje nie są nagrywane ponownie
+        pass
+
+    def check(self, game):
+        # Porównuje stan gry ze skrótem zapisanym dla bieżącego ticku (jeśli jest)
+        expected = self.checks.get(self.count)
+        if expected is not None:
+            digest = state_digest(game)
+            if digest != expected:
+                self.mismatches.append((self.count, expected, digest))
+
+    def finish(self, game):
+        """
+        Sprawdza stan końcowy po odtworzeniu wszystkich ticków.
+        """
+        self.check(game)
+        if game.tape is self:
+            game.tape = None
+
+    def on_tick(self, game):
+        code, shots, actions = self.ticks[self.count]
+        for action in actions:
+            if action == "restart":
+                game.restart()
+            elif isinstance(action, list) and action[0] == "zoom":
+                game.set_zoom(action[1])
+            else:
+                game.pending_actions.append(action)
+
+        self.check(game)
+        self.count += 1
+
+        game.scripted_move = _move_from_code(code)
+        game.pending_shots.extend(tuple(pos) for pos in shots)
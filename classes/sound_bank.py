@@ -0,0 +1,185 @@
+import os
+import random
+
+import pygame
+
+from classes.profiler import profiler
+from settings import (
+    WIDTH,
+    HEIGHT,
+    PLAYER_PROJECTILE_SOUND,
+    ENEMY_PROJECTILE_SOUND,
+    ENEMY_HURT_SOUNDS,
+    SFX_CHANNELS,
+    SFX_BASE_VOLUME,
+    SFX_OFFSCREEN_MARGIN,
+    SFX_RETRIGGER_MS,
+    SFX_CATEGORIES
+)
+
+
+class SoundBank:
+    """
+    Bank efektów dźwiękowych:
+    - każdy plik jest dekodowany tylko raz (przy starcie lub pierwszym użyciu),
+    - dźwięki grają na stałej puli kanałów miksera,
+    - każda kategoria ma limit jednoczesnych głosów i priorytet,
+    - przy braku wolnego kanału podkradany jest najstarszy głos
+      o najniższym priorytecie,
+    - dźwięki ze źródeł poza ekranem są pomijane,
+    - muted=True wycisza wszystko (np. symulacja bez dźwięku w tools/soak.py).
+    """
+
+    # kategoria -> plik lub folder z wariantami dźwięku
+    SOURCES = {
+        "player_shot": PLAYER_PROJECTILE_SOUND,
+        "enemy_shot": ENEMY_PROJECTILE_SOUND,
+        "enemy_hurt": ENEMY_HURT_SOUNDS,
+    }
+
+    def __init__(self, game):
+        self.game = game
+        self.sounds = {}
+        self.rng = random.Random()
+
+        pygame.mixer.set_num_channels(SFX_CHANNELS)
+        self.channels = [pygame.mixer.Channel(i) for i in range(SFX_CHANNELS)]
+        # Dla każdego kanału: (kategoria, priorytet, czas startu) lub None
+        self.voices = [None] * SFX_CHANNELS
+        self.muted = False
+
+        self.played = 0
+        self.stolen = 0
+        self.dropped = 0
+        self.offscreen = 0
+
+    def preload(self):
+        """
+        Dekoduje wszystkie efekty używane w grze.
+        """
+        for category, path in self.SOURCES.items():
+            if category not in self.sounds:
+                self.load(category, path)
+
+    def load(self, category, path):
+        """
+        Dekoduje plik lub wszystkie pliki WAV/OGG/MP3 z folderu
+        i przypisuje je do kategorii. Zwraca listę Sound.
+        """
+        if os.path.isdir(path):
+            paths = [
+                os.path.join(path, fn) for fn in sorted(os.listdir(path))
+                if fn.lower().endswith((".wav", ".ogg", ".mp3"))
+            ]
+        else:
+            paths = [path]
+
+        sounds = []
+        for p in paths:
+            try:
+                sounds.append(pygame.mixer.Sound(p))
+            except (pygame.error, FileNotFoundError):
+                print(f"Nie udało się załadować dźwięku: {p}")
+        self.sounds[category] = sounds
+        return sounds
+
+    def play(self, category, pos=None):
+        """
+        Odtwarza losowy dźwięk z kategorii.
+        pos — pozycja źródła w świecie; jeśli leży poza widokiem
+        (z marginesem), dźwięk jest pomijany.
+        Zwraca True, jeśli dźwięk został odtworzony.
+        """
+        if self.muted:
+            return False
+        with profiler.section("audio"):
+            return self._play(category, pos)
+
+    def _play(self, category, pos):
+        if pos is not None and not self._on_screen(pos):
+            self.offscreen += 1
+            return False
+
+        sounds = self.sounds.get(category)
+        if sounds is None:
+            sounds = self.load(category, self.SOURCES[category])
+        if not sounds:
+            return False
+
+        cap, priority = SFX_CATEGORIES.get(category, (SFX_CHANNELS, 0))
+        now = pygame.time.get_ticks()
+        idx = self._pick_channel(category, cap, priority, now)
+        if idx is None:
+            self.dropped += 1
+            return False
+
+        channel = self.channels[idx]
+        channel.set_volume(SFX_BASE_VOLUME * self.game.sfx_volume)
+        channel.play(self.rng.choice(sounds))
+        self.voices[idx] = (category, priority, now)
+        self.played += 1
+        return True
+
+    def _pick_channel(self, category, cap, priority, now):
+        # Zwalnia wpisy kanałów, które już skończyły grać
+        for i, ch in enumerate(self.channels):
+            if self.voices[i] is not None and not ch.get_busy():
+                self.voices[i] = None
+
+        # Limit kategorii: podkradamy jej najstarszy głos
+        own = [i for i, v in enumerate(self.voices) if v and v[0] == category]
+        if len(own) >= cap:
+            return self._steal(own, now)
+
+        for i, v in enumerate(self.voices):
+            if v is None:
+                return i
+
+        # Brak wolnych kanałów: najstarszy głos o najniższym priorytecie
+        lowest = min(v[1] for v in self.voices)
+        if lowest > priority:
+            return None
+        return self._steal([i for i, v in enumerate(self.voices) if v[1] == lowest], now)
+
+    def _steal(self, candidates, now):
+        idx = min(candidates, key=lambda i: self.voices[i][2])
+        # Nie ma sensu restartować głosu, który dopiero co wystartował
+        if now - self.voices[idx][2] < SFX_RETRIGGER_MS:
+            return None
+        self.channels[idx].stop()
+        self.stolen += 1
+        return idx
+
+    def _on_screen(self, pos):
+        vw = WIDTH / self.game.zoom
+        vh = HEIGHT / self.game.zoom
+        x = pos[0] - self.game.camera_offset[0]
+        y = pos[1] - self.game.camera_offset[1]
+        m = SFX_OFFSCREEN_MARGIN
+        return -m <= x <= vw + m and -m <= y <= vh + m
+
+    def play_music(self, path, loops=-1):
+        """
+        Ładuje i odtwarza muzykę w tle z aktualną głośnością.
+        """
+        if self.muted:
+            return
+        try:
+            pygame.mixer.music.load(path)
+            pygame.mixer.music.set_volume(self.game.music_volume)
+            pygame.mixer.music.play(loops)
+        except pygame.error as e:
+            print(f"Nie udało się załadować muzyki: {e}")
+
+    def stats(self):
+        """
+        Zwraca liczniki: odtworzone, podkradzione, odrzucone,
+        pominięte poza ekranem i aktualnie grające głosy.
+        """
+        return {
+            "played": self.played,
+            "stolen": self.stolen,
+            "dropped": self.dropped,
+            "offscreen": self.offscreen,
+            "active": sum(1 for ch in self.channels if ch.get_busy()),
+        }
@@ -0,0 +1,139 @@
+from collections import defaultdict
+
+import numpy as np
+
+from settings import SPATIAL_CELL_SIZE
+
+
+class SpatialHash:
+    """
+    Jednorodna siatka (spatial hash) do szybkiego wyszukiwania kolizji.
+    Każdy obiekt z atrybutem rect trafia do wszystkich komórek, które
+    pokrywa jego prostokąt; zapytania sprawdzają tylko sąsiednie komórki
+    zamiast wszystkich obiektów.
+    """
+
+    def __init__(self, cell_size=SPATIAL_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = defaultdict(list)
+        self.items = []
+        self.count = 0
+        self._flat = None
+
+    def clear(self):
+        self.cells.clear()
+        self.items.clear()
+        self.count = 0
+        self._flat = None
+
+    def _range(self, left, top, right, bottom):
+        cs = self.cell_size
+        return left // cs, top // cs, right // cs, bottom // cs
+
+    def insert(self, item):
+        """
+        Dodaje obiekt do wszystkich komórek pokrywanych przez item.rect.
+        """
+        r = item.rect
+        x0, y0, x1, y1 = self._range(r.left, r.top, r.right - 1, r.bottom - 1)
+        cells = self.cells
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                cells[(cx, cy)].append(item)
+        self.items.append(item)
+        self.count += 1
+        self._flat = None
+
+    def rebuild(self, items):
+        """
+        Czyści siatkę i wstawia wszystkie obiekty od nowa (raz na tick).
+        """
+        self.clear()
+        for item in items:
+            self.insert(item)
+
+    def _candidates(self, left, top, right, bottom):
+        x0, y0, x1, y1 = self._range(left, top, right, bottom)
+        if x0 == x1 and y0 == y1:
+            return self.cells.get((x0, y0), ())
+        seen = {}
+        cells = self.cells
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                for item in cells.get((cx, cy), ()):
+                    seen[id(item)] = item
+        return seen.values()
+
+    @staticmethod
+    def cell_key(cx, cy):
+        """
+        Koduje współrzędne komórki (liczby lub tablice NumPy) jako jeden
+        klucz int64.
+        """
+        return np.asarray(cx, dtype=np.int64) * (1 << 32) + cy
+
+    def flat(self):
+        """
+        Zwraca zawartość siatki jako tablice do sprawdzania hurtowego:
+        (posortowane klucze komórek, indeks obiektu dla każdego klucza,
+        prostokąty obiektów (k, 4) w kolejności wstawiania). Wynik jest
+        zapamiętywany do następnej zmiany siatki.
+        """
+        if self._flat is None:
+            index = {id(item): i for i, item in enumerate(self.items)}
+            keys, owners = [], []
+            for (cx, cy), items in self.cells.items():
+                key = int(self.cell_key(cx, cy))
+                for item in items:
+                    keys.append(key)
+                    owners.append(index[id(item)])
+            keys = np.asarray(keys, dtype=np.int64)
+            order = np.argsort(keys, kind="stable")
+            rects = np.array([tuple(item.rect) for item in self.items], dtype=float).reshape(-1, 4)
+            self._flat = keys[order], np.asarray(owners, dtype=np.intp)[order], rects
+        return self._flat
+
+    def query_rect(self, rect):
+        """
+        Zwraca listę obiektów, których rect koliduje z podanym prostokątem.
+        """
+        return [
+            item for item in self._candidates(rect.left, rect.top, rect.right - 1, rect.bottom - 1)
+            if rect.colliderect(item.rect)
+        ]
+
+    def query_point(self, pos):
+        """
+        Zwraca listę obiektów, których rect zawiera punkt pos.
+        """
+        x, y = int(pos[0]), int(pos[1])
+        return [
+            item for item in self.cells.get((x // self.cell_size, y // self.cell_size), ())
+            if item.rect.collidepoint(x, y)
+        ]
+
+    def query_radius(self, center, radius):
+        """
+        Zwraca listę obiektów, których rect przecina koło o środku center
+        i promieniu radius (np. dla efektów obszarowych).
+        """
+        x, y = center
+        found = []
+        for item in self._candidates(int(x - radius), int(y - radius), int(x + radius), int(y + radius)):
+            r = item.rect
+            # Najbliższy punkt prostokąta do środka koła
+            nx = min(max(x, r.left), r.right)
+            ny = min(max(y, r.top), r.bottom)
+            if (nx - x) ** 2 + (ny - y) ** 2 <= radius * radius:
+                found.append(item)
+        return found
+
+    def stats(self):
+        """
+        Zwraca liczbę obiektów, zajętych komórek i najdłuższą listę w komórce.
+        """
+        return {
+            "items": self.count,
+            "cells": len(self.cells),
+            "max_per_cell": max((len(v) for v in self.cells.values()), default=0),
+        }
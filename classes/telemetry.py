@@ -0,0 +1,130 @@
+import json
+import queue
+import threading
+import time
+
+from classes.profiler import profiler
+from settings import TELEMETRY_BATCH
+
+# Kolejność liczników w rekordzie klatki (patrz Game.entity_counts)
+COUNTS = ("enemies", "player_projectiles", "enemy_projectiles", "floating_texts", "chunks", "chunk_cache")
+
+
+class Telemetry:
+    """
+    Opcjonalny zapis telemetrii długich sesji do pliku tylko do dopisywania.
+    Każda linia to zwarta tablica JSON:
+    - ["H", wersja, {metadane}] — nagłówek (ziarno świata, liczniki),
+    - ["F", klatka, t_ms, ticki, ms_klatki, [liczniki], {sekcja: ms}] — klatka,
+    - ["E", klatka, t_ms, rodzaj, {dane}] — zdarzenie (spawn, kill,
+      boss, chunk...), przypisane do klatki, w której wystąpiło.
+    Czasy sekcji pochodzą z profilera, który telemetria włącza na czas
+    zapisu. Pętla gry tylko wkłada krotki do kolejki; serializację
+    i zapis na dysk robi wątek w tle, paczkami po TELEMETRY_BATCH.
+    Wyłączona telemetria kończy event() i frame() od razu.
+    """
+
+    VERSION = 1
+
+    def __init__(self):
+        self.active = False
+        self.queue = None
+        self.thread = None
+        self.frame_no = 0
+        self.start_time = 0.0
+        self.records = 0
+
+    def start(self, path, **meta):
+        """
+        Otwiera plik path do dopisywania i uruchamia wątek zapisu.
+        meta trafia do nagłówka (np. seed świata).
+        """
+        if self.active:
+            self.stop()
+        self.queue = queue.SimpleQueue()
+        self.frame_no = 0
+        self.records = 0
+        self.start_time = time.perf_counter()
+        meta.setdefault("counts", COUNTS)
+        meta.setdefault("started", time.time())
+        self.queue.put(("H", self.VERSION, meta))
+        self.thread = threading.Thread(target=self._writer, args=(path, self.queue),
+                                       name="telemetry", daemon=True)
+        self.thread.start()
+        self.active = True
+        profiler.request("telemetry")
+
+    def stop(self):
+        """
+        Zamyka zapis: wątek dopisuje resztę kolejki i zamyka plik.
+        """
+        if not self.active:
+            return
+        self.active = False
+        profiler.request("telemetry", False)
+        self.queue.put(None)
+        self.thread.join()
+        self.thread = None
+
+    def _now(self):
+        return round((time.perf_counter() - self.start_time) * 1000, 3)
+
+    def event(self, kind, **data):
+        """
+        Zapisuje zdarzenie kind z danymi data w bieżącej klatce.
+        """
+        if not self.active:
+            return
+        self.queue.put(("E", self.frame_no, self._now(), kind, data))
+
+    def frame(self, game):
+        """
+        Zapisuje zamkniętą klatkę: czas z profilera, ticki i liczniki obiektów.
+        Wywoływane z Game.run po profiler.end_frame().
+        """
+        if not self.active:
+            return
+        last = profiler.last
+        if last is not None:
+            frame_time, sections = last
+            profiler.last = None
+            counts = game.entity_counts()
+            self.queue.put(("F", self.frame_no, self._now(), game.ticks, frame_time,
+                            [counts[name] for name in COUNTS], sections))
+        self.frame_no += 1
+
+    def _writer(self, path, records):
+        # Wątek zapisu: serializuje rekordy i dopisuje je paczkami
+        with open(path, "a", encoding="utf-8") as f:
+            while True:
+                record = records.get()
+                batch = []
+                done = record is None
+                if not done:
+                    batch.append(record)
+                while not done and len(batch) < TELEMETRY_BATCH:
+                    try:
+                        record = records.get_nowait()
+                    except queue.Empty:
+                        break
+                    if record is None:
+                        done = True
+                    else:
+                        batch.append(record)
+                f.write("".join(self._encode(r) for r in batch))
+                f.flush()
+                self.records += len(batch)
+                if done:
+                    return
+
+    @staticmethod
+    def _encode(record):
+        if record[0] == "F":
+            kind, frame_no, t, ticks, frame_time, counts, sections = record
+            sections = {name: round(spent * 1000, 3) for name, spent in sections.items()}
+            record = (kind, frame_no, t, ticks, round(frame_time * 1000, 3), counts, sections)
+        return json.dumps(record, separators=(",", ":")) + "\n"
+
+
+# Jedna telemetria na cały proces
+telemetry = Telemetry()
@@ -0,0 +1,87 @@
+from collections import OrderedDict
+
+import pygame
+
+from classes.assets import assets
+from settings import FONT_PATH, GLYPH_CACHE_SIZE, TEXT_CACHE_SIZE
+
+
+class TextCache:
+    """
+    Cache krótkich napisów (np. liczb obrażeń):
+    - pojedyncze znaki są renderowane raz na (czcionka, rozmiar, kolor),
+    - napisy są składane z gotowych znaków kilkoma blitami,
+    - złożone napisy trafiają do ograniczonego cache LRU.
+    Oba cache mają stały limit wpisów, więc pamięć jest ograniczona.
+    """
+
+    def __init__(self, glyph_limit=GLYPH_CACHE_SIZE, text_limit=TEXT_CACHE_SIZE):
+        self.glyphs = OrderedDict()
+        self.texts = OrderedDict()
+        self.glyph_limit = glyph_limit
+        self.text_limit = text_limit
+
+        self.glyph_hits = 0
+        self.glyph_misses = 0
+        self.text_hits = 0
+        self.text_misses = 0
+
+    def render(self, text, color, font_path=FONT_PATH, size=16):
+        """
+        Zwraca nowy Surface z napisem text w kolorze color.
+        Wynik jest kopią, więc można mu bezpiecznie zmieniać alfę.
+        """
+        key = (font_path, size, tuple(color), text)
+        surf = self.texts.get(key)
+        if surf is not None:
+            self.text_hits += 1
+            self.texts.move_to_end(key)
+            return surf.copy()
+
+        self.text_misses += 1
+        glyphs = [self._glyph(font_path, size, color, ch) for ch in text]
+        w = sum(g.get_width() for g in glyphs)
+        h = max((g.get_height() for g in glyphs), default=0)
+        surf = pygame.Surface((max(1, w), max(1, h)), pygame.SRCALPHA)
+        x = 0
+        for g in glyphs:
+            # Znaki się nie nakładają, więc kopiujemy piksele razem z alfą
+            surf.blit(g, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            x += g.get_width()
+
+        self.texts[key] = surf
+        if len(self.texts) > self.text_limit:
+            self.texts.popitem(last=False)
+        return surf.copy()
+
+    def _glyph(self, font_path, size, color, ch):
+        key = (font_path, size, tuple(color), ch)
+        glyph = self.glyphs.get(key)
+        if glyph is not None:
+            self.glyph_hits += 1
+            self.glyphs.move_to_end(key)
+            return glyph
+
+        self.glyph_misses += 1
+        glyph = assets.font(font_path, size).render(ch, True, color).convert_alpha()
+        self.glyphs[key] = glyph
+        if len(self.glyphs) > self.glyph_limit:
+            self.glyphs.popitem(last=False)
+        return glyph
+
+    def stats(self):
+        """
+        Zwraca statystyki obu cache: trafienia, chybienia i liczbę wpisów.
+        """
+        return {
+            "glyph_hits": self.glyph_hits,
+            "glyph_misses": self.glyph_misses,
+            "glyphs": len(self.glyphs),
+            "text_hits": self.text_hits,
+            "text_misses": self.text_misses,
+            "texts": len(self.texts),
+        }
+
+
+# Jeden cache tekstu na cały proces
+text_cache = TextCache()
@@ -1,20 +1,90 @@
-import pygame
+import math
 import random
-from settings import TILE_SIZE, WIDTH, HEIGHT, GREEN, PURPLE
+import sys
+from collections import OrderedDict
+
+import pygame
+
+from classes.assets import assets
+from classes.chunk_gen import (
+    CHUNK_SIZE,
+    TILE_GRASS,
+    TILE_WATER,
+    TILE_BUSH,
+    TILE_OAK,
+    TILE_PINE,
+    generate_chunks
+)
+from classes.chunk_streamer import ChunkStreamer
+from classes.profiler import profiler
+from classes.telemetry import telemetry
+from classes.zoom_cache import zoomed
+from settings import TILE_SIZE, WIDTH, HEIGHT, GREEN, PURPLE, CHUNK_CACHE_BUDGET, CHUNK_KEEP_RADIUS
+
+CHUNK_PIXELS = CHUNK_SIZE * TILE_SIZE
+
+
+class ChunkSurfaceCache:
+    """
+    Cache LRU wypieczonych powierzchni chunków z limitem pamięci w bajtach.
+    Po przekroczeniu budżetu usuwane są najdawniej używane powierzchnie.
+    """
+
+    def __init__(self, budget=CHUNK_CACHE_BUDGET):
+        self.budget = budget
+        self.surfaces = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        surf = self.surfaces.get(key)
+        if surf is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.surfaces.move_to_end(key)
+        return surf
 
-CHUNK_SIZE = 16
+    def put(self, key, surf):
+        old = self.surfaces.pop(key, None)
+        if old is not None:
+            self.bytes -= self._size(old)
+        self.surfaces[key] = surf
+        self.bytes += self._size(surf)
+        # Zawsze zostawiamy przynajmniej właśnie dodaną powierzchnię
+        while self.bytes > self.budget and len(self.surfaces) > 1:
+            _, evicted = self.surfaces.popitem(last=False)
+            self.bytes -= self._size(evicted)
+            self.evictions += 1
 
-MAX_TREE_CLUSTERS = 3
-CLUSTER_MIN_RADIUS = 2
-CLUSTER_MAX_RADIUS = 4
-CLUSTER_MIN_TREES = 5
-CLUSTER_MAX_TREES = 10
+    def discard(self, key):
+        surf = self.surfaces.pop(key, None)
+        if surf is not None:
+            self.bytes -= self._size(surf)
 
-POND_CHANCE = 0.15
-POND_MIN_RADIUS = 2
-POND_MAX_RADIUS = 4
+    def clear(self):
+        self.surfaces.clear()
+        self.bytes = 0
 
-BUSH_CHANCE = 0.05
+    @staticmethod
+    def _size(surf):
+        w, h = surf.get_size()
+        return w * h * surf.get_bytesize()
+
+    def stats(self):
+        """
+        Zwraca liczniki trafień, chybień, usunięć oraz zajętość pamięci.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self.surfaces),
+            "bytes": self.bytes,
+            "budget": self.budget,
+        }
 
 
 class World:
@@ -27,12 +97,18 @@ class World:
         """
         Inicjalizuje świat:
         - przechowuje referencję do gry i ziarno losowania,
-        - przygotowuje cache chunków,
+        - przygotowuje cache chunków, ich wypieczonych powierzchni
+          i strumieniowanie w tle,
         - ładuje kafelki trawy, drzew, krzaków i wody.
         """
         self.game = game
         self.seed = seed if seed is not None else random.randrange(2 ** 32)
         self.chunks = {}
+        self.baked = ChunkSurfaceCache()
+        self.streamer = ChunkStreamer(self)
+        self.placeholder = None
+        # Chunki narysowane jako sama trawa, do podmiany po wygenerowaniu
+        self.placeholders = set()
 
         self.grass = self._load_tile("assets/images/tiles/tile_grass.png", GREEN)
         self.tree = self._load_tile("assets/images/tiles/tile_oak_tree.png", GREEN)
@@ -41,112 +117,221 @@ class World:
         self.water = self._load_tile("assets/images/tiles/tile_water.png", GREEN)
         self.floor = self._load_tile("assets/images/tiles/tile_purple.png", PURPLE)
         self.wall  = self._load_tile("assets/images/tiles/tile_wall.png",   PURPLE)
+        self.tiles = {
+            TILE_WATER: self.water,
+            TILE_BUSH: self.bush,
+            TILE_OAK: self.tree,
+            TILE_PINE: self.pine,
+        }
 
     def _load_tile(self, path, fallback_color):
         """
-        Wczytuje i skaluje kafelek do rozmiaru TILE_SIZE.
+        Pobiera z rejestru grafik kafelek przeskalowany do rozmiaru TILE_SIZE.
         """
-        try:
-            img = pygame.image.load(path).convert_alpha()
-            return pygame.transform.scale(img, (TILE_SIZE, TILE_SIZE))
-        except Exception:
-            surf = pygame.Surface((TILE_SIZE, TILE_SIZE))
-            surf.fill(fallback_color)
-            return surf
+        return assets.image(path, (TILE_SIZE, TILE_SIZE), fallback_color=fallback_color)
+
+    def generate(self, cx, cy):
+        """
+        Zwraca siatkę chunka dla ziarna tego świata (bez zapisu do cache).
+        """
+        return self.generate_many([(cx, cy)])[(cx, cy)]
+
+    def generate_many(self, keys):
+        """
+        Generuje wektorowo paczkę chunków; zwraca słownik (cx, cy) -> siatka.
+        """
+        grids = generate_chunks(self.seed, keys)
+        return {key: bytearray(grid.tobytes()) for key, grid in zip(keys, grids)}
 
     def _make_chunk(self, cx, cy):
         """
-        Generuje i zapisuje do cache listy pozycji:
-        - drzew w kilku kępkach,
-        - nieregularnego stawu,
-        - losowo rozsianych krzaków.
-        """
-        rnd = random.Random((cx * 341873128712 + cy * 132897987541 + self.seed) & 0xFFFFFFFF)
-
-        trees = []
-        clusters = rnd.randint(1, MAX_TREE_CLUSTERS)
-        for _ in range(clusters):
-            base_x = cx * CHUNK_SIZE + rnd.randrange(CHUNK_SIZE)
-            base_y = cy * CHUNK_SIZE + rnd.randrange(CHUNK_SIZE)
-            count = rnd.randint(CLUSTER_MIN_TREES, CLUSTER_MAX_TREES)
-            radius = rnd.randint(CLUSTER_MIN_RADIUS, CLUSTER_MAX_RADIUS)
-            for __ in range(count):
-                dx = rnd.randint(-radius, radius)
-                dy = rnd.randint(-radius, radius)
-                trees.append((base_x + dx, base_y + dy))
-
-        ponds = []
-        if rnd.random() < POND_CHANCE:
-            cx0 = cx * CHUNK_SIZE
-            cy0 = cy * CHUNK_SIZE
-            center_x = cx0 + rnd.randrange(CHUNK_SIZE)
-            center_y = cy0 + rnd.randrange(CHUNK_SIZE)
-            radius = rnd.randint(POND_MIN_RADIUS, POND_MAX_RADIUS)
-            for dx in range(-radius, radius + 1):
-                for dy in range(-radius, radius + 1):
-                    dist2 = dx * dx + dy * dy
-                    if dist2 <= radius * radius:
-                        noise = rnd.uniform(0.6, 1.3)
-                        if dist2 <= (radius * noise) ** 2:
-                            ponds.append((center_x + dx, center_y + dy))
-
-        bushes = []
-        rnd_b = random.Random((cx * 1610612741 + cy * 805306457 + self.seed + 7) & 0xFFFFFFFF)
-        x0, y0 = cx * CHUNK_SIZE, cy * CHUNK_SIZE
-        for tx in range(x0, x0 + CHUNK_SIZE):
-            for ty in range(y0, y0 + CHUNK_SIZE):
-                if rnd_b.random() < BUSH_CHANCE and (tx, ty) not in ponds:
-                    bushes.append((tx, ty))
-
-        self.chunks[(cx, cy)] = {
-            'trees': trees,
-            'ponds': ponds,
-            'bushes': bushes
+        Synchronicznie generuje chunk i zapisuje go do cache.
+        """
+        with profiler.section("make_chunk"):
+            self.chunks[(cx, cy)] = self.generate(cx, cy)
+        telemetry.event("chunk", cx=cx, cy=cy, sync=True)
+
+    def tile_at(self, tx, ty):
+        """
+        Zwraca typ kafelka (TILE_*) na pozycji (tx, ty) w czasie O(1)
+        lub None, jeśli chunk nie jest jeszcze wygenerowany.
+        """
+        grid = self.chunks.get((tx // CHUNK_SIZE, ty // CHUNK_SIZE))
+        if grid is None:
+            return None
+        return grid[(ty % CHUNK_SIZE) * CHUNK_SIZE + tx % CHUNK_SIZE]
+
+    def evict_far(self, center, radius=CHUNK_KEEP_RADIUS):
+        """
+        Usuwa z pamięci chunki dalsze niż radius chunków od center=(cx, cy).
+        Można je w każdej chwili odtworzyć z ziarna. Zwraca liczbę usuniętych.
+        """
+        ccx, ccy = center
+        far = [
+            key for key in self.chunks
+            if abs(key[0] - ccx) > radius or abs(key[1] - ccy) > radius
+        ]
+        for key in far:
+            del self.chunks[key]
+            self.baked.discard(key)
+        self.placeholders = {
+            key for key in self.placeholders
+            if abs(key[0] - ccx) <= radius and abs(key[1] - ccy) <= radius
         }
+        return len(far)
 
-    def draw(self, surf, cam_off):
+    def memory_usage(self):
         """
-        Rysuje kafelki w widocznym obszarze:
-        - trawę na całym obszarze,
-        - stawy, krzaki i drzewa na bazie wygenerowanych chunków.
+        Zwraca zużycie pamięci przez dane chunków:
+        bajty na chunk, liczbę chunków i sumę (razem z wypieczonymi powierzchniami).
+        """
+        per_chunk = sys.getsizeof(bytearray(CHUNK_SIZE * CHUNK_SIZE))
+        grids = sum(sys.getsizeof(g) for g in self.chunks.values())
+        return {
+            "chunks": len(self.chunks),
+            "bytes_per_chunk": per_chunk,
+            "grid_bytes": grids,
+            "surface_bytes": self.baked.bytes,
+            "total_bytes": grids + sys.getsizeof(self.chunks) + self.baked.bytes,
+        }
+
+    def update(self, cam_off, vel, zoom=1.0):
+        """
+        Przekazuje pozycję kamery, prędkość gracza i zoom do strumieniowania chunków.
+        """
+        self.streamer.update(cam_off, vel, zoom)
+
+    def visible_chunks(self, cam_off):
+        """
+        Zwraca zakres (cx0, cy0, cx1, cy1) chunków widocznych z kamery.
         """
         sx = cam_off[0] // TILE_SIZE
         sy = cam_off[1] // TILE_SIZE
         ex = (cam_off[0] + WIDTH - 1) // TILE_SIZE
         ey = (cam_off[1] + HEIGHT - 1) // TILE_SIZE
+        return sx // CHUNK_SIZE, sy // CHUNK_SIZE, ex // CHUNK_SIZE, ey // CHUNK_SIZE
+
+    def bake_chunk(self, cx, cy):
+        """
+        Renderuje cały chunk z jego siatki do jednej powierzchni:
+        trawa pod każdym kafelkiem, a na niej woda, krzak lub drzewo.
+        """
+        grid = self.chunks.get((cx, cy))
+        if grid is None:
+            self._make_chunk(cx, cy)
+            grid = self.chunks[(cx, cy)]
+
+        with profiler.section("bake_chunk"):
+            surf = pygame.Surface((CHUNK_PIXELS, CHUNK_PIXELS)).convert()
+            surf.blit(self._placeholder(), (0, 0))
+            for i, kind in enumerate(grid):
+                if kind != TILE_GRASS:
+                    ly, lx = divmod(i, CHUNK_SIZE)
+                    surf.blit(self.tiles[kind], (lx * TILE_SIZE, ly * TILE_SIZE))
 
-        for ty in range(sy, ey + 1):
-            for tx in range(sx, ex + 1):
-                px = tx * TILE_SIZE - cam_off[0]
-                py = ty * TILE_SIZE - cam_off[1]
-                surf.blit(self.grass, (px, py))
+        self.baked.put((cx, cy), surf)
+        return surf
 
-        cx0 = sx // CHUNK_SIZE
-        cy0 = sy // CHUNK_SIZE
-        cx1 = ex // CHUNK_SIZE
-        cy1 = ey // CHUNK_SIZE
+    def draw(self, surf, cam_off, area=None, zoom=1.0):
+        """
+        Rysuje widoczny obszar świata jako kilka blitów
+        wypieczonych powierzchni chunków (trawa, stawy, krzaki i drzewa).
+        area — opcjonalny prostokąt na surf, do którego ograniczamy
+        rysowanie (np. pas odsłonięty po przewinięciu warstwy świata).
+        Przy zoomie innym niż 1.0 cam_off jest w pikselach ekranu
+        (pozycja w świecie × zoom), a świat rysujemy z kafelków
+        przeskalowanych raz na poziom zoomu.
+        Chunki, których dane nie są jeszcze gotowe, są zlecane do
+        wygenerowania w tle, a w ich miejscu rysowana jest sama trawa.
+        """
+        if area is None:
+            area = surf.get_rect()
+        if zoom != 1.0:
+            self._draw_tiles(surf, cam_off, area, zoom)
+            return
+        ox, oy = cam_off[0] + area.left, cam_off[1] + area.top
+        cx0, cy0 = ox // CHUNK_PIXELS, oy // CHUNK_PIXELS
+        cx1 = (ox + area.width - 1) // CHUNK_PIXELS
+        cy1 = (oy + area.height - 1) // CHUNK_PIXELS
+        self.streamer.poll()
 
         for cy in range(cy0, cy1 + 1):
             for cx in range(cx0, cx1 + 1):
-                if (cx, cy) not in self.chunks:
-                    self._make_chunk(cx, cy)
-                data = self.chunks[(cx, cy)]
-
-                for tx, ty in data['ponds']:
-                    if sx <= tx <= ex and sy <= ty <= ey:
-                        surf.blit(self.water, (tx * TILE_SIZE - cam_off[0],
-                                               ty * TILE_SIZE - cam_off[1]))
-
-                for tx, ty in data['bushes']:
-                    if sx <= tx <= ex and sy <= ty <= ey:
-                        surf.blit(self.bush, (tx * TILE_SIZE - cam_off[0],
-                                              ty * TILE_SIZE - cam_off[1]))
-
-                for tx, ty in data['trees']:
-                    if (tx, ty) in data['ponds']:
-                        continue
-                    if sx <= tx <= ex and sy <= ty <= ey:
-                        px = tx * TILE_SIZE - cam_off[0]
-                        py = ty * TILE_SIZE - cam_off[1]
-                        tile = self.pine if ((tx + ty + self.seed) & 1) == 0 else self.tree
-                        surf.blit(tile, (px, py))
\ No newline at end of file
+                chunk_surf = self.baked.get((cx, cy))
+                if chunk_surf is None:
+                    if (cx, cy) in self.chunks:
+                        chunk_surf = self.bake_chunk(cx, cy)
+                    else:
+                        self.streamer.request((cx, cy))
+                        self.placeholders.add((cx, cy))
+                        chunk_surf = self._placeholder()
+                # Z chunka kopiujemy tylko część, która wpada w area
+                x = cx * CHUNK_PIXELS - cam_off[0]
+                y = cy * CHUNK_PIXELS - cam_off[1]
+                part = area.clip((x, y, CHUNK_PIXELS, CHUNK_PIXELS))
+                surf.blit(chunk_surf, part.topleft, part.move(-x, -y))
+        self.streamer.flush()
+
+    def _draw_tiles(self, surf, cam_off, area, zoom):
+        # Rysowanie kafelek po kafelku w skali ekranu (zoom != 1.0)
+        step = TILE_SIZE * zoom
+        ox, oy = cam_off[0] + area.left, cam_off[1] + area.top
+        # Piksel p należy do ostatniego kafelka t z floor(t * step) <= p
+        tx0, ty0 = math.ceil((ox + 1) / step) - 1, math.ceil((oy + 1) / step) - 1
+        tx1 = math.ceil((ox + area.width) / step) - 1
+        ty1 = math.ceil((oy + area.height) / step) - 1
+        grass = zoomed.tile(self.grass, TILE_SIZE)
+        tiles = {kind: zoomed.tile(img, TILE_SIZE) for kind, img in self.tiles.items()}
+        self.streamer.poll()
+
+        clip = surf.get_clip()
+        surf.set_clip(area)
+        for ty in range(ty0, ty1 + 1):
+            py = math.floor(ty * step) - cam_off[1]
+            for tx in range(tx0, tx1 + 1):
+                px = math.floor(tx * step) - cam_off[0]
+                surf.blit(grass, (px, py))
+                kind = self.tile_at(tx, ty)
+                if kind is None:
+                    key = (tx // CHUNK_SIZE, ty // CHUNK_SIZE)
+                    self.streamer.request(key)
+                    self.placeholders.add(key)
+                elif kind != TILE_GRASS:
+                    surf.blit(tiles[kind], (px, py))
+        surf.set_clip(clip)
+        self.streamer.flush()
+
+    def ready_placeholders(self, cam_off, zoom=1.0):
+        """
+        Zwraca prostokąty (we współrzędnych widoku) chunków narysowanych
+        wcześniej jako sama trawa, których dane są już gotowe.
+        Takie chunki trzeba dorysować na trwałej warstwie świata.
+        """
+        ready = [key for key in self.placeholders if key in self.chunks]
+        rects = []
+        size = math.ceil(CHUNK_PIXELS * zoom)
+        for cx, cy in ready:
+            self.placeholders.discard((cx, cy))
+            rects.append(pygame.Rect(math.floor(cx * CHUNK_PIXELS * zoom) - cam_off[0],
+                                     math.floor(cy * CHUNK_PIXELS * zoom) - cam_off[1],
+                                     size, size))
+        return rects
+
+    def _placeholder(self):
+        """
+        Zwraca wspólną powierzchnię chunka wypełnioną samą trawą.
+        """
+        if self.placeholder is None:
+            self.placeholder = pygame.Surface((CHUNK_PIXELS, CHUNK_PIXELS)).convert()
+            for ty in range(CHUNK_SIZE):
+                for tx in range(CHUNK_SIZE):
+                    self.placeholder.blit(self.grass, (tx * TILE_SIZE, ty * TILE_SIZE))
+        return self.placeholder
+
+    def cache_stats(self):
+        """
+        Zwraca statystyki cache wypieczonych chunków i strumieniowania.
+        """
+        stats = self.baked.stats()
+        stats.update(self.streamer.stats())
+        return stats
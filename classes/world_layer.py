@@ -0,0 +1,100 @@
+import pygame
+
+from settings import BLACK
+
+
+class WorldLayer:
+    """
+    Trwała powierzchnia z narysowanym światem (lub areną bossa).
+    Zamiast rysować cały widok co klatkę, przewija poprzednią zawartość
+    o przesunięcie kamery (Surface.scroll) i dorysowuje tylko odsłonięte
+    pasy, więc koszt zależy od prędkości kamery, a nie od rozmiaru widoku.
+    Pełne przerysowanie następuje po zmianie źródła (np. wejście na arenę),
+    rozmiaru widoku lub zoomu, skoku kamery o cały ekran lub invalidate().
+    """
+
+    def __init__(self):
+        self.surface = None
+        self.source = None
+        self.cam = None
+        self.zoom = 1.0
+
+        self.full_redraws = 0
+        self.patched_pixels = 0
+
+    def invalidate(self):
+        """
+        Wymusza pełne przerysowanie przy następnym render().
+        """
+        self.cam = None
+
+    def render(self, source, cam_off, size, zoom=1.0):
+        """
+        Zwraca powierzchnię size=(w, h) ze światem source widzianym
+        z kamery cam_off (w pikselach ekranu, czyli świat × zoom).
+        Powierzchnia jest współdzielona — nie wolno po niej rysować
+        sprite'ów.
+        """
+        w, h = size
+        cam = (int(cam_off[0]), int(cam_off[1]))
+        if self.surface is None or self.surface.get_size() != (w, h):
+            self.surface = pygame.Surface((w, h)).convert()
+            self.cam = None
+
+        if source is not self.source or zoom != self.zoom or self.cam is None:
+            self.source = source
+            self.zoom = zoom
+            self._full(cam)
+            return self.surface
+
+        dx = cam[0] - self.cam[0]
+        dy = cam[1] - self.cam[1]
+        if abs(dx) >= w or abs(dy) >= h:
+            self._full(cam)
+            return self.surface
+
+        self.cam = cam
+        strips = []
+        if dx or dy:
+            self.surface.scroll(-dx, -dy)
+            # Pas pionowy po stronie, z której wjeżdża nowy obszar
+            if dx > 0:
+                strips.append(pygame.Rect(w - dx, 0, dx, h))
+            elif dx < 0:
+                strips.append(pygame.Rect(0, 0, -dx, h))
+            # Pas poziomy (róg pokrywa się z pionowym, to nie szkodzi)
+            if dy > 0:
+                strips.append(pygame.Rect(0, h - dy, w, dy))
+            elif dy < 0:
+                strips.append(pygame.Rect(0, 0, w, -dy))
+
+        # Chunki narysowane wcześniej jako sama trawa, które są już gotowe
+        bounds = self.surface.get_rect()
+        for rect in source.ready_placeholders(cam, zoom):
+            rect = rect.clip(bounds)
+            if rect.width and rect.height:
+                strips.append(rect)
+
+        for rect in strips:
+            self._patch(rect)
+        return self.surface
+
+    def _full(self, cam):
+        self.cam = cam
+        self.full_redraws += 1
+        self.source.placeholders.clear()
+        self._patch(self.surface.get_rect())
+
+    def _patch(self, rect):
+        self.surface.fill(BLACK, rect)
+        self.source.draw(self.surface, self.cam, rect, self.zoom)
+        self.patched_pixels += rect.width * rect.height
+
+    def stats(self):
+        """
+        Zwraca liczbę pełnych przerysowań i sumę dorysowanych pikseli.
+        """
+        return {
+            "full_redraws": self.full_redraws,
+            "patched_pixels": self.patched_pixels,
+        }
@@ -0,0 +1,85 @@
+import math
+import weakref
+
+import pygame
+
+from classes.profiler import profiler
+
+
+class ZoomCache:
+    """
+    Cache grafik przeskalowanych do bieżącego zoomu.
+    Przy zoomie innym niż 1.0 gra rysuje od razu w rozdzielczości ekranu,
+    więc każdą grafikę skalujemy raz na poziom zoomu, a nie całą klatkę
+    co klatkę. Zmiana zoomu (SettingsMenu) czyści cache.
+    Wpisy są słabymi referencjami do oryginałów, więc grafiki usunięte
+    z gry znikają też stąd.
+    """
+
+    def __init__(self):
+        self.zoom = 1.0
+        self.surfaces = weakref.WeakKeyDictionary()
+        self.tiles = {}
+        self.hits = 0
+        self.misses = 0
+
+    def set_zoom(self, zoom):
+        """
+        Ustawia poziom zoomu; przy zmianie czyści przeskalowane grafiki.
+        """
+        if zoom != self.zoom:
+            self.zoom = zoom
+            self.surfaces.clear()
+            self.tiles.clear()
+
+    def scale(self, surf):
+        """
+        Zwraca surf przeskalowany o bieżący zoom (przy 1.0 — ten sam obiekt).
+        """
+        if self.zoom == 1.0:
+            return surf
+        scaled = self.surfaces.get(surf)
+        if scaled is not None:
+            self.hits += 1
+            return scaled
+        self.misses += 1
+        w, h = surf.get_size()
+        scaled = self._resize(surf, (max(1, round(w * self.zoom)), max(1, round(h * self.zoom))))
+        self.surfaces[surf] = scaled
+        return scaled
+
+    def tile(self, surf, size):
+        """
+        Zwraca kafelek o boku size przeskalowany o zoom i zaokrąglony
+        w górę, żeby sąsiednie kafelki nie zostawiały szczelin.
+        """
+        if self.zoom == 1.0:
+            return surf
+        key = (id(surf), size)
+        scaled = self.tiles.get(key)
+        if scaled is None:
+            n = math.ceil(size * self.zoom)
+            scaled = self._resize(surf, (n, n))
+            self.tiles[key] = scaled
+        return scaled
+
+    @staticmethod
+    def _resize(surf, size):
+        # smoothscale obsługuje tylko powierzchnie 24/32-bitowe
+        with profiler.section("smoothscale"):
+            if surf.get_bitsize() in (24, 32):
+                return pygame.transform.smoothscale(surf, size)
+            return pygame.transform.scale(surf, size)
+
+    def stats(self):
+        return {
+            "zoom": self.zoom,
+            "surfaces": len(self.surfaces),
+            "tiles": len(self.tiles),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Jeden cache zoomu na cały proces
+zoomed = ZoomCache()
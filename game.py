@@ -1,16 +1,27 @@
 import random
-import sys
 
 import pygame
 
+from classes.assets import assets
 from classes.boss import Boss
 from classes.boss_arena import BossArena
 from classes.enemy import Enemy
+from classes.enemy_population import EnemyPopulation
 from classes.player import Player
+from classes.profiler import profiler
+from classes.projectile_system import ProjectileSystem
+from classes.sound_bank import SoundBank
+from classes.spatial_hash import SpatialHash
+from classes.telemetry import telemetry
 from classes.world import World
+from classes.world_layer import WorldLayer
+from classes.zoom_cache import zoomed
 from settings import *
+from ui.hud import Hud
 from ui.pause_menu import PauseMenu
 from ui.portal import Portal
+from ui.profiler_overlay import ProfilerOverlay
+from ui.scenes import GameplayScene, MenuScene, EndScene, game_over_screen, victory_screen
 from ui.settings_menu import SettingsMenu
 from ui.spritesheet import SpriteSheet
 
@@ -19,9 +30,11 @@ class Game:
     """
     Zarządza stanem gry: pętlą główną, obsługą wydarzeń,
     aktualizacją, rysowaniem oraz ekranami pauzy i ustawień.
+    seed ustala ziarno generatora świata (np. w benchmarku),
+    a bez niego świat jest losowy.
     """
 
-    def __init__(self):
+    def __init__(self, seed=None):
         # Inicjalizacja gry
         pygame.init()
         pygame.mixer.init()
@@ -29,46 +42,84 @@ class Game:
         # Ustawienie okna gry
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption(TITLE)
-        self.font = pygame.font.Font("assets/fonts/PressStart2P.ttf", 16)
+        self.font = assets.font(FONT_PATH, 16)
         self.clock = pygame.time.Clock()
         self.running = True
 
-        # Ustawienie stanu gry po rozpoczęciu
-        self.paused = True
-        self.in_settings = False
+        # Zegar symulacji: stały krok niezależny od FPS rysowania.
+        # now to czas gry w ms liczony z ticków, a alpha to ułamek
+        # następnego ticku, o który interpolujemy rysowanie.
+        self.tick_ms = 1000 / SIM_RATE
+        self.ticks = 0
+        self.now = 0
+        self.accumulator = 0.0
+        self.alpha = 1.0
+        self.pending_shots = []
+        # Akcje z eventów wykonywane w najbliższym ticku (np. wejście do portalu)
+        self.pending_actions = []
+        # Kierunek ruchu podstawiony przez skrypt zamiast klawiatury (patrz movement)
+        self.scripted_move = None
+        # Nagrywanie lub odtwarzanie wejścia (classes/replay.py)
+        self.tape = None
+
+        # Zamrożona klatka gry pod menu pauzy i ustawień
+        self.backdrop = None
+        self.menu_rect = None
+        self.menu_dirty = True
+
+        # Stos scen: rozgrywka, a nad nią menu pauzy / ustawień lub ekran końca.
+        # Gra startuje z menu pauzy.
         self.pause_menu = PauseMenu(self)
         self.settings_menu = SettingsMenu(self)
+        self.gameplay = GameplayScene(self)
+        self.pause_scene = MenuScene(self, self.pause_menu)
+        self.settings_scene = MenuScene(self, self.settings_menu)
+        self.scenes = [self.gameplay, self.pause_scene]
+        # Ekrany końca gry renderowane raz, przy pierwszym użyciu
+        self.end_screens = {}
 
         # Ustawienia
         self.music_volume = 0.2
         self.sfx_volume = 0.2
         self.zoom = 1.0
+        zoomed.set_zoom(self.zoom)
         self.btn_text_scale = 0.3
         self.settings_items = ["Music Volume", "SFX Volume", "Zoom"]
         self.settings_index = 0
 
-        # Kamera
+        # Kamera (i jej pozycja z poprzedniego ticku do interpolacji)
         self.camera_offset = [0, 0]
+        self.prev_camera = [0, 0]
 
-        # Włączenie muzyki w tle
-        pygame.mixer.music.load("assets/sounds/background_music.wav")
-        pygame.mixer.music.set_volume(self.music_volume)
-        pygame.mixer.music.play(-1)
+        # Bank efektów dźwiękowych i muzyka w tle
+        self.sounds = SoundBank(self)
+        self.sounds.preload()
+        self.sounds.play_music("assets/sounds/background_music.wav")
 
         # Inicjalizacja spriteów do animacji
         self.all_sprites = pygame.sprite.Group()
         self.enemies = pygame.sprite.Group()
-        self.player_projectiles = pygame.sprite.Group()
-        self.enemy_projectiles = pygame.sprite.Group()
         self.floating_texts = pygame.sprite.Group()
 
+        # Pociski gracza i wrogów trzymane w tablicach NumPy
+        self.projectiles = ProjectileSystem(self)
+
+        # Ruch i strzały zwykłych wrogów liczone hurtowo
+        self.enemy_population = EnemyPopulation(self)
+
+        # Siatka kolizji wrogów (spatial hash) budowana od nowa co tick
+        self.enemy_grid = SpatialHash()
+
         # Ustawienie świata i gracza
-        self.world = World(self)
+        self.world = World(self, seed)
+        # Trwała warstwa świata przewijana za kamerą
+        self.world_layer = WorldLayer()
         self.player = Player(WIDTH // 2, HEIGHT // 2, self)
         self.all_sprites.add(self.player)
 
         # Ustawienie stanu bossa na nieaktywny przy rozpoczęciu gry
         self.boss_active = False
+        self.boss = None
         self.portal_active = False
         self.portal_rect = None
         self.boss_room = False
@@ -77,7 +128,7 @@ class Game:
 
         # Ustawienie satystyk do spawny przeciwników
         self.score = 0
-        self.last_spawn = pygame.time.get_ticks()
+        self.last_spawn = self.now
         self.spawn_rate = SPAWN_RATE
 
         # Ustawienie ramki ze scorem
@@ -85,6 +136,12 @@ class Game:
         self.score_bg_orig = sheet.image_at((8, 105, 47, 15))
         self.skull_orig = sheet.image_at((130, 66, 27, 28))
 
+        # HUD przerysowywany tylko po zmianie scoru / życia bossa
+        self.hud = Hud(self, self.score_bg_orig, self.skull_orig)
+        # Nakładka profilera pod F3
+        self.profiler_overlay = ProfilerOverlay(self)
+        self.show_profiler = False
+
     def new(self):
         """
         Resetuje stan gry: usuwa sprite’y i przywraca gracza.
@@ -93,85 +150,220 @@ class Game:
         self.portal_rect = None
         self.boss_room = False
         self.boss_active = False
+        self.boss = None
         self.boss_arena = None
 
         self.all_sprites.empty()
         self.enemies.empty()
-        self.player_projectiles.empty()
-        self.enemy_projectiles.empty()
+        self.enemy_population.clear()
+        self.projectiles.clear()
         self.floating_texts.empty()
 
         self.player = Player(WIDTH // 2, HEIGHT // 2, self)
         self.all_sprites.add(self.player)
+        self.pending_shots.clear()
+        self.pending_actions.clear()
+        self._update_camera(snap=True)
+        self.world_layer.invalidate()
 
         self.score = 0
-        self.last_spawn = pygame.time.get_ticks()
+        self.last_spawn = self.now
 
     def run(self):
         """
-        Główna pętla gry: tick, eventy, update, draw.
+        Główna pętla gry: eventy, stałe ticki symulacji, draw.
+        Symulacja idzie krokami 1/SIM_RATE s niezależnie od FPS;
+        czas klatki trafia do akumulatora, z którego zdejmujemy
+        pełne ticki, a resztę wykorzystuje interpolacja rysowania.
+        Każdą klatkę obsługuje scena z wierzchu stosu; w menu i na
+        ekranach końca, gdy gracz nic nie robi, pętla czeka na eventy
+        najwyżej 1/IDLE_FPS s (pierwszy event budzi ją od razu),
+        a przez IDLE_WAKE_MS po wejściu działa w tempie FPS. Czas pauzy
+        nie trafia do akumulatora.
         """
         while self.running:
-            self.clock.tick(FPS)
-            self.handle_events()
-            if not self.paused:
-                self.update()
-            self.draw()
+            first = None
+            if self.scene.quiet:
+                first = pygame.event.wait(1000 // IDLE_FPS)
+                frame_ms = self.clock.tick()
+            else:
+                frame_ms = self.clock.tick(FPS)
+            profiler.begin_frame()
+            with profiler.section("events"):
+                self.handle_events(first)
+            with profiler.section("update"):
+                self.scene.update(frame_ms)
+            with profiler.section("draw"):
+                self.draw()
+            profiler.end_frame()
+            telemetry.frame(self)
+        self.world.streamer.shutdown()
+
+    @property
+    def scene(self):
+        return self.scenes[-1]
+
+    @property
+    def paused(self):
+        """
+        True, gdy nad rozgrywką jest inna scena (menu lub ekran końca).
+        """
+        return self.scene is not self.gameplay
+
+    @property
+    def in_settings(self):
+        return self.scene is self.settings_scene
+
+    def push_scene(self, scene):
+        self.scenes.append(scene)
+        scene.wake()
+        scene.enter()
 
-    def handle_events(self):
+    def pop_scene(self):
+        self.scenes.pop()
+        self.scene.wake()
+        self.scene.enter()
+
+    def pause(self):
+        if not self.paused:
+            self.push_scene(self.pause_scene)
+
+    def resume(self):
         """
-        Kontroluje eventy, przechodzi:
-        - do ustawień, jeśli in_settings,
-        - do pauzy, jeśli paused,
-        - lub do rozgrywki.
+        Zamyka wszystkie sceny nad rozgrywką.
         """
-        for event in pygame.event.get():
+        del self.scenes[1:]
+        self.gameplay.enter()
+
+    def open_settings(self):
+        self.push_scene(self.settings_scene)
+
+    def close_settings(self):
+        if self.in_settings:
+            self.pop_scene()
+
+    def advance(self, frame_ms):
+        """
+        Wykonuje tyle ticków, ile mieści się w zgromadzonym czasie,
+        najwyżej MAX_TICKS_PER_FRAME. Po dłuższym przestoju nie
+        nadrabiamy zaległości (gra zwalnia zamiast "spirali śmierci").
+        """
+        self.accumulator += frame_ms
+        steps = 0
+        while self.accumulator >= self.tick_ms and self.running and not self.paused:
+            if steps == MAX_TICKS_PER_FRAME:
+                self.accumulator = 0.0
+                break
+            self.update()
+            self.accumulator -= self.tick_ms
+            steps += 1
+        self.alpha = min(1.0, self.accumulator / self.tick_ms)
+
+    def handle_events(self, first=None):
+        """
+        Kontroluje eventy: zamknięcie okna kończy grę, a resztę
+        dostaje scena z wierzchu stosu (rozgrywka, menu lub ekran końca),
+        która po każdym wejściu budzi się do pełnego tempa.
+        first — event odebrany już przez pygame.event.wait w run().
+        """
+        events = pygame.event.get()
+        if first is not None and first.type != pygame.NOEVENT:
+            events.insert(0, first)
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
-            elif self.in_settings:
-                self.settings_menu.handle_event(event)
-            elif self.paused:
-                self.pause_menu.handle_event(event)
             else:
-                self._handle_game_event(event)
+                self.scene.wake()
+                self.scene.handle_event(event)
 
     def _handle_game_event(self, event):
         """
         Obsługuje eventy podczas gry:
         - ESC → pauza,
+        - F3 → nakładka profilera,
         - lewy klik → strzał,
         - spacja do wejścia do portalu
         """
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-            self.paused = True
+            self.pause()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            self.show_profiler = not self.show_profiler
+            profiler.request("overlay", self.show_profiler)
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            self.player.shoot(event.pos)
+            # Strzał wykona najbliższy tick symulacji
+            self.pending_shots.append(event.pos)
         elif event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE and self.portal_active:
-            if self.portal_rect and self.player.rect.colliderect(self.portal_rect):
-                self.enter_boss_room()
+            # Wejście do portalu też wykona najbliższy tick
+            self.pending_actions.append("portal")
+
+    def entity_counts(self):
+        """
+        Zwraca liczby obiektów w grupach i stan cache chunków
+        (dla profilera, telemetrii i benchmarków).
+        """
+        player = self.projectiles.count(True)
+        cache = self.world.cache_stats()
+        return {
+            "enemies": len(self.enemies),
+            "player_projectiles": player,
+            "enemy_projectiles": self.projectiles.n - player,
+            "floating_texts": len(self.floating_texts),
+            "chunks": len(self.world.chunks),
+            "chunk_cache": cache["entries"],
+            "chunk_cache_mb": round(cache["bytes"] / (1024 * 1024), 1),
+        }
+
+    def movement(self):
+        """
+        Zwraca kierunek ruchu gracza (dx, dy) z klawiszy WASD albo,
+        jeśli ustawiono scripted_move, kierunek podany przez skrypt.
+        """
+        if self.scripted_move is not None:
+            return self.scripted_move
+        keys = pygame.key.get_pressed()
+        return keys[pygame.K_d] - keys[pygame.K_a], keys[pygame.K_s] - keys[pygame.K_w]
 
     def update(self):
         """
-        Aktualizuje sprite’y, floating texts, kamerę, spawnuje wrogów i obsługuje kolizje.
+        Jeden tick symulacji: aktualizuje sprite’y, floating texts, kamerę,
+        spawnuje wrogów i obsługuje kolizje. Nagrywanie / odtwarzanie
+        (tape) dostaje tick jako pierwsze, przed wejściem gracza.
         """
-        self.all_sprites.update()
-        self.floating_texts.update()
+        if self.tape is not None:
+            self.tape.on_tick(self)
+
+        self.ticks += 1
+        self.now = self.ticks * 1000 // SIM_RATE
+
+        for pos in self.pending_shots:
+            self.player.shoot(pos)
+        self.pending_shots.clear()
+
+        for action in self.pending_actions:
+            if action == "portal" and self.portal_active and self.portal_rect \
+                    and self.player.rect.colliderect(self.portal_rect):
+                self.enter_boss_room()
+        self.pending_actions.clear()
+
+        with profiler.section("sprites"):
+            self.all_sprites.update()
+        with profiler.section("enemies"):
+            self.enemy_population.update(self.now, self.player.rect.center)
+        with profiler.section("projectiles"):
+            self.projectiles.update(self.now)
+        with profiler.section("floating_texts"):
+            self.floating_texts.update()
 
         if self.portal_active and self.portal_sprite:
-            self.portal_sprite.update()
+            self.portal_sprite.update(self.now)
             self.portal_rect = self.portal_sprite.rect
 
-        # Oblicza rozmiar viewportu zależnie od zoomu
-        vw = int(WIDTH / self.zoom)
-        vh = int(HEIGHT / self.zoom)
+        self._update_camera()
 
-        # Kamera na gracza: pozycja środka gracza minus połowa viewportu
-        cx = self.player.pos.x - vw // 2
-        cy = self.player.pos.y - vh // 2
-
-        # Zapisuje w camera_offset jako int
-        self.camera_offset[0] = int(cx)
-        self.camera_offset[1] = int(cy)
+        # Strumieniowanie chunków przed kamerą w kierunku ruchu gracza
+        if not self.boss_room:
+            with profiler.section("world_stream"):
+                self.world.update(self.camera_offset, self.player.vel, self.zoom)
 
         # Zwiększa częstotliwość spawnu przeciwników z tempem gry
         decrement = (self.score // 200) * 100
@@ -181,13 +373,13 @@ class Game:
         if not self.boss_room and not self.portal_active and self.score >= 100:
             self.spawn_portal()
 
-        now = pygame.time.get_ticks()
-        if not self.boss_room and now - self.last_spawn > self.spawn_rate:
-            self.last_spawn = now
+        if not self.boss_room and self.now - self.last_spawn > self.spawn_rate:
+            self.last_spawn = self.now
             self.spawn_enemy()
 
         # Sprawdza kolizje pocisków i postaci
-        self.check_collisions()
+        with profiler.section("collisions"):
+            self.check_collisions()
 
         # Ogranicza ruch gracza i bossa do granic areny
         if self.boss_room and self.boss_arena:
@@ -210,118 +402,178 @@ class Game:
                     e.pos.y = clamp(e.pos.y, min_y, max_y)
                     e.rect.center = e.pos
 
-    def draw(self):
+    def _update_camera(self, snap=False):
         """
-        Rysuje świat, sprite’y, floating texts oraz UI pauzy i ustawień.
+        Ustawia kamerę na gracza. snap=True (np. po teleporcie)
+        zeruje też pozycję z poprzedniego ticku, żeby nie interpolować skoku.
         """
+        self.prev_camera[:] = self.camera_offset
+
         # Oblicza rozmiar viewportu zależnie od zoomu
         vw = int(WIDTH / self.zoom)
         vh = int(HEIGHT / self.zoom)
-        render_surf = pygame.Surface((vw, vh))
-        render_surf.fill(BLACK)
 
-        # Rysuje world / boss_room
-        render_surf = pygame.Surface((vw, vh))
-        if self.boss_room and self.boss_arena:
-            self.boss_arena.draw(render_surf, (self.camera_offset[0], self.camera_offset[1]))
+        # Kamera na gracza: pozycja środka gracza minus połowa viewportu
+        cx = self.player.pos.x - vw // 2
+        cy = self.player.pos.y - vh // 2
+
+        # Zapisuje w camera_offset jako int
+        self.camera_offset[0] = int(cx)
+        self.camera_offset[1] = int(cy)
+
+        if snap:
+            self.prev_camera[:] = self.camera_offset
+            self.player.prev_pos.update(self.player.pos)
+
+    def set_zoom(self, zoom):
+        """
+        Zmienia zoom: czyści grafiki przeskalowane dla poprzedniego
+        poziomu (i wypieczone chunki, jeśli nowy zoom ich nie używa)
+        i wymusza przerysowanie warstwy świata.
+        """
+        if zoom == self.zoom:
+            return
+        self.zoom = zoom
+        zoomed.set_zoom(zoom)
+        if zoom != 1.0:
+            # Przy zoomie świat rysujemy z kafelków, więc wypieczone chunki
+            # tylko zajmowałyby budżet cache
+            self.world.baked.clear()
+        self.world_layer.invalidate()
+        # Zamrożone tło menu odświeżamy, żeby pokazać nowy zoom
+        self.backdrop = None
+
+    def _lerp_shift(self, sprite):
+        # Przesunięcie sprite'a z bieżącej pozycji do interpolowanej
+        prev = getattr(sprite, "prev_pos", None)
+        if prev is None or self.alpha >= 1.0:
+            return 0, 0
+        pos = sprite.pos
+        t = self.alpha - 1.0
+        return (pos.x - prev.x) * t, (pos.y - prev.y) * t
+
+    def draw(self):
+        """
+        Rysuje klatkę sceny z wierzchu stosu: w trakcie gry scenę z HUD-em,
+        w menu pauzy / ustawień menu nad zamrożoną klatką gry.
+        """
+        self.scene.draw()
+
+    def _draw_menu(self, menu):
+        """
+        Tryb oszczędny menu: scena jest renderowana raz i zapamiętywana
+        jako tło. Potem, tylko po wejściu od gracza, odtwarzamy tło pod
+        poprzednim i bieżącym prostokątem menu, rysujemy menu i
+        aktualizujemy na ekranie wyłącznie te prostokąty.
+        """
+        full = self.backdrop is None
+        if full:
+            self._draw_scene()
+            self.backdrop = self.screen.copy()
+            self.menu_rect = None
+        elif not self.menu_dirty:
+            return
+
+        rect = menu.bounds(self.screen.get_size())
+        dirty = [rect] if self.menu_rect is None else [rect, self.menu_rect]
+        for r in dirty:
+            self.screen.blit(self.backdrop, r, r)
+        menu.draw(self.screen)
+
+        if full:
+            pygame.display.flip()
         else:
-            self.world.draw(render_surf, (self.camera_offset[0], self.camera_offset[1]))
+            pygame.display.update(dirty)
+        self.menu_rect = rect
+        self.menu_dirty = False
+
+    def _draw_scene(self):
+        """
+        Rysuje świat, sprite’y i floating texts.
+        Wszystko trafia od razu na ekran w jego rozdzielczości: przy
+        zoomie 1.0 bez skalowania, a przy innym zoomie z grafik
+        przeskalowanych raz na poziom zoomu (zoomed), zamiast skalować
+        całą klatkę. Kamera i ruchome obiekty są interpolowane między
+        dwoma ostatnimi tickami o self.alpha, więc ruch jest płynny
+        przy dowolnym FPS.
+        """
+        z = self.zoom
+        a = self.alpha
+        # Kamera w pikselach ekranu: pozycja w świecie × zoom
+        cam = (
+            round((self.prev_camera[0] + (self.camera_offset[0] - self.prev_camera[0]) * a) * z),
+            round((self.prev_camera[1] + (self.camera_offset[1] - self.prev_camera[1]) * a) * z)
+        )
+
+        # Rysuje world / boss_room z trwałej warstwy
+        source = self.boss_arena if self.boss_room and self.boss_arena else self.world
+        render_surf = self.screen
+        with profiler.section("world_draw"):
+            render_surf.blit(self.world_layer.render(source, cam, (WIDTH, HEIGHT), z), (0, 0))
 
         # Rysowanie spriteów postaci z healthbarami
+        with profiler.section("sprites_draw"):
+            self._draw_sprites(render_surf, cam, z)
+
+        # Rysowanie pocisków
+        with profiler.section("projectiles_draw"):
+            self.projectiles.draw(render_surf, cam, a, z)
+
+        # Rysowanie floating textów
+        with profiler.section("texts_draw"):
+            for text in self.floating_texts:
+                text.draw(render_surf, cam, z)
+
+        # Rysowanie portalu
+        if self.portal_active and self.portal_sprite:
+            self.portal_sprite.draw(render_surf, cam, z)
+            # Rysowanie napisu
+            tx = round((self.portal_sprite.rect.centerx - 150) * z) - cam[0]
+            ty = round((self.portal_sprite.rect.centery - 50) * z) - cam[1]
+            font = assets.font(FONT_PATH, round(16 * z))
+            render_surf.blit(font.render("Press SPACE to enter", True, WHITE), (tx, ty))
+
+    def _draw_sprites(self, render_surf, cam, z):
+        # Postacie z healthbarami; cam w pikselach ekranu
         for sprite in self.all_sprites:
+            sx, sy = self._lerp_shift(sprite)
             if isinstance(sprite, Boss):
                 # Boss
-                sprite.draw(render_surf, self.camera_offset)
+                sprite.draw(render_surf, (cam[0] - round(sx * z), cam[1] - round(sy * z)), z)
             else:
                 # Zwykłe sprite'y
-                x = sprite.rect.x - self.camera_offset[0]
-                y = sprite.rect.y - self.camera_offset[1]
-                render_surf.blit(sprite.image, (x, y))
+                x = round((sprite.rect.x + sx) * z) - cam[0]
+                y = round((sprite.rect.y + sy) * z) - cam[1]
+                render_surf.blit(zoomed.scale(sprite.image), (x, y))
 
             # Rysuje healthbar dla wszystkich postaci poza bossem
             if hasattr(sprite, "health") and hasattr(sprite, "max_health") and not hasattr(sprite, "charge_phase"):
                 # Wymiary healthbara
                 ratio = sprite.health / sprite.max_health
-                bar_w, bar_h = 30, 5
+                bar_w, bar_h = round(30 * z), round(5 * z)
                 fill_w = int(bar_w * ratio)
                 # Obliczenie pozycji dla healthbara
-                bar_x = x + (sprite.rect.width - bar_w) // 2
-                bar_y = y - 10
+                bar_x = x + (round(sprite.rect.width * z) - bar_w) // 2
+                bar_y = y - round(10 * z)
                 # Kolor w zależności gracz/przeciwnik
                 col = GREEN if isinstance(sprite, Player) else RED
                 pygame.draw.rect(render_surf, col, (bar_x, bar_y, fill_w, bar_h))
-                pygame.draw.rect(render_surf, WHITE, (bar_x, bar_y, bar_w, bar_h), 1)
-
-        # Rysowanie floating textów
-        for text in self.floating_texts:
-            text.draw(render_surf, (self.camera_offset[0], self.camera_offset[1]))
-
-        # Rysowanie portalu
-        if self.portal_active and self.portal_sprite:
-            self.portal_sprite.draw(render_surf, (self.camera_offset[0], self.camera_offset[1]))
-            # Rysowanie napisu
-            tx = self.portal_sprite.rect.centerx - self.camera_offset[0] - 150
-            ty = self.portal_sprite.rect.centery - self.camera_offset[1] - 50
-            render_surf.blit(self.font.render("Press SPACE to enter", True, WHITE), (tx, ty))
+                pygame.draw.rect(render_surf, WHITE, (bar_x, bar_y, bar_w, bar_h), max(1, round(z)))
 
-        # Skalowanie na ekran
-        final = pygame.transform.smoothscale(render_surf, (WIDTH, HEIGHT))
-        self.screen.blit(final, (0, 0))
-
-        # Rysowanie UI menu pauzy / ustawień
-        if self.in_settings:
-            self.settings_menu.draw(self.screen)
-        elif self.paused:
-            self.pause_menu.draw(self.screen)
-        else:
-            self.draw_ui()
-
-        pygame.display.flip()
 
     def draw_ui(self):
         """
         Rysuje HUD:
         - podczas walki z bossem: czerwony pasek życia bossa na górze z ikoną czaszki na środku,
         - zwykły score w ramce w lewym górnym rogu.
+        Widżety trzymają gotowe powierzchnie (patrz ui/hud.py).
+        Przy włączonym profilerze dochodzi jego nakładka.
         """
-        if self.boss_room:
-            boss = next((e for e in self.enemies if isinstance(e, Boss)), None)
-            if boss:
-                # Wymiary i pozycja healthbara bossa
-                bar_w = int(WIDTH * 0.6)
-                bar_h = 28
-                bar_x = (WIDTH - bar_w) // 2
-                bar_y = 40
-                outline_rect = pygame.Rect(bar_x, bar_y, bar_w, bar_h)
-                fill_w = int(bar_w * (boss.health / boss.max_health))
-                fill_rect = pygame.Rect(bar_x, bar_y, fill_w, bar_h)
-
-                # Rysowanie wypełnienia i obramówki
-                pygame.draw.rect(self.screen, RED, fill_rect)
-                pygame.draw.rect(self.screen, WHITE, outline_rect, 2)
-
-                # Ikonka czaszki na healtbarze
-                skull_h = bar_h * 3
-                skull_w = skull_h
-                skull = pygame.transform.scale(self.skull_orig, (skull_w, skull_h))
-                skull_x = WIDTH // 2 - skull_w // 2
-                skull_y = bar_y - skull_h // 4
-                self.screen.blit(skull, (skull_x, skull_y))
-
-        # Rysowanie, pozycja i skalowanie tabliczki ze scorem
-        score_text = f"Score: {self.score}"
-        surf = self.font.render(score_text, True, WHITE)
-        w, h = surf.get_size()
-
-        orig_w, orig_h = self.score_bg_orig.get_size()
-        padding = 20
-        frame_w = max(orig_w, w + 2 * padding)
-        frame_h = orig_h * 2
-        frame_s = pygame.transform.scale(self.score_bg_orig, (frame_w, frame_h))
-
-        x, y = 10, 10
-        self.screen.blit(frame_s, (x, y))
-        self.screen.blit(surf, (x + padding, y + (frame_h - h) // 2))
+        with profiler.section("hud"):
+            self.hud.draw(self.screen)
+        if self.show_profiler:
+            with profiler.section("overlay"):
+                self.profiler_overlay.draw(self.screen)
 
     def spawn_enemy(self):
         """
@@ -348,34 +600,42 @@ class Game:
         e = Enemy(x, y, self)
         self.all_sprites.add(e)
         self.enemies.add(e)
+        telemetry.event("spawn", x=x, y=y)
 
     def check_collisions(self):
         """
         Obsługuje kolizje pocisków i kontaktów.
+        Pociski gracza są sprawdzane hurtowo w ProjectileSystem tylko
+        z wrogami z sąsiednich komórek siatki kolizji, a kontakt z wrogami
+        przez tę samą siatkę.
         """
-        # Interakcja pocisków gracza z wrogami
-        hits = pygame.sprite.groupcollide(self.enemies, self.player_projectiles, False, True)
-        for enemy, projs in hits.items():
-            for p in projs:
-                died = enemy.take_damage(p.damage)
-                if died:
-                    # Po zabiciu bossa kończymy grę
-                    if isinstance(enemy, Boss):
-                        self.game_win()
-                    else:
-                        # Po zabiciu zwykłego worga dodajemu 10 pkt. do scora
-                        self.score += 10
+        self.enemy_grid.rebuild(self.enemies)
+
+        # Interakcja pocisków gracza z wrogami (kandydaci z siatki kolizji)
+        for enemy, damage in self.projectiles.collide_grid(self.enemy_grid, True):
+            if not enemy.alive():
+                continue
+            died = enemy.take_damage(damage)
+            if died:
+                # Po zabiciu bossa kończymy grę
+                if isinstance(enemy, Boss):
+                    telemetry.event("boss_kill")
+                    self.game_win()
+                else:
+                    # Po zabiciu zwykłego worga dodajemu 10 pkt. do scora
+                    self.score += 10
+                    telemetry.event("kill", score=self.score)
 
         # Interakcja pocisków wroga z graczem
-        hits = pygame.sprite.spritecollide(self.player, self.enemy_projectiles, True)
-        for p in hits:
-            if self.player.take_damage(p.damage):
+        for _, damage in self.projectiles.collide([self.player.rect], False):
+            if self.player.take_damage(damage):
                 # Game over po zabiciu gracza
                 self.game_over()
 
         # Interakcja gracza w modelami przeciwników
-        hits = pygame.sprite.spritecollide(self.player, self.enemies, False)
-        for e in hits:
+        for e in self.enemy_grid.query_rect(self.player.rect):
+            if not e.alive():
+                continue
             if self.player.take_damage(e.damage * 0.1):
                 # Game over po zabiciu gracza
                 self.game_over()
@@ -395,6 +655,7 @@ class Game:
         - boss pojawia się na górnej krawędzi,
         - gracz na dolnej krawędzi.
         """
+        telemetry.event("boss")
         # Ustawienie stanów gry
         self.portal_active = False
         self.boss_room = True
@@ -403,14 +664,8 @@ class Game:
 
         # Wyczyść zwykłych wrogów i pociski
         for e in list(self.enemies):
-            self.enemies.remove(e)
-            self.all_sprites.remove(e)
-        for p in list(self.player_projectiles):
-            self.player_projectiles.remove(p)
-            self.all_sprites.remove(p)
-        for p in list(self.enemy_projectiles):
-            self.enemy_projectiles.remove(p)
-            self.all_sprites.remove(p)
+            e.kill()
+        self.projectiles.clear()
 
         # Oblicz środek areny
         center_tile = (
@@ -438,163 +693,55 @@ class Game:
         boss = Boss(boss_x, boss_y, self)
         self.all_sprites.add(boss)
         self.enemies.add(boss)
+        self.boss = boss
 
         # Przeniesienie gracza na arenę gracza
         self.player.pos.update(player_x, player_y)
         self.player.rect.center = (player_x, player_y)
+        self._update_camera(snap=True)
+        self.world_layer.invalidate()
 
         # Zmiana muzyki na bossową
-        try:
-            pygame.mixer.music.load("assets/sounds/boss_music.wav")
-            pygame.mixer.music.set_volume(self.music_volume)
-            pygame.mixer.music.play(-1)
-        except pygame.error as e:
-            print(f"Nie udało się załadować muzyki bossowej: {e}")
+        self.sounds.play_music("assets/sounds/boss_music.wav")
 
     def game_over(self):
         """
-        Wyświetla ekran przegranej i czeka na R, by zrestartować grę.
+        Pokazuje ekran przegranej; R rozpoczyna nową grę (patrz EndScene).
         """
-        # Wymiary okna gry
-        w, h = WIDTH, HEIGHT
-
-        # Skalowanie czcionki z zależności od wielkości okna
-        font_path = "assets/fonts/PressStart2P.ttf"
-        go_size = max(24, int(h * 0.12))
-        score_size = max(18, int(h * 0.08))
-        restart_size = max(16, int(h * 0.06))
-        font_go = pygame.font.Font(font_path, go_size)
-        font_score = pygame.font.Font(font_path, score_size)
-        font_restart = pygame.font.Font(font_path, restart_size)
-
+        if self.paused:
+            return
+        telemetry.event("game_over", score=self.score)
         # Odtworzenie muzyki Game Over
-        try:
-            pygame.mixer.music.load("assets/sounds/game_over.wav")
-            pygame.mixer.music.set_volume(self.music_volume)
-            pygame.mixer.music.play(1)
-        except pygame.error as e:
-            print(f"Nie udało się załadować dźwięku game over: {e}")
-
-        # Renderowanie tekstów
-        go_surf = font_go.render("GAME OVER", True, RED)
-        score_surf = font_score.render(f"Score: {self.score}", True, WHITE)
-        restart_surf = font_restart.render("Press R to restart", True, WHITE)
-
-        # Skalowanie i dynamiczna pozycja ikonki czaszki
-        orig_sw, orig_sh = self.skull_orig.get_size()
-        skull_w = int(w * 0.15)
-        skull_h = int(skull_w * orig_sh / orig_sw)
-        skull_surf = pygame.transform.scale(self.skull_orig, (skull_w, skull_h))
-
-        center_x = w // 2
-        skull_x = center_x - skull_w // 2
-        skull_y = int(h * 0.1)
-        gap = int(h * 0.03)
-
-        go_x = center_x - go_surf.get_width() // 2
-        go_y = skull_y + skull_h + gap
-        score_x = center_x - score_surf.get_width() // 2
-        score_y = go_y + go_surf.get_height() + gap
-        restart_x = center_x - restart_surf.get_width() // 2
-        restart_y = score_y + score_surf.get_height() + gap
-
-        # Rysowanie gotowego ekrany Game Over
-        self.screen.fill(BLACK)
-        self.screen.blit(skull_surf, (skull_x, skull_y))
-        self.screen.blit(go_surf, (go_x, go_y))
-        self.screen.blit(score_surf, (score_x, score_y))
-        self.screen.blit(restart_surf, (restart_x, restart_y))
-        pygame.display.flip()
-
-        # Oczekiwanie na R do restartu gry lub quit
-        waiting = True
-        while waiting:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_r:
-                        waiting = False
-                        # Restart muzyki w tle
-                        pygame.mixer.music.load("assets/sounds/background_music.wav")
-                        pygame.mixer.music.set_volume(self.music_volume)
-                        pygame.mixer.music.play(-1)
-                        # Rozpoczęcie nowej gry
-                        self.new()
+        self.sounds.play_music("assets/sounds/game_over.wav", 1)
+        self._show_end_screen("game_over", lambda: game_over_screen(self.skull_orig))
 
     def game_win(self):
         """
-        Wyświetla ekran zwycięstwa i czeka na R, by zrestartować grę.
-        """
-        w, h = WIDTH, HEIGHT
-        font_path = "assets/fonts/PressStart2P.ttf"
-        # Skalowanie czcionki z zależności od wielkości okna
-        win_size = max(24, int(h * 0.12))
-        score_size = max(18, int(h * 0.08))
-        restart_size = max(16, int(h * 0.06))
-        font_win = pygame.font.Font(font_path, win_size)
-        font_score = pygame.font.Font(font_path, score_size)
-        font_restart = pygame.font.Font(font_path, restart_size)
-
-        # Skalowanie i dynamiczna pozycja ikonki korony
-        try:
-            crown = pygame.image.load("assets/images/crown.png").convert_alpha()
-            cw = int(w * 0.15)
-            ch = int(cw * crown.get_height() / crown.get_width())
-            crown = pygame.transform.scale(crown, (cw, ch))
-        except Exception as e:
-            print(f"Nie udało się załadować korony: {e}")
-            crown = None
-
-        # Renderowanie tekstów
-        win_surf = font_win.render("YOU WIN!", True, BLACK)
-        score_surf = font_score.render(f"Score: {self.score}", True, BLACK)
-        restart_surf = font_restart.render("Press R to restart", True, BLACK)
-
-        # Skalowanie czcionki z zależności od wielkości okna
-        center_x = w // 2
-        y = int(h * 0.1)
-        self.screen.fill(YELLOW)
-        if crown:
-            cx = center_x - crown.get_width() // 2
-            self.screen.blit(crown, (cx, y))
-            y += crown.get_height() + int(h * 0.03)
-
-        wy = center_x - win_surf.get_width() // 2
-        self.screen.blit(win_surf, (wy, y))
-        y += win_surf.get_height() + int(h * 0.03)
-
-        sx = center_x - score_surf.get_width() // 2
-        self.screen.blit(score_surf, (sx, y))
-        y += score_surf.get_height() + int(h * 0.03)
-
-        rx = center_x - restart_surf.get_width() // 2
-        self.screen.blit(restart_surf, (rx, y))
-
-        pygame.display.flip()
-
+        Pokazuje ekran zwycięstwa; R rozpoczyna nową grę (patrz EndScene).
+        """
+        if self.paused:
+            return
+        telemetry.event("victory", score=self.score)
         # Odtworzenie muzyki Victory
-        try:
-            pygame.mixer.music.load("assets/sounds/victory_music.ogg")
-            pygame.mixer.music.set_volume(self.music_volume)
-            pygame.mixer.music.play(-1)
-        except:
-            pass
-
-        # Oczekiwanie na R do restartu gry lub quit
-        waiting = True
-        while waiting:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_r:
-                        waiting = False
-                        # Restart muzyki w tle
-                        pygame.mixer.music.load("assets/sounds/background_music.wav")
-                        pygame.mixer.music.set_volume(self.music_volume)
-                        pygame.mixer.music.play(-1)
-                        # Rozpoczęcie nowej gry
-                        self.new()
\ No newline at end of file
+        self.sounds.play_music("assets/sounds/victory_music.ogg")
+        self._show_end_screen("victory", victory_screen)
+
+    def _show_end_screen(self, name, build):
+        screen = self.end_screens.get(name)
+        if screen is None:
+            screen = build()
+            self.end_screens[name] = screen
+        self.push_scene(EndScene(self, screen.render(self.score)))
+
+    def restart(self):
+        """
+        Rozpoczyna nową grę z ekranu końca: muzyka w tle, nowy stan
+        i powrót do rozgrywki bez zagnieżdżonej pętli.
+        """
+        if self.tape is not None:
+            self.tape.note("restart")
+        # Restart muzyki w tle
+        self.sounds.play_music("assets/sounds/background_music.wav")
+        # Rozpoczęcie nowej gry
+        self.new()
+        self.resume()
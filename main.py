@@ -1,17 +1,38 @@
+import argparse
+
 import pygame
 import sys
+from classes.replay import InputRecorder
+from classes.telemetry import telemetry
 from game import Game
 
 def main():
     """
     Inicjalizuje Pygame, tworzy instancję Game i uruchamia ją.
+    Z --telemetry plik zapisuje czasy klatek i zdarzenia sesji
+    (podsumowanie: python -m tools.telemetry_report plik),
+    a z --record plik nagrywa wejście do odtworzenia
+    (python -m tools.replay plik).
     Po zakończeniu zwalnia zasoby i kończy program.
     """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--telemetry", metavar="PLIK", help="zapis telemetrii sesji")
+    parser.add_argument("--record", metavar="PLIK", help="nagranie wejścia do odtworzenia")
+    args = parser.parse_args()
+
     pygame.init()
     game = Game()
-    game.run()
+    recorder = InputRecorder(game) if args.record else None
+    if args.telemetry:
+        telemetry.start(args.telemetry, seed=game.world.seed)
+    try:
+        game.run()
+    finally:
+        telemetry.stop()
+        if recorder is not None:
+            recorder.save(args.record)
     pygame.quit()
     sys.exit()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
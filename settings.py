@@ -2,6 +2,14 @@
 # Ustawienia gry
 WIDTH, HEIGHT = 1920, 1080
 FPS = 60
+# Stały krok symulacji: ticki na sekundę niezależnie od FPS rysowania
+SIM_RATE = 60
+# Maksymalna liczba ticków nadrabianych w jednej klatce
+MAX_TICKS_PER_FRAME = 5
+# Tempo pętli w menu pauzy / ustawień (oszczędzanie energii)
+IDLE_FPS = 10
+# Jak długo (ms) po ostatnim wejściu menu działa w pełnym tempie FPS
+IDLE_WAKE_MS = 500
 TITLE = "RotMG Game"
 
 # –––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––
@@ -14,6 +22,12 @@ BLUE = (0, 0, 255)
 YELLOW = (253, 216, 8)
 PURPLE = (255, 0, 255)
 
+# –––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––
+# Czcionki i cache tekstu
+FONT_PATH = "assets/fonts/PressStart2P.ttf"
+GLYPH_CACHE_SIZE = 512  # maks. liczba wyrenderowanych znaków
+TEXT_CACHE_SIZE = 256  # maks. liczba złożonych napisów
+
 # –––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––
 # Ustawienia gracza
 PLAYER_SPEED = 5
@@ -27,6 +41,11 @@ ENEMY_SIZE = 64
 ENEMY_HEALTH = 41
 ENEMY_DAMAGE = 5
 SPAWN_RATE = 1000  # ms
+# Poziomy szczegółowości (LOD) aktualizacji wrogów wg odległości poza widokiem kamery:
+# do ENEMY_LOD_MARGIN px — co tick, do ENEMY_LOD_NEAR px — co 2 ticki, dalej — co 4
+ENEMY_LOD_MARGIN = 64
+ENEMY_LOD_NEAR = 600
+ENEMY_LOD_PERIODS = (1, 2, 4)
 
 # –––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––
 # Ustawienia pocisków gracza
@@ -37,6 +56,13 @@ PLAYER_PROJECTILE_SPEED = 12
 PLAYER_PROJECTILE_DAMAGE = 10
 PLAYER_SHOOT_DELAY = 300
 
+# –––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––
+# Wspólne ustawienia pocisków
+PROJECTILE_LIFETIME = 5000  # ms
+PROJECTILE_COLLIDE_BLOCK = 1024  # ile pocisków naraz w macierzy kolizji
+PROJECTILE_CULL_MARGIN = 400  # px poza widokiem/areną, po których pocisk znika
+PROJECTILE_ROTATION_STEPS = 64  # ile gotowych obrotów grafiki pocisku
+
 # –––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––
 # Ustawienia pocisków przeciwników
 ENEMY_PROJECTILE_IMAGE = "assets/images/projectile_enemy.png"
@@ -47,6 +73,20 @@ ENEMY_SHOOT_CHANCE = 0.2
 ENEMY_MIN_SHOOT_DELAY = 500
 ENEMY_MAX_SHOOT_DELAY = 2000
 
+# –––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––
+# Ustawienia dźwięku
+SFX_CHANNELS = 16  # stała pula kanałów miksera dla efektów
+SFX_BASE_VOLUME = 0.1
+SFX_OFFSCREEN_MARGIN = 200  # px poza widokiem, z których dźwięki jeszcze grają
+SFX_RETRIGGER_MS = 30  # młodszych głosów nie podkradamy
+# kategoria: (limit jednoczesnych głosów, priorytet)
+SFX_CATEGORIES = {
+    "player_shot": (3, 3),
+    "enemy_hurt": (4, 2),
+    "enemy_shot": (4, 1),
+}
+ENEMY_HURT_SOUNDS = "assets/sounds/enemies"
+
 # –––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––
 # Ustawienia bossa
 BOSS_HEALTH = 1000
@@ -59,4 +99,26 @@ BOSS_ATTACK_COOLDOWN = 5000  # ms
 # –––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––
 # Ustawienia świata
 TILE_SIZE = 64
+CHUNK_CACHE_BUDGET = 128 * 1024 * 1024  # bajty na wypieczone powierzchnie chunków
+CHUNK_WORKERS = 2  # wątki generujące chunki w tle
+CHUNK_PREFETCH_RING = 1  # ile chunków wokół widoku generujemy z wyprzedzeniem
+CHUNK_LOOKAHEAD = 2  # o ile chunków przesuwamy prefetch w kierunku ruchu
+CHUNK_BAKES_PER_FRAME = 1  # ile chunków przed kamerą wypiekamy na zapas w klatce
+CHUNK_KEEP_RADIUS = 8  # chunki dalej niż tyle od kamery są usuwane z pamięci
+SPATIAL_CELL_SIZE = 128  # rozmiar komórki siatki kolizji w px
 
+
+# –––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––
+# Profiler klatek (nakładka pod F3)
+PROFILER_FRAMES = 240  # długość buforów pierścieniowych (klatki)
+PROFILER_TOP = 8  # ile najdroższych sekcji pokazuje nakładka
+PROFILER_REFRESH = 250  # ms między odświeżeniami tekstu nakładki
+
+# –––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––
+# Telemetria (python main.py --telemetry plik)
+TELEMETRY_BATCH = 256  # ile rekordów wątek zapisu zbiera przed zapisem na dysk
+TELEMETRY_HITCH_MS = 33.4  # klatka dłuższa niż tyle to przycięcie (2 klatki przy 60 FPS)
+
+# –––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––
+# Nagrywanie i odtwarzanie wejścia (python main.py --record plik)
+REPLAY_CHECK_EVERY = 300  # co ile ticków zapisujemy skrót stanu do weryfikacji
@@ -0,0 +1,50 @@
+"""
+Benchmark generatorów chunków: porównuje liczbę chunków na sekundę
+generatora opartego na random.Random (generate_chunk) i wektorowego
+generatora NumPy (generate_chunks) dla różnych rozmiarów paczek.
+
+Uruchomienie: python -m tools.bench_chunks [liczba_chunków]
+"""
+import sys
+import time
+
+from classes.chunk_gen import generate_chunk, generate_chunks
+
+
+def _coords(n, start=0):
+    side = int(n ** 0.5) + 1
+    return [(start + i % side, start + i // side) for i in range(n)]
+
+
+def bench_python(seed, coords):
+    start = time.perf_counter()
+    for cx, cy in coords:
+        generate_chunk(seed, cx, cy)
+    return len(coords) / (time.perf_counter() - start)
+
+
+def bench_numpy(seed, coords, batch):
+    start = time.perf_counter()
+    for i in range(0, len(coords), batch):
+        generate_chunks(seed, coords[i:i + batch])
+    return len(coords) / (time.perf_counter() - start)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    seed = 12345
+    coords = _coords(n)
+
+    # Rozgrzewka (import, alokacje)
+    generate_chunks(seed, _coords(16, -100))
+
+    py = bench_python(seed, coords)
+    print(f"{'generator':<20}{'paczka':>8}{'chunki/s':>12}{'przyspieszenie':>16}")
+    print(f"{'random.Random':<20}{1:>8}{py:>12.0f}{1.0:>15.1f}x")
+    for batch in (1, 16, 64, 256):
+        rate = bench_numpy(seed, coords, batch)
+        print(f"{'NumPy':<20}{batch:>8}{rate:>12.0f}{rate / py:>15.1f}x")
+
+
+if __name__ == "__main__":
+    main()
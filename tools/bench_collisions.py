@@ -0,0 +1,59 @@
+"""
+Benchmark kolizji: porównuje pygame.sprite.groupcollide (każdy z każdym)
+z siatką kolizji SpatialHash dla rosnącej liczby obiektów.
+Połowa obiektów to wrogowie (64 px), połowa to pociski (24 px),
+rozrzuceni losowo na obszarze dwóch ekranów.
+
+Uruchomienie: python -m tools.bench_collisions
+"""
+import random
+import time
+
+import pygame
+
+from classes.spatial_hash import SpatialHash
+from settings import WIDTH, HEIGHT, ENEMY_SIZE, PLAYER_PROJECTILE_SIZE
+
+
+def _group(n, size, rnd):
+    group = pygame.sprite.Group()
+    for _ in range(n):
+        s = pygame.sprite.Sprite()
+        s.rect = pygame.Rect(rnd.randrange(2 * WIDTH), rnd.randrange(2 * HEIGHT), size, size)
+        group.add(s)
+    return group
+
+
+def bench_groupcollide(enemies, bullets, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        hits = pygame.sprite.groupcollide(enemies, bullets, False, False)
+    return (time.perf_counter() - start) / repeat, sum(len(v) for v in hits.values())
+
+
+def bench_spatial_hash(enemies, bullets, repeat):
+    grid = SpatialHash()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        grid.rebuild(enemies)
+        hits = 0
+        for b in bullets:
+            hits += len(grid.query_rect(b.rect))
+    return (time.perf_counter() - start) / repeat, hits
+
+
+def main():
+    rnd = random.Random(1)
+    print(f"{'obiekty':>8}{'groupcollide ms':>18}{'spatial hash ms':>18}{'przyspieszenie':>16}")
+    for n in (100, 500, 1000, 2500, 5000, 10000):
+        enemies = _group(n // 2, ENEMY_SIZE, rnd)
+        bullets = _group(n - n // 2, PLAYER_PROJECTILE_SIZE, rnd)
+        repeat = max(1, 2000 // n)
+        t_gc, h_gc = bench_groupcollide(enemies, bullets, repeat)
+        t_sh, h_sh = bench_spatial_hash(enemies, bullets, repeat)
+        assert h_gc == h_sh, (h_gc, h_sh)
+        print(f"{n:>8}{t_gc * 1000:>18.2f}{t_sh * 1000:>18.2f}{t_gc / t_sh:>15.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+Benchmark całej gry bez okna: uruchamia Game na sterownikach SDL "dummy"
+(obraz i dźwięk) ze stałym ziarnem świata i skryptowanym wejściem,
+a potem przez zadaną liczbę ticków wykonuje nazwane scenariusze:
+- walk      — marsz przez otwarty świat ze strzelaniem (zoom 1.5),
+- dense     — gęsta fala wrogów przy minimalnym spawn_rate (zoom 1.5),
+- boss      — walka z bossem w BossArena (zoom 1.5),
+- zoom_out  — marsz przy maksymalnym oddaleniu (zoom 1.0).
+Każda klatka to dokładnie jeden tick symulacji. Czas klatki jest
+rozbity na events, update (bez kolizji), collisions i draw; raport
+zawiera średnią, p95 i p99 w ms oraz liczby obiektów i trafia do JSON-a,
+żeby porównywać wyniki między wersjami. --no-lod wyłącza poziomy
+szczegółowości aktualizacji wrogów (porównanie z aktualizacją co tick).
+
+Uruchomienie: python -m tools.benchmark [scenariusze...] [--ticks N] [--seed S] [--no-lod] [--out plik.json]
+"""
+import argparse
+import contextlib
+import json
+import math
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np
+import pygame
+
+from game import Game
+from settings import SPAWN_RATE
+
+PHASES = ("events", "update", "collisions", "draw")
+# Kierunki marszu zmieniane co WALK_TURN ticków
+WALK_DIRS = ((1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1))
+WALK_TURN = 120
+
+
+def _nearest_target(game):
+    # Najbliższy wróg (lub boss) gracza albo None
+    px, py = game.player.pos
+    best, best_d = None, math.inf
+    for e in game.enemies:
+        d = (e.rect.centerx - px) ** 2 + (e.rect.centery - py) ** 2
+        if d < best_d:
+            best, best_d = e, d
+    return best
+
+
+def _click_at(game, wx, wy):
+    # Lewy klik w punkt świata (wx, wy) przeliczony na piksele ekranu
+    cx, cy = game.camera_offset
+    pos = (int((wx - cx) * game.zoom), int((wy - cy) * game.zoom))
+    pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos))
+
+
+def _shoot_nearest(game, tick, every):
+    if tick % every:
+        return
+    target = _nearest_target(game)
+    if target is not None:
+        _click_at(game, *target.rect.center)
+    else:
+        # Bez celu strzelamy w kierunku marszu
+        dx, dy = game.scripted_move
+        _click_at(game, game.player.pos.x + dx * 200 + 1, game.player.pos.y + dy * 200)
+
+
+def _walk(game, tick):
+    game.scripted_move = WALK_DIRS[(tick // WALK_TURN) % len(WALK_DIRS)]
+    _shoot_nearest(game, tick, 10)
+
+
+def _setup_dense(game):
+    # Score, przy którym spawn_rate spada do minimum (patrz Game.update)
+    game.score = (SPAWN_RATE // 100) * 200
+
+
+def _dense(game, tick):
+    # Powolne krążenie w miejscu, żeby fala się zbierała
+    game.scripted_move = WALK_DIRS[(tick // 30) % len(WALK_DIRS)]
+    _shoot_nearest(game, tick, 2)
+
+
+def _setup_boss(game):
+    game.score = 100
+    game.update()
+    game.enter_boss_room()
+
+
+def _boss(game, tick):
+    game.scripted_move = (1, 0) if (tick // 90) % 2 else (-1, 0)
+    _shoot_nearest(game, tick, 2)
+
+
+# nazwa -> (zoom, przygotowanie, skrypt jednego ticku)
+SCENARIOS = {
+    "walk": (1.5, None, _walk),
+    "dense": (1.5, _setup_dense, _dense),
+    "boss": (1.5, _setup_boss, _boss),
+    "zoom_out": (1.0, None, _walk),
+}
+
+
+def _summary(samples):
+    ms = np.asarray(samples) * 1000
+    return {
+        "mean": round(float(ms.mean()), 3),
+        "p95": round(float(np.percentile(ms, 95)), 3),
+        "p99": round(float(np.percentile(ms, 99)), 3),
+    }
+
+
+def run_scenario(name, ticks, seed, warmup=30, lod=True):
+    """
+    Wykonuje scenariusz name przez ticks ticków (po warmup nieliczonych)
+    i zwraca słownik z czasami faz, liczbami obiektów i statystykami LOD.
+    """
+    zoom, setup, script = SCENARIOS[name]
+    random.seed(seed)
+    game = Game(seed=seed)
+    game.set_zoom(zoom)
+    game.enemy_population.lod = lod
+    game.resume()
+    if setup is not None:
+        setup(game)
+
+    # Czas kolizji mierzony osobno i odejmowany od update
+    check_collisions = game.check_collisions
+    spent = [0.0]
+
+    def timed_collisions():
+        start = time.perf_counter()
+        check_collisions()
+        spent[0] += time.perf_counter() - start
+
+    game.check_collisions = timed_collisions
+
+    times = {phase: [] for phase in PHASES}
+    frames = []
+    peak_enemies = peak_projectiles = 0
+    ended_at = None
+    for tick in range(warmup + ticks):
+        # Gracz jest nieśmiertelny, żeby scenariusz trwał do końca
+        game.player.health = game.player.max_health
+        script(game, tick)
+
+        t0 = time.perf_counter()
+        game.handle_events()
+        t1 = time.perf_counter()
+        spent[0] = 0.0
+        game.update()
+        t2 = time.perf_counter()
+        game.draw()
+        t3 = time.perf_counter()
+
+        if tick >= warmup:
+            times["events"].append(t1 - t0)
+            times["update"].append(t2 - t1 - spent[0])
+            times["collisions"].append(spent[0])
+            times["draw"].append(t3 - t2)
+            frames.append(t3 - t0)
+            peak_enemies = max(peak_enemies, len(game.enemies))
+            peak_projectiles = max(peak_projectiles, game.projectiles.n)
+        if game.paused:
+            # Np. boss pokonany — dalej byłby już tylko ekran końca
+            ended_at = tick
+            break
+
+    result = {
+        "zoom": zoom,
+        "ticks": len(frames),
+        "ended_at": ended_at,
+        "frame": _summary(frames),
+    }
+    for phase in PHASES:
+        result[phase] = _summary(times[phase])
+    result["entities"] = {
+        "enemies": len(game.enemies),
+        "peak_enemies": peak_enemies,
+        "projectiles": game.projectiles.n,
+        "peak_projectiles": peak_projectiles,
+        "floating_texts": len(game.floating_texts),
+        "chunks": len(game.world.chunks),
+    }
+    result["enemy_lod"] = game.enemy_population.stats()
+    game.world.streamer.shutdown()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark gry bez okna")
+    parser.add_argument("scenarios", nargs="*", help=", ".join(SCENARIOS) + " (domyślnie wszystkie)")
+    parser.add_argument("--ticks", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=12345)
+    parser.add_argument("--no-lod", action="store_true", help="aktualizuj wszystkich wrogów co tick")
+    parser.add_argument("--out", help="plik JSON (domyślnie stdout)")
+    args = parser.parse_args()
+    for name in args.scenarios:
+        if name not in SCENARIOS:
+            parser.error(f"nieznany scenariusz: {name}")
+
+    report = {
+        "seed": args.seed,
+        "ticks": args.ticks,
+        "lod": not args.no_lod,
+        "python": sys.version.split()[0],
+        "pygame": pygame.version.ver,
+        "scenarios": {},
+    }
+    for name in args.scenarios or list(SCENARIOS):
+        # Komunikaty gry (np. brak pliku muzyki) nie mogą trafić do JSON-a na stdout
+        with contextlib.redirect_stdout(sys.stderr):
+            report["scenarios"][name] = run_scenario(name, args.ticks, args.seed, lod=not args.no_lod)
+        frame = report["scenarios"][name]["frame"]
+        print(f"{name:>10}: {frame['mean']:.2f} ms (p95 {frame['p95']:.2f}, p99 {frame['p99']:.2f})",
+              file=sys.stderr)
+
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
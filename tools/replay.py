@@ -0,0 +1,106 @@
+"""
+Odtworzenie nagrania sesji (python main.py --record plik) szybciej niż
+w czasie rzeczywistym: ta sama mapa, ten sam stan random i to samo
+wejście w każdym ticku, więc symulacja przebiega co do bitu tak samo
+(sprawdzają to skróty stanu zapisane w nagraniu). Bez --render liczy
+tylko ticki; z --render rysuje też każdą klatkę (domyślnie na
+sterowniku SDL "dummy"), więc przycięcie z nagranej sesji staje się
+powtarzalnym benchmarkiem. Wynik: ticki na sekundę, czasy update i draw
+(średnia, p95, p99 w ms) oraz liczba niezgodnych skrótów.
+
+Uruchomienie: python -m tools.replay plik [--render] [--json]
+"""
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np
+import pygame
+
+from classes.replay import InputReplay
+from game import Game
+from settings import SIM_RATE
+
+
+def _summary(samples):
+    if not samples:
+        return None
+    ms = np.asarray(samples) * 1000
+    return {
+        "mean": round(float(ms.mean()), 3),
+        "p95": round(float(np.percentile(ms, 95)), 3),
+        "p99": round(float(np.percentile(ms, 99)), 3),
+        "max": round(float(ms.max()), 3),
+    }
+
+
+def replay(path, render=False):
+    """
+    Odtwarza nagranie path i zwraca słownik z wynikami.
+    """
+    tape = InputReplay(path)
+    game = Game(seed=tape.seed)
+    tape.restore_rng()
+    tape.attach(game)
+    game.resume()
+
+    update_times, draw_times = [], []
+    start = time.perf_counter()
+    while not tape.done:
+        t0 = time.perf_counter()
+        game.update()
+        t1 = time.perf_counter()
+        update_times.append(t1 - t0)
+        if render:
+            game.draw()
+            draw_times.append(time.perf_counter() - t1)
+    elapsed = time.perf_counter() - start
+    tape.finish(game)
+    game.world.streamer.shutdown()
+
+    return {
+        "ticks": tape.count,
+        "seconds": round(elapsed, 3),
+        "ticks_per_sec": round(tape.count / elapsed, 1) if elapsed else None,
+        "speedup": round(tape.count / SIM_RATE / elapsed, 1) if elapsed else None,
+        "update": _summary(update_times),
+        "draw": _summary(draw_times),
+        "checks": len(tape.checks),
+        "mismatches": [{"tick": t, "expected": e, "got": g} for t, e, g in tape.mismatches],
+        "score": game.score,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Odtworzenie nagranej sesji")
+    parser.add_argument("path")
+    parser.add_argument("--render", action="store_true", help="rysuj każdą klatkę")
+    parser.add_argument("--json", action="store_true", help="wynik jako JSON")
+    args = parser.parse_args()
+
+    # Komunikaty gry (np. brak pliku muzyki) nie mieszają się z wynikiem
+    with contextlib.redirect_stdout(sys.stderr):
+        result = replay(args.path, args.render)
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"ticki: {result['ticks']} w {result['seconds']} s "
+              f"({result['ticks_per_sec']}/s, {result['speedup']}x czasu rzeczywistego)")
+        print(f"update ms: {result['update']}")
+        if result["draw"]:
+            print(f"draw ms: {result['draw']}")
+        status = "OK" if not result["mismatches"] else f"{len(result['mismatches'])} niezgodnych"
+        print(f"skróty stanu: {result['checks']} — {status}")
+    pygame.quit()
+    sys.exit(1 if result["mismatches"] else 0)
+
+
+if __name__ == "__main__":
+    main()
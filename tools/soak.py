@@ -0,0 +1,228 @@
+"""
+Test długiego działania (soak): sama symulacja, bez rysowania,
+bez flip ekranu i bez dźwięku, z nieograniczonym tempem ticków,
+przez zadaną liczbę minut czasu gry. Gracza prowadzi bot: chodzi
+po świecie, ucieka od zbyt bliskich wrogów, strzela w najbliższego
+Enemy, wchodzi do portalu i walczy z bossem, a po ekranie końca
+restartuje grę. Gracz jest nieśmiertelny, żeby sesja trwała, poza
+jednym życiem co --die-every sekund gry: wtedy bot idzie na wrogów
+bez strzelania aż do przegranej, więc restart po game over (i czyszczenie
+stanu w Game.new) też jest sprawdzany.
+Co --every sekund gry wypisuje przepustowość (ticki/s), liczby
+obiektów (także zajęte sloty EnemyPopulation i ProjectileSystem),
+liczbę chunków i RSS procesu, a na końcu przyrost każdej wartości na
+minutę gry — stały wzrost oznacza wyciek (np. nieusuwane SlowingPatch,
+rosnące World.chunks albo wrogowie w populacji bez sprite'a w grupie).
+
+Uruchomienie: python -m tools.soak [--minutes N] [--every S] [--die-every S] [--seed S] [--out plik.json]
+"""
+import argparse
+import contextlib
+import json
+import math
+import os
+import random
+import resource
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from classes.boss import SlowingPatch
+from game import Game
+from settings import SIM_RATE
+
+# Wróg bliżej niż tyle (px) — bot się cofa
+KITE_DISTANCE = 250
+# Co ile ticków bot losuje nowy kierunek marszu
+WANDER_TICKS = 2 * SIM_RATE
+
+
+def rss_mb():
+    """
+    Zwraca bieżący RSS procesu w MB (na Linuksie z /proc, inaczej szczytowy).
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return round(pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024), 1)
+    except (OSError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS podaje bajty, Linux kilobajty
+        return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _sign(v):
+    return (v > 0) - (v < 0)
+
+
+class Bot:
+    """
+    Prosty gracz: co tick ustawia game.scripted_move i dokłada
+    kliknięcie w najbliższego wroga do game.pending_shots.
+    Co die_every ticków (0 = nigdy) przestaje się leczyć i strzelać
+    i idzie na najbliższego wroga, aż zginie.
+    """
+
+    def __init__(self, game, seed, die_every=0):
+        self.game = game
+        self.rng = random.Random(seed)
+        self.wander = (1, 0)
+        self.die_every = die_every
+        self.dying = False
+        self.restarts = 0
+        self.deaths = 0
+
+    def nearest(self):
+        game = self.game
+        px, py = game.player.pos
+        best, best_d = None, math.inf
+        for e in game.enemies:
+            d = (e.rect.centerx - px) ** 2 + (e.rect.centery - py) ** 2
+            if d < best_d:
+                best, best_d = e, d
+        return best, math.sqrt(best_d)
+
+    def step(self, tick):
+        game = self.game
+        if game.paused:
+            # Ekran przegranej lub zwycięstwa
+            if self.dying:
+                self.deaths += 1
+                self.dying = False
+            game.restart()
+            self.restarts += 1
+        if self.die_every and tick % self.die_every == 0:
+            self.dying = True
+
+        px, py = game.player.pos
+        target, dist = self.nearest()
+        if self.dying:
+            if target is not None:
+                game.scripted_move = (_sign(target.rect.centerx - px), _sign(target.rect.centery - py))
+            else:
+                game.scripted_move = self.wander
+            return
+        game.player.health = game.player.max_health
+
+        if target is not None:
+            cx, cy = game.camera_offset
+            game.pending_shots.append((int((target.rect.centerx - cx) * game.zoom),
+                                       int((target.rect.centery - cy) * game.zoom)))
+
+        if tick % WANDER_TICKS == 0:
+            self.wander = (self.rng.choice((-1, 0, 1)), self.rng.choice((-1, 0, 1)))
+        if game.portal_active and game.portal_rect is not None:
+            # Idziemy do portalu i wchodzimy
+            portal = game.portal_rect
+            game.scripted_move = (_sign(portal.centerx - px), _sign(portal.centery - py))
+            game.pending_actions.append("portal")
+        elif target is not None and dist < KITE_DISTANCE:
+            game.scripted_move = (_sign(px - target.rect.centerx), _sign(py - target.rect.centery))
+        else:
+            game.scripted_move = self.wander
+
+
+def sample(game, bot, ticks, tick_rate):
+    counts = game.entity_counts()
+    return {
+        "minute": round(ticks / SIM_RATE / 60, 2),
+        "ticks": ticks,
+        "ticks_per_sec": round(tick_rate, 1),
+        "enemies": counts["enemies"],
+        "enemy_population": game.enemy_population.n,
+        "projectiles": game.projectiles.n,
+        "floating_texts": counts["floating_texts"],
+        "sprites": len(game.all_sprites),
+        "patches": sum(1 for s in game.all_sprites if isinstance(s, SlowingPatch)),
+        "chunks": counts["chunks"],
+        "chunk_cache_mb": counts["chunk_cache_mb"],
+        "rss_mb": rss_mb(),
+        "restarts": bot.restarts,
+        "deaths": bot.deaths,
+    }
+
+
+def soak(minutes, every, seed, die_every=0):
+    """
+    Wykonuje minutes minut symulacji i zwraca listę próbek co every sekund
+    gry; co die_every sekund gry (0 = nigdy) bot daje się zabić.
+    """
+    random.seed(seed)
+    game = Game(seed=seed)
+    game.sounds.muted = True
+    game.resume()
+    bot = Bot(game, seed, int(die_every * SIM_RATE))
+
+    total = int(minutes * 60 * SIM_RATE)
+    window = max(1, int(every * SIM_RATE))
+    samples = [sample(game, bot, 0, 0.0)]
+    start = last = time.perf_counter()
+    for tick in range(1, total + 1):
+        bot.step(tick)
+        game.update()
+        if tick % window == 0 or tick == total:
+            now = time.perf_counter()
+            samples.append(sample(game, bot, tick, (tick - samples[-1]["ticks"]) / (now - last)))
+            last = now
+            s = samples[-1]
+            print(f"{s['minute']:>7.2f} min  {s['ticks_per_sec']:>8.0f} t/s  wrogowie {s['enemies']:>4}/{s['enemy_population']:<4} "
+                  f"pociski {s['projectiles']:>4}  sprite'y {s['sprites']:>4}  plamy {s['patches']:>3}  "
+                  f"chunki {s['chunks']:>5}  RSS {s['rss_mb']:>7.1f} MB", file=sys.stderr)
+    elapsed = time.perf_counter() - start
+    game.world.streamer.shutdown()
+    return samples, total / elapsed
+
+
+def growth(samples):
+    """
+    Zwraca przyrost na minutę gry każdej wartości między pierwszą
+    próbką po starcie (po rozgrzewce) a ostatnią.
+    """
+    if len(samples) < 3:
+        return {}
+    first, last = samples[1], samples[-1]
+    span = last["minute"] - first["minute"]
+    if span <= 0:
+        return {}
+    keys = ("enemies", "enemy_population", "projectiles", "floating_texts", "sprites", "patches", "chunks", "chunk_cache_mb", "rss_mb")
+    return {key: round((last[key] - first[key]) / span, 2) for key in keys}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Symulacja bez rysowania (soak)")
+    parser.add_argument("--minutes", type=float, default=10, help="minuty czasu gry")
+    parser.add_argument("--every", type=float, default=30, help="odstęp próbek w sekundach gry")
+    parser.add_argument("--die-every", type=float, default=120,
+                        help="co ile sekund gry bot daje się zabić (0 = nigdy)")
+    parser.add_argument("--seed", type=int, default=12345)
+    parser.add_argument("--out", help="plik JSON z próbkami")
+    args = parser.parse_args()
+
+    # Komunikaty gry nie mieszają się z wynikiem
+    with contextlib.redirect_stdout(sys.stderr):
+        samples, rate = soak(args.minutes, args.every, args.seed, args.die_every)
+    report = {
+        "seed": args.seed,
+        "minutes": args.minutes,
+        "deaths": samples[-1]["deaths"],
+        "ticks_per_sec": round(rate, 1),
+        "speedup": round(rate / SIM_RATE, 1),
+        "growth_per_minute": growth(samples),
+        "samples": samples,
+    }
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+    print(f"średnio {report['ticks_per_sec']} ticków/s ({report['speedup']}x czasu rzeczywistego)")
+    print(f"przegrane: {report['deaths']}, restarty: {samples[-1]['restarts']}")
+    print("przyrost na minutę: " + ", ".join(f"{k} {v}" for k, v in report["growth_per_minute"].items()))
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
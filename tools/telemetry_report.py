@@ -0,0 +1,115 @@
+"""
+Podsumowanie pliku telemetrii (python main.py --telemetry plik):
+percentyle czasu klatki, liczba przycięć (klatek dłuższych niż próg)
+i kontekst najgorszych z nich — najdroższe sekcje, liczby obiektów
+i zdarzenia z tej samej klatki.
+
+Uruchomienie: python -m tools.telemetry_report plik [--hitch MS] [--show N]
+"""
+import argparse
+import json
+from collections import defaultdict
+
+import numpy as np
+
+from settings import TELEMETRY_HITCH_MS
+
+
+def load(path):
+    """
+    Czyta plik telemetrii i zwraca (nagłówek, klatki, zdarzenia wg klatki).
+    Niedokończona ostatnia linia (np. po zabiciu procesu) jest pomijana.
+    """
+    header, frames, events = {}, [], defaultdict(list)
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            kind = record[0]
+            if kind == "H":
+                header = record[2]
+            elif kind == "F":
+                frames.append(record)
+            elif kind == "E":
+                events[record[1]].append(record)
+    return header, frames, events
+
+
+def summarize(path, hitch_ms=TELEMETRY_HITCH_MS, show=10):
+    """
+    Zwraca słownik z percentylami, liczbą przycięć i kontekstem
+    show najdłuższych klatek ponad hitch_ms.
+    """
+    header, frames, events = load(path)
+    counts = header.get("counts", [])
+    if not frames:
+        return {"frames": 0}
+
+    ms = np.array([f[4] for f in frames])
+    hitches = [f for f in frames if f[4] > hitch_ms]
+    hitches.sort(key=lambda f: f[4], reverse=True)
+
+    kinds = defaultdict(int)
+    for frame_events in events.values():
+        for e in frame_events:
+            kinds[e[3]] += 1
+
+    worst = []
+    for _, frame_no, t, ticks, frame_ms, values, sections in hitches[:show]:
+        top = sorted(sections.items(), key=lambda item: item[1], reverse=True)[:4]
+        worst.append({
+            "frame": frame_no,
+            "t_ms": t,
+            "ms": frame_ms,
+            "ticks": ticks,
+            "sections": dict(top),
+            "counts": dict(zip(counts, values)),
+            "events": [[e[3], e[4]] for e in events.get(frame_no, [])],
+        })
+
+    return {
+        "seed": header.get("seed"),
+        "frames": len(frames),
+        "duration_s": round(frames[-1][2] / 1000, 1),
+        "mean": round(float(ms.mean()), 3),
+        "p50": round(float(np.percentile(ms, 50)), 3),
+        "p95": round(float(np.percentile(ms, 95)), 3),
+        "p99": round(float(np.percentile(ms, 99)), 3),
+        "max": round(float(ms.max()), 3),
+        "hitch_ms": hitch_ms,
+        "hitches": len(hitches),
+        "events": dict(kinds),
+        "worst": worst,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Podsumowanie telemetrii")
+    parser.add_argument("path")
+    parser.add_argument("--hitch", type=float, default=TELEMETRY_HITCH_MS, help="próg przycięcia w ms")
+    parser.add_argument("--show", type=int, default=10, help="ile najgorszych klatek opisać")
+    parser.add_argument("--json", action="store_true", help="wynik jako JSON")
+    args = parser.parse_args()
+
+    report = summarize(args.path, args.hitch, args.show)
+    if args.json or not report["frames"]:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"klatki: {report['frames']} ({report['duration_s']} s), seed {report['seed']}")
+    print(f"ms: mean {report['mean']}  p50 {report['p50']}  p95 {report['p95']}  "
+          f"p99 {report['p99']}  max {report['max']}")
+    print(f"przycięcia > {report['hitch_ms']} ms: {report['hitches']}")
+    print("zdarzenia: " + ", ".join(f"{k} {v}" for k, v in sorted(report["events"].items())))
+    for hitch in report["worst"]:
+        sections = ", ".join(f"{name} {spent:.1f}" for name, spent in hitch["sections"].items())
+        print(f"\n#{hitch['frame']} @ {hitch['t_ms'] / 1000:.1f} s: {hitch['ms']:.1f} ms ({sections})")
+        print("  " + ", ".join(f"{k} {v}" for k, v in hitch["counts"].items()))
+        for kind, data in hitch["events"]:
+            print(f"  {kind} {data}")
+
+
+if __name__ == "__main__":
+    main()
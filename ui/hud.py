@@ -0,0 +1,141 @@
+import time
+
+import pygame
+
+from classes.assets import assets
+from settings import WIDTH, WHITE, RED, FONT_PATH
+
+
+class HudWidget:
+    """
+    Element HUD-u w trybie zachowanym: trzyma gotową powierzchnię
+    i renderuje ją od nowa tylko wtedy, gdy zmieni się wartość,
+    którą zwraca value() (np. score albo szerokość paska życia).
+    Podklasy definiują:
+    - value() — bieżąca wartość do porównania (None = nic nie rysuj),
+    - render(value) — zwraca (surface, pozycja) dla podanej wartości.
+    """
+
+    def __init__(self, hud):
+        self.hud = hud
+        self.current = None
+        self.surface = None
+        self.pos = (0, 0)
+
+    def draw(self, surf):
+        value = self.value()
+        if value is None:
+            return
+        if value != self.current or self.surface is None:
+            self.current = value
+            self.surface, self.pos = self.render(value)
+            self.hud.renders += 1
+        surf.blit(self.surface, self.pos)
+
+
+class ScoreWidget(HudWidget):
+    """
+    Tabliczka ze scorem w lewym górnym rogu.
+    """
+
+    def __init__(self, hud, frame):
+        super().__init__(hud)
+        self.frame = frame
+        self.font = assets.font(FONT_PATH, 16)
+
+    def value(self):
+        return self.hud.game.score
+
+    def render(self, score):
+        # Rysowanie, pozycja i skalowanie tabliczki ze scorem
+        text = self.font.render(f"Score: {score}", True, WHITE)
+        w, h = text.get_size()
+
+        orig_w, orig_h = self.frame.get_size()
+        padding = 20
+        frame_w = max(orig_w, w + 2 * padding)
+        frame_h = orig_h * 2
+        surf = pygame.transform.scale(self.frame, (frame_w, frame_h))
+        surf.blit(text, (padding, (frame_h - h) // 2))
+        return surf, (10, 10)
+
+
+class BossBarWidget(HudWidget):
+    """
+    Czerwony pasek życia bossa na górze ekranu z ikoną czaszki na środku.
+    Wartością jest szerokość wypełnienia w pikselach, więc pasek jest
+    renderowany tylko wtedy, gdy obrażenia zmienią go na ekranie.
+    """
+
+    def __init__(self, hud, skull):
+        super().__init__(hud)
+        # Wymiary i pozycja healthbara bossa
+        self.bar_w = int(WIDTH * 0.6)
+        self.bar_h = 28
+        self.bar_x = (WIDTH - self.bar_w) // 2
+        self.bar_y = 40
+        # Ikonka czaszki na healthbarze, skalowana raz
+        skull_h = self.bar_h * 3
+        self.skull = pygame.transform.scale(skull, (skull_h, skull_h))
+
+    def value(self):
+        game = self.hud.game
+        if not game.boss_room:
+            return None
+        boss = game.boss
+        if boss is None or not boss.alive():
+            return None
+        return int(self.bar_w * (boss.health / boss.max_health))
+
+    def render(self, fill_w):
+        skull_w, skull_h = self.skull.get_size()
+        skull_dy = skull_h // 4
+        # Powierzchnia obejmuje pasek i wystającą nad niego czaszkę
+        top = self.bar_y - skull_dy
+        height = max(self.bar_h + skull_dy, skull_h)
+        surf = pygame.Surface((self.bar_w, height), pygame.SRCALPHA)
+
+        bar_top = skull_dy
+        pygame.draw.rect(surf, RED, (0, bar_top, max(0, fill_w), self.bar_h))
+        pygame.draw.rect(surf, WHITE, (0, bar_top, self.bar_w, self.bar_h), 2)
+        surf.blit(self.skull, ((self.bar_w - skull_w) // 2, 0))
+        return surf, (self.bar_x, top)
+
+
+class Hud:
+    """
+    HUD w trybie zachowanym: zestaw widżetów, z których każdy
+    przerysowuje swoją powierzchnię tylko po zmianie wartości.
+    renders_per_sec podaje liczbę przerysowań widżetów w ostatniej
+    pełnej sekundzie (do profilowania).
+    """
+
+    def __init__(self, game, score_frame, skull):
+        self.game = game
+        self.widgets = [
+            BossBarWidget(self, skull),
+            ScoreWidget(self, score_frame),
+        ]
+        self.renders = 0
+        self.renders_per_sec = 0
+        self._window_start = time.perf_counter()
+        self._window_renders = 0
+
+    def draw(self, surf):
+        for widget in self.widgets:
+            widget.draw(surf)
+
+        now = time.perf_counter()
+        if now - self._window_start >= 1.0:
+            self.renders_per_sec = self.renders - self._window_renders
+            self._window_renders = self.renders
+            self._window_start = now
+
+    def stats(self):
+        """
+        Zwraca łączną liczbę przerysowań widżetów i liczbę z ostatniej sekundy.
+        """
+        return {
+            "renders": self.renders,
+            "renders_per_sec": self.renders_per_sec,
+        }
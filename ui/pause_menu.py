@@ -2,7 +2,6 @@ import sys
 
 import pygame
 
-from settings import WIDTH, HEIGHT
 from ui.spritesheet import SpriteSheet
 
 
@@ -10,6 +9,7 @@ class PauseMenu:
     """
     Menu pauzy z trzema przyciskami: Play, Settings, Exit.
     Obsługuje rysowanie oraz kliknięcia myszy i klawisz ESC.
+    Układ i przeskalowane grafiki liczone są raz na rozdzielczość.
     """
 
     def __init__(self, game):
@@ -22,6 +22,54 @@ class PauseMenu:
             (5, 202, 52, 14),  # EXIT
         ]
         self.buttons = ui.images_at(btn_rects)
+        self.layout = None
+
+    def _layout(self, size):
+        """
+        Liczy raz na rozdzielczość pozycję ramki, hitboxy przycisków
+        i gotową powierzchnię całego menu.
+        """
+        if self.layout is not None and self.layout["size"] == size:
+            return self.layout
+
+        width, height = size
+        fw, fh = self.frame.get_size()
+        fw2 = width // 3
+        scale = fw2 / fw
+        fh2 = int(fh * scale)
+        fx = (width - fw2) // 2
+        fy = (height - fh2) // 2
+
+        bw, bh = self.buttons[0].get_size()
+        bw2 = int(bw * scale)
+        bh2 = int(bh * scale)
+        top = int(0.15 * fh2)
+        spacing = int(0.10 * fh2)
+
+        # Ramka z przyciskami złożona w jedną powierzchnię
+        surface = pygame.transform.scale(self.frame, (fw2, fh2))
+        hitboxes = []
+        for i, btn in enumerate(self.buttons):
+            bx = (fw2 - bw2) // 2
+            by = top + i * (bh2 + spacing)
+            surface.blit(pygame.transform.scale(btn, (bw2, bh2)), (bx, by))
+            hitboxes.append(pygame.Rect(fx + bx, fy + by, bw2, bh2))
+
+        self.layout = {
+            "size": size,
+            "surface": surface,
+            "pos": (fx, fy),
+            "hitboxes": hitboxes,
+        }
+        return self.layout
+
+    def bounds(self, size):
+        """
+        Zwraca prostokąt ekranu zajmowany przez menu (do aktualizacji
+        tylko zmienionych fragmentów ekranu).
+        """
+        layout = self._layout(size)
+        return pygame.Rect(layout["pos"], layout["surface"].get_size())
 
     def handle_event(self, event):
         """
@@ -31,55 +79,23 @@ class PauseMenu:
                                 Exit → zamknięcie aplikacji.
         """
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-            self.game.paused = False
+            self.game.resume()
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            mx, my = event.pos
-            fw, fh = self.frame.get_size()
-            fw2 = WIDTH // 3
-            scale = fw2 / fw
-            fh2 = int(fh * scale)
-            fx = (WIDTH - fw2) // 2
-            fy = (HEIGHT - fh2) // 2
-
-            bw, bh = self.buttons[0].get_size()
-            bw2 = int(bw * scale)
-            bh2 = int(bh * scale)
-            top = int(0.15 * fh2)
-            spacing = int(0.10 * fh2)
-
-            for i, btn in enumerate(self.buttons):
-                bx = fx + (fw2 - bw2) // 2
-                by = fy + top + i * (bh2 + spacing)
-                if pygame.Rect(bx, by, bw2, bh2).collidepoint(mx, my):
+            layout = self._layout(self.game.screen.get_size())
+            for i, rect in enumerate(layout["hitboxes"]):
+                if rect.collidepoint(event.pos):
                     if i == 0:
-                        self.game.paused = False
+                        self.game.resume()
                     elif i == 1:
-                        self.game.in_settings = True
+                        self.game.open_settings()
                     elif i == 2:
                         pygame.quit()
                         sys.exit()
 
     def draw(self, surf):
         """
-        Rysuje tło pauzy z przyciskami w centralnej części ekranu.
+        Rysuje tło pauzy z przyciskami w centralnej części ekranu
+        (jeden blit gotowej powierzchni menu).
         """
-        fw, fh = self.frame.get_size()
-        fw2 = WIDTH // 3
-        scale = fw2 / fw
-        fh2 = int(fh * scale)
-        frame_s = pygame.transform.scale(self.frame, (fw2, fh2))
-        fx = (WIDTH - fw2) // 2
-        fy = (HEIGHT - fh2) // 2
-        surf.blit(frame_s, (fx, fy))
-
-        bw, bh = self.buttons[0].get_size()
-        bw2 = int(bw * scale)
-        bh2 = int(bh * scale)
-        top = int(0.15 * fh2)
-        spacing = int(0.10 * fh2)
-
-        for i, btn in enumerate(self.buttons):
-            btn_s = pygame.transform.scale(btn, (bw2, bh2))
-            bx = fx + (fw2 - bw2) // 2
-            by = fy + top + i * (bh2 + spacing)
-            surf.blit(btn_s, (bx, by))
\ No newline at end of file
+        layout = self._layout(surf.get_size())
+        surf.blit(layout["surface"], layout["pos"])
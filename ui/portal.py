@@ -1,5 +1,8 @@
 import pygame
 
+from classes.assets import assets
+from classes.zoom_cache import zoomed
+
 class Portal(pygame.sprite.Sprite):
     """
     Animowany portal ładowany z portal.png (7 klatek 64×64: 4 w pierwszym rzędzie, 3 w drugim).
@@ -9,8 +12,7 @@ class Portal(pygame.sprite.Sprite):
 
     def __init__(self, x, y, scale: float = 1.0, anim_speed: int = 100):
         super().__init__()
-        sheet = pygame.image.load("assets/images/portal.png").convert_alpha()
-
+        path = "assets/images/portal.png"
         orig_w, orig_h = 64, 64
         self.scale = scale
         w = int(orig_w * self.scale)
@@ -20,20 +22,20 @@ class Portal(pygame.sprite.Sprite):
         for i in range(7):
             row = 0 if i < 4 else 1
             col = i if i < 4 else i - 4
-            r = pygame.Rect(col * orig_w, row * orig_h, orig_w, orig_h)
-            frame = sheet.subsurface(r)
-            if self.scale != 1.0:
-                frame = pygame.transform.scale(frame, (w, h))
-            self.frames.append(frame)
+            r = (col * orig_w, row * orig_h, orig_w, orig_h)
+            size = (w, h) if self.scale != 1.0 else None
+            self.frames.append(assets.region(path, r, size))
 
         self.index = 0
         self.anim_speed = anim_speed
-        self.last_upd = pygame.time.get_ticks()
+        self.last_upd = 0
         self.image = self.frames[0]
         self.rect = self.image.get_rect(center=(x, y))
 
-    def update(self):
-        now = pygame.time.get_ticks()
+    def update(self, now):
+        """
+        Przełącza klatkę animacji; now — czas symulacji gry w ms.
+        """
         if now - self.last_upd > self.anim_speed:
             self.last_upd = now
             self.index = (self.index + 1) % len(self.frames)
@@ -41,10 +43,11 @@ class Portal(pygame.sprite.Sprite):
             c = self.rect.center
             self.rect = self.image.get_rect(center=c)
 
-    def draw(self, surf, cam_off):
+    def draw(self, surf, cam_off, zoom=1.0):
         """
-        Rysuje portal na powierzchni surf, uwzględniając przesunięcie kamery.
+        Rysuje portal na powierzchni surf, uwzględniając przesunięcie kamery
+        (w pikselach ekranu) i zoom.
         """
-        x = self.rect.x - cam_off[0]
-        y = self.rect.y - cam_off[1]
-        surf.blit(self.image, (x, y))
+        x = round(self.rect.x * zoom) - cam_off[0]
+        y = round(self.rect.y * zoom) - cam_off[1]
+        surf.blit(zoomed.scale(self.image), (x, y))
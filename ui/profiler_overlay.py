@@ -0,0 +1,77 @@
+import pygame
+
+from classes.assets import assets
+from classes.profiler import profiler
+from settings import FPS, FONT_PATH, PROFILER_TOP, PROFILER_REFRESH, WHITE, RED, GREEN, YELLOW
+
+
+class ProfilerOverlay:
+    """
+    Nakładka profilera (F3) w prawym górnym rogu: wykres czasów
+    ostatnich klatek z linią budżetu 1000/FPS ms, najdroższe sekcje
+    (średnia i maksimum z bufora) oraz liczby obiektów w grupach
+    i rozmiar cache chunków oraz liczby wrogów w poziomach LOD i szacowany
+    czas zaoszczędzony przez rzadsze aktualizacje. Tekst jest renderowany ponownie
+    co PROFILER_REFRESH ms, a wykres co klatkę.
+    """
+
+    GRAPH_H = 80
+    PADDING = 8
+
+    def __init__(self, game):
+        self.game = game
+        self.font = assets.font(FONT_PATH, 10)
+        self.line_h = self.font.get_linesize() + 2
+        self.text = None
+        self.last_refresh = -PROFILER_REFRESH
+        self.graph_w = profiler.size
+        self.budget_ms = 1000 / FPS
+
+    def _render_text(self):
+        stats = profiler.stats()
+        lines = [(f"frame {stats['frame_mean']:.2f} ms  max {stats['frame_max']:.2f} ms", YELLOW)]
+        for name, mean, peak in profiler.top(PROFILER_TOP):
+            lines.append((f"{name:<16}{mean:7.2f}{peak:8.2f}", WHITE))
+        lines.append(("", WHITE))
+        for name, value in self.game.entity_counts().items():
+            lines.append((f"{name:<20}{value:>8}", WHITE))
+        lod = self.game.enemy_population.stats()
+        tiers = "/".join(str(n) for n in lod["tiers"])
+        lines.append((f"{'enemy_lod':<12}{tiers:>16}", WHITE))
+        lines.append((f"{'lod_saved_ms':<20}{lod['saved_ms']:>8}", WHITE))
+
+        width = self.graph_w
+        for text, _ in lines:
+            width = max(width, self.font.size(text)[0])
+        surf = pygame.Surface((width, len(lines) * self.line_h), pygame.SRCALPHA)
+        for i, (text, color) in enumerate(lines):
+            if text:
+                surf.blit(self.font.render(text, True, color), (0, i * self.line_h))
+        return surf
+
+    def draw(self, surf):
+        now = pygame.time.get_ticks()
+        if self.text is None or now - self.last_refresh >= PROFILER_REFRESH:
+            self.text = self._render_text()
+            self.last_refresh = now
+
+        pad = self.PADDING
+        w = max(self.graph_w, self.text.get_width()) + 2 * pad
+        h = self.GRAPH_H + self.text.get_height() + 3 * pad
+        x = surf.get_width() - w - 10
+        y = 10
+        panel = pygame.Rect(x, y, w, h)
+        surf.fill((0, 0, 0), panel)
+        pygame.draw.rect(surf, WHITE, panel, 1)
+
+        # Wykres: jedna kolumna na klatkę, skala 2× budżet klatki
+        gx, gy = x + pad, y + pad
+        scale = self.GRAPH_H / (2 * self.budget_ms)
+        for i, ms in enumerate(profiler.history().tolist()):
+            bar = min(self.GRAPH_H, int(ms * scale))
+            color = GREEN if ms <= self.budget_ms else RED
+            pygame.draw.line(surf, color, (gx + i, gy + self.GRAPH_H), (gx + i, gy + self.GRAPH_H - bar))
+        budget_y = gy + self.GRAPH_H - int(self.budget_ms * scale)
+        pygame.draw.line(surf, YELLOW, (gx, budget_y), (gx + self.graph_w, budget_y))
+
+        surf.blit(self.text, (gx, gy + self.GRAPH_H + pad))
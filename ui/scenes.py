@@ -0,0 +1,201 @@
+import pygame
+
+from classes.assets import assets
+from classes.profiler import profiler
+from settings import WIDTH, HEIGHT, FONT_PATH, IDLE_WAKE_MS, BLACK, WHITE, RED, YELLOW
+
+
+class Scene:
+    """
+    Stan gry na stosie scen Game. Główna pętla Game.run co klatkę
+    przekazuje eventy, czas klatki i rysowanie scenie z wierzchu stosu.
+    idle=True oznacza scenę statyczną, przy której pętla zwalnia
+    do IDLE_FPS, gdy przez IDLE_WAKE_MS nie było wejścia od gracza
+    (patrz quiet).
+    """
+
+    idle = False
+
+    def __init__(self, game):
+        self.game = game
+        self.awake_until = 0
+
+    def wake(self):
+        """
+        Po wejściu od gracza (lub wejściu sceny na stos) scena przez
+        IDLE_WAKE_MS działa w pełnym tempie FPS.
+        """
+        self.awake_until = pygame.time.get_ticks() + IDLE_WAKE_MS
+
+    @property
+    def quiet(self):
+        """
+        True, gdy scena jest statyczna i od ostatniego wejścia minęło
+        IDLE_WAKE_MS — wtedy pętla czeka na eventy w tempie IDLE_FPS.
+        """
+        return self.idle and pygame.time.get_ticks() >= self.awake_until
+
+    def enter(self):
+        """
+        Wywoływane, gdy scena trafia na wierzch stosu.
+        """
+
+    def handle_event(self, event):
+        pass
+
+    def update(self, frame_ms):
+        pass
+
+    def draw(self):
+        pass
+
+
+class GameplayScene(Scene):
+    """
+    Rozgrywka: eventy gracza, stałe ticki symulacji i rysowanie sceny z HUD-em.
+    """
+
+    def handle_event(self, event):
+        self.game._handle_game_event(event)
+
+    def update(self, frame_ms):
+        self.game.advance(frame_ms)
+
+    def draw(self):
+        game = self.game
+        game.backdrop = None
+        game._draw_scene()
+        game.draw_ui()
+        with profiler.section("flip"):
+            pygame.display.flip()
+
+
+class MenuScene(Scene):
+    """
+    Menu pauzy lub ustawień nad zamrożoną klatką gry.
+    Przerysowuje się tylko po wejściu od gracza.
+    """
+
+    idle = True
+
+    def __init__(self, game, menu):
+        super().__init__(game)
+        self.menu = menu
+
+    def enter(self):
+        self.game.menu_dirty = True
+
+    def handle_event(self, event):
+        # Każde wejście w menu może zmienić to, co trzeba narysować
+        self.game.menu_dirty = True
+        self.menu.handle_event(event)
+
+    def update(self, frame_ms):
+        # Czas spędzony w menu nie trafia do symulacji
+        self.game.accumulator = 0.0
+        self.game.alpha = 1.0
+
+    def draw(self):
+        self.game._draw_menu(self.menu)
+
+
+class EndScreen:
+    """
+    Ekran końca gry (przegrana lub zwycięstwo) renderowany raz na proces:
+    ikona, tytuł i podpowiedź restartu są gotowe, a przy pokazaniu
+    dopisywany jest tylko aktualny score.
+    """
+
+    def __init__(self, title, bg_color, text_color, title_color, icon):
+        w, h = WIDTH, HEIGHT
+        # Skalowanie czcionki z zależności od wielkości okna
+        font_title = assets.font(FONT_PATH, max(24, int(h * 0.12)))
+        self.font_score = assets.font(FONT_PATH, max(18, int(h * 0.08)))
+        font_restart = assets.font(FONT_PATH, max(16, int(h * 0.06)))
+        self.text_color = text_color
+
+        title_surf = font_title.render(title, True, title_color)
+        restart_surf = font_restart.render("Press R to restart", True, text_color)
+
+        self.background = pygame.Surface((w, h)).convert()
+        self.background.fill(bg_color)
+        self.center_x = w // 2
+        gap = int(h * 0.03)
+        y = int(h * 0.1)
+        if icon is not None:
+            self.background.blit(icon, (self.center_x - icon.get_width() // 2, y))
+            y += icon.get_height() + gap
+
+        self.background.blit(title_surf, (self.center_x - title_surf.get_width() // 2, y))
+        y += title_surf.get_height() + gap
+        self.score_y = y
+        y += self.font_score.get_height() + gap
+        self.background.blit(restart_surf, (self.center_x - restart_surf.get_width() // 2, y))
+
+    def render(self, score):
+        """
+        Zwraca gotowy ekran z dopisanym score.
+        """
+        surf = self.background.copy()
+        score_surf = self.font_score.render(f"Score: {score}", True, self.text_color)
+        surf.blit(score_surf, (self.center_x - score_surf.get_width() // 2, self.score_y))
+        return surf
+
+
+class EndScene(Scene):
+    """
+    Ekran przegranej lub zwycięstwa; R rozpoczyna nową grę.
+    Obraz jest gotowy przy wejściu, a bez wejścia od gracza pętla
+    czeka w tempie IDLE_FPS.
+    """
+
+    idle = True
+
+    def __init__(self, game, image):
+        super().__init__(game)
+        self.image = image
+        self.shown = False
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_r:
+            self.game.restart()
+        elif event.type == pygame.VIDEOEXPOSE:
+            self.shown = False
+
+    def update(self, frame_ms):
+        self.game.accumulator = 0.0
+        self.game.alpha = 1.0
+
+    def draw(self):
+        if self.shown:
+            return
+        self.game.screen.blit(self.image, (0, 0))
+        pygame.display.flip()
+        self.shown = True
+
+
+def game_over_screen(skull):
+    """
+    Ekran Game Over: czaszka, czerwony napis i score na czarnym tle.
+    """
+    orig_sw, orig_sh = skull.get_size()
+    skull_w = int(WIDTH * 0.15)
+    skull_h = int(skull_w * orig_sh / orig_sw)
+    icon = pygame.transform.scale(skull, (skull_w, skull_h))
+    return EndScreen("GAME OVER", BLACK, WHITE, RED, icon)
+
+
+def victory_screen():
+    """
+    Ekran zwycięstwa: korona i czarne napisy na żółtym tle.
+    """
+    # Skalowanie i dynamiczna pozycja ikonki korony
+    try:
+        crown = assets.image("assets/images/crown.png")
+        cw = int(WIDTH * 0.15)
+        ch = int(cw * crown.get_height() / crown.get_width())
+        crown = assets.image("assets/images/crown.png", (cw, ch))
+    except Exception as e:
+        print(f"Nie udało się załadować korony: {e}")
+        crown = None
+    return EndScreen("YOU WIN!", YELLOW, BLACK, BLACK, crown)
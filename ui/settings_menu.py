@@ -1,6 +1,7 @@
 import pygame
 
-from settings import WIDTH, HEIGHT, WHITE, YELLOW
+from classes.assets import assets
+from settings import WHITE, YELLOW, FONT_PATH
 from ui.spritesheet import SpriteSheet
 
 
@@ -11,6 +12,7 @@ class SettingsMenu:
     - poziom głośności efektów (SFX),
     - poziom przybliżenia (zoom).
     Obsługuje rysowanie oraz nawigację klawiaturą.
+    Układ liczony jest raz na rozdzielczość, a napisy raz na wartość.
     """
 
     def __init__(self, game):
@@ -18,6 +20,18 @@ class SettingsMenu:
         ui = SpriteSheet("assets/images/ui.png")
         self.frame = ui.image_at((128, 131, 63, 75))
         self.button = ui.image_at((5, 234, 52, 14))
+        self.layout = None
+        self.labels = {}
+        self.state = None
+        self.surface = None
+
+    def bounds(self, size):
+        """
+        Zwraca prostokąt ekranu zajmowany przez menu (do aktualizacji
+        tylko zmienionych fragmentów ekranu).
+        """
+        layout = self._layout(size)
+        return pygame.Rect(layout["pos"], layout["background"].get_size())
 
     def handle_event(self, event):
         """
@@ -27,7 +41,7 @@ class SettingsMenu:
         """
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
-                self.game.in_settings = False
+                self.game.close_settings()
             elif event.key == pygame.K_UP:
                 self.game.settings_index = (self.game.settings_index - 1) % len(self.game.settings_items)
             elif event.key == pygame.K_DOWN:
@@ -48,24 +62,26 @@ class SettingsMenu:
                     )
 
                 elif idx == 2:  # Zoom
-                    self.game.zoom = round(
+                    self.game.set_zoom(round(
                         min(2.5, max(1, self.game.zoom + 0.1 * delta)), 1
-                    )
+                    ))
 
-    def draw(self, surf):
+    def _layout(self, size):
         """
-        Rysuje ramkę z przyciskami i etykietami ustawień,
-        skalowane proporcjonalnie do ekranu.
+        Liczy raz na rozdzielczość pozycje ramki i przycisków,
+        przeskalowane grafiki, czcionkę etykiet i napisy w stopce.
         """
+        if self.layout is not None and self.layout["size"] == size:
+            return self.layout
+
+        width, height = size
         # Oblicz skalę i pozycję ramki
         fw, fh = self.frame.get_size()
-        fw2 = WIDTH // 3
+        fw2 = width // 3
         scale = fw2 / fw
         fh2 = int(fh * scale)
-        frame_s = pygame.transform.scale(self.frame, (fw2, fh2))
-        fx = (WIDTH - fw2) // 2
-        fy = (HEIGHT - fh2) // 2
-        surf.blit(frame_s, (fx, fy))
+        fx = (width - fw2) // 2
+        fy = (height - fh2) // 2
 
         # Przygotuj pojedynczy przycisk
         bw, bh = self.button.get_size()
@@ -75,17 +91,61 @@ class SettingsMenu:
 
         top = int(0.15 * fh2)
         spacing = int(0.10 * fh2)
+        buttons = [
+            pygame.Rect((fw2 - bw2) // 2, top + i * (bh2 + spacing), bw2, bh2)
+            for i in range(len(self.game.settings_items))
+        ]
+
+        # Tło menu: ramka z przyciskami i instrukcjami do nawigacji
+        background = pygame.transform.scale(self.frame, (fw2, fh2))
+        for rect in buttons:
+            background.blit(btn_s, rect)
+        footer = assets.font(FONT_PATH, 15)
+        navi = footer.render("Navigate: ↑ ↓ | Adjust: ← →", True, WHITE)
+        background.blit(navi, ((fw2 - navi.get_width()) // 2, fh2 - 57))
+        back = footer.render("Back: Esc", True, WHITE)
+        background.blit(back, ((fw2 - back.get_width()) // 2, fh2 - 35))
+
+        self.layout = {
+            "size": size,
+            "background": background,
+            "pos": (fx, fy),
+            "buttons": buttons,
+            "font": assets.font(FONT_PATH, max(8, int(bh2 * self.game.btn_text_scale))),
+        }
+        self.labels.clear()
+        self.state = None
+        return self.layout
+
+    def _label(self, text, color):
+        # Napis renderowany raz na (treść, kolor)
+        key = (text, color)
+        surf = self.labels.get(key)
+        if surf is None:
+            surf = self.layout["font"].render(text, True, color)
+            self.labels[key] = surf
+        return surf
 
-        # Rysuj każdy przycisk i odpowiadający mu tekst
-        for i, key in enumerate(self.game.settings_items):
-            bx = fx + (fw2 - bw2) // 2
-            by = fy + top + i * (bh2 + spacing)
-            surf.blit(btn_s, (bx, by))
-
-            # Dobierz tekst i czcionkę
-            fs = max(8, int(bh2 * self.game.btn_text_scale))
-            font = pygame.font.Font("assets/fonts/PressStart2P.ttf", fs)
-
+    def draw(self, surf):
+        """
+        Rysuje ramkę z przyciskami i etykietami ustawień,
+        skalowane proporcjonalnie do ekranu.
+        Całe menu jest składane ponownie tylko po zmianie ustawień
+        lub wybranej pozycji; w pozostałych klatkach to jeden blit.
+        """
+        layout = self._layout(surf.get_size())
+        game = self.game
+        state = (game.settings_index, game.music_volume, game.sfx_volume, game.zoom)
+        if state != self.state:
+            self.state = state
+            self.surface = self._compose(layout)
+        surf.blit(self.surface, layout["pos"])
+
+    def _compose(self, layout):
+        menu = layout["background"].copy()
+
+        # Rysuj tekst każdego przycisku
+        for i, (key, rect) in enumerate(zip(self.game.settings_items, layout["buttons"])):
             if key == "Music Volume":
                 label = f"{int(self.game.music_volume * 100)}%"
             elif key == "SFX Volume":
@@ -96,20 +156,15 @@ class SettingsMenu:
             color = YELLOW if i == self.game.settings_index else WHITE
 
             # Render nazwy i wartości
-            name_s = font.render(key.split()[0], True, color)
-            val_s = font.render(label, True, color)
+            name_s = self._label(key.split()[0], color)
+            val_s = self._label(label, color)
 
             # Wyśrodkuj tekst w przycisku
-            tx = bx + (bw2 - name_s.get_width()) // 2
-            ty = by + (bh2 // 2 - name_s.get_height())
-            surf.blit(name_s, (tx, ty))
-
-            vx = bx + (bw2 - val_s.get_width()) // 2
-            vy = by + (bh2 // 2)
-            surf.blit(val_s, (vx, vy))
-
-        # Wyświetl instrukcje do nawigacji
-        navi = pygame.font.Font("assets/fonts/PressStart2P.ttf", 15).render("Navigate: ↑ ↓ | Adjust: ← →", True, WHITE)
-        surf.blit(navi, (fx + (fw2 - navi.get_width()) // 2, fy + fh2 - 57))
-        back = pygame.font.Font("assets/fonts/PressStart2P.ttf", 15).render("Back: Esc", True, WHITE)
-        surf.blit(back, (fx + (fw2 - back.get_width()) // 2, fy + fh2 - 35))
+            tx = rect.x + (rect.width - name_s.get_width()) // 2
+            ty = rect.y + (rect.height // 2 - name_s.get_height())
+            menu.blit(name_s, (tx, ty))
+
+            vx = rect.x + (rect.width - val_s.get_width()) // 2
+            vy = rect.y + (rect.height // 2)
+            menu.blit(val_s, (vx, vy))
+        return menu
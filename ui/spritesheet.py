@@ -1,4 +1,4 @@
-import pygame
+from classes.assets import assets
 
 
 class SpriteSheet:
@@ -6,20 +6,18 @@ class SpriteSheet:
 
     def __init__(self, filename):
         """
-        Ładuje arkusz sprite'ów z podanego pliku.
+        Pobiera arkusz sprite'ów z rejestru grafik.
         filename: ścieżka do pliku PNG z arkuszem.
         """
-        self.sheet = pygame.image.load(filename).convert_alpha()
+        self.filename = filename
+        self.sheet = assets.image(filename)
 
     def image_at(self, rect):
         """
         Zwraca Surface wycięty z arkusza:
         rect: tuple (x, y, width, height) określający prostokąt do wycięcia.
         """
-        x, y, w, h = rect
-        surface = pygame.Surface((w, h), pygame.SRCALPHA)
-        surface.blit(self.sheet, (0, 0), rect)
-        return surface
+        return assets.region(self.filename, rect)
 
     def images_at(self, rects):
         """